@@ -2,7 +2,8 @@
 
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional
 
 from data.data_manager import DataManager
 from data.models import Level, LevelProgress, LevelReward, PowerUp, PowerUpType, Theme
@@ -65,6 +66,8 @@ DKC_LEVELS = [
 ]
 
 THEME_LEVELS = {Theme.MARIO: MARIO_LEVELS, Theme.ZELDA: ZELDA_LEVELS, Theme.DKC: DKC_LEVELS}
+THEME_LEVEL_COUNTS = {theme: len(levels) for theme, levels in THEME_LEVELS.items()}
+TOTAL_LEVELS = sum(THEME_LEVEL_COUNTS.values())
 BASE_LEVEL_REWARD = 50
 ACCURACY_BONUS_THRESHOLDS = [(1.0, 100), (0.98, 75), (0.95, 50), (0.90, 25)]
 
@@ -82,28 +85,57 @@ class LevelSystem:
     
     Attributes:
         data_manager: DataManager for persisting level state
-        _levels: Dictionary of levels by theme
+        _levels: Dictionary of levels by theme (built lazily)
+        _levels_by_id: Index of the same Level objects keyed by level ID
+            (built lazily)
     """
     
     def __init__(self, data_manager: DataManager):
         """Initialize the LevelSystem.
         
+        Level state is not read from the database until it is first needed.
+        
         Args:
             data_manager: DataManager for persisting level state
         """
         self.data_manager = data_manager
-        self._levels: Dict[Theme, List[Level]] = {}
-        self._initialize_levels()
-        self._load_levels_from_db()
     
-    def _initialize_levels(self) -> None:
-        """Initialize level definitions for all themes."""
+    def reload(self) -> None:
+        """Discard in-memory level state so it is reloaded from the database.
+        
+        Use this after the underlying database has been replaced or rolled
+        back behind the LevelSystem's back.
+        """
+        self.__dict__.pop("_levels_by_id", None)
+        self.__dict__.pop("_levels", None)
+    
+    @cached_property
+    def _levels_by_id(self) -> Dict[str, Level]:
+        """All levels keyed by ID, merged with saved state on first access."""
+        levels_by_id = {level.id: level for level in self._initialize_levels()}
+        self._load_levels_from_db(levels_by_id)
+        return levels_by_id
+    
+    @cached_property
+    def _levels(self) -> Dict[Theme, List[Level]]:
+        """The same Level objects as _levels_by_id, grouped by theme."""
+        levels: Dict[Theme, List[Level]] = {theme: [] for theme in Theme}
+        for level in self._levels_by_id.values():
+            levels[level.theme].append(level)
+        return levels
+    
+    def _initialize_levels(self) -> List[Level]:
+        """Build the default level definitions for all themes.
+        
+        Returns:
+            Levels ordered by theme, then level number
+        """
+        levels = []
         for theme in Theme:
             theme_level_defs = THEME_LEVELS.get(theme, [])
-            self._levels[theme] = []
             
             for i, level_def in enumerate(theme_level_defs):
-                level = Level(
+                levels.append(Level(
                     id=f"{theme.value}_level_{i + 1}",
                     theme=theme,
                     level_number=i + 1,
@@ -114,24 +146,24 @@ class LevelSystem:
                     best_accuracy=None,
                     completion_date=None,
                     rewards_claimed=False
-                )
-                self._levels[theme].append(level)
+                ))
+        return levels
     
-    def _load_levels_from_db(self) -> None:
-        """Load level state from database."""
-        game_state = self.data_manager.load_state()
+    def _load_levels_from_db(self, levels_by_id: Dict[str, Level]) -> None:
+        """Load level state from database.
         
-        for saved_level in game_state.levels:
+        Args:
+            levels_by_id: Default levels to update in place with saved state
+        """
+        for saved_level in self.data_manager.load_levels():
             # Find and update the corresponding level
-            if saved_level.theme in self._levels:
-                for level in self._levels[saved_level.theme]:
-                    if level.id == saved_level.id:
-                        level.unlocked = saved_level.unlocked
-                        level.completed = saved_level.completed
-                        level.best_accuracy = saved_level.best_accuracy
-                        level.completion_date = saved_level.completion_date
-                        level.rewards_claimed = saved_level.rewards_claimed
-                        break
+            level = levels_by_id.get(saved_level.id)
+            if level is not None:
+                level.unlocked = saved_level.unlocked
+                level.completed = saved_level.completed
+                level.best_accuracy = saved_level.best_accuracy
+                level.completion_date = saved_level.completion_date
+                level.rewards_claimed = saved_level.rewards_claimed
     
     def unlock_level(self, theme: Theme) -> Optional[Level]:
         """Unlock the next level for a theme.
@@ -286,26 +318,7 @@ class LevelSystem:
             
         Requirements: 15.7
         """
-        total_levels = sum(len(levels) for levels in self._levels.values())
-        levels_unlocked = sum(
-            1 for levels in self._levels.values() 
-            for level in levels if level.unlocked
-        )
-        levels_completed = sum(
-            1 for levels in self._levels.values() 
-            for level in levels if level.completed
-        )
-        
-        completion_percentage = (
-            (levels_completed / total_levels) * 100.0 if total_levels > 0 else 0.0
-        )
-        
-        return LevelProgress(
-            total_levels=total_levels,
-            levels_unlocked=levels_unlocked,
-            levels_completed=levels_completed,
-            completion_percentage=completion_percentage
-        )
+        return self._summarize_levels(self._levels_by_id.values(), TOTAL_LEVELS)
     
     def get_theme_level_progress(self, theme: Theme) -> LevelProgress:
         """Get level progress stats for a specific theme.
@@ -324,10 +337,24 @@ class LevelSystem:
                 completion_percentage=0.0
             )
         
-        theme_levels = self._levels[theme]
-        total_levels = len(theme_levels)
-        levels_unlocked = sum(1 for level in theme_levels if level.unlocked)
-        levels_completed = sum(1 for level in theme_levels if level.completed)
+        return self._summarize_levels(self._levels[theme], THEME_LEVEL_COUNTS[theme])
+    
+    @staticmethod
+    def _summarize_levels(levels: Iterable[Level], total_levels: int) -> LevelProgress:
+        """Count unlocked and completed levels in a single pass.
+        
+        Args:
+            levels: Levels to summarize
+            total_levels: Number of levels the summary covers
+            
+        Returns:
+            LevelProgress for the given levels
+        """
+        levels_unlocked = 0
+        levels_completed = 0
+        for level in levels:
+            levels_unlocked += level.unlocked
+            levels_completed += level.completed
         
         completion_percentage = (
             (levels_completed / total_levels) * 100.0 if total_levels > 0 else 0.0
@@ -349,26 +376,15 @@ class LevelSystem:
         Returns:
             Level if found, None otherwise
         """
-        for levels in self._levels.values():
-            for level in levels:
-                if level.id == level_id:
-                    return level
-        return None
+        return self._levels_by_id.get(level_id)
     
     def _save_levels_to_db(self) -> None:
         """Save all levels to the database.
         
         Requirements: 15.6
         """
-        game_state = self.data_manager.load_state()
-        
-        # Flatten all levels into a single list
-        all_levels = []
-        for levels in self._levels.values():
-            all_levels.extend(levels)
-        
-        game_state.levels = all_levels
-        self.data_manager.save_state(game_state)
+        # The ID index already holds every level in theme/level order
+        self.data_manager.save_levels(list(self._levels_by_id.values()))
     
     def get_all_levels(self, theme: Optional[Theme] = None) -> List[Level]:
         """Get all levels, optionally filtered by theme.
@@ -382,10 +398,7 @@ class LevelSystem:
         if theme is not None:
             return list(self._levels.get(theme, []))
         
-        all_levels = []
-        for levels in self._levels.values():
-            all_levels.extend(levels)
-        return all_levels
+        return list(self._levels_by_id.values())
     
     def get_level(self, level_id: str) -> Optional[Level]:
         """Get a level by its ID.
@@ -407,20 +420,22 @@ class LevelSystem:
         Returns:
             Number of levels unlocked
         """
-        count = 0
         themes_to_unlock = [theme] if theme else list(Theme)
-        
-        for t in themes_to_unlock:
-            if t in self._levels:
-                for level in self._levels[t]:
-                    if not level.unlocked:
-                        level.unlocked = True
-                        count += 1
-        
-        if count > 0:
+        newly_unlocked = [
+            level
+            for t in themes_to_unlock
+            for level in self._levels.get(t, [])
+            if not level.unlocked
+        ]
+        
+        for level in newly_unlocked:
+            level.unlocked = True
+        
+        # One batched write for the whole sweep, not one per level
+        if newly_unlocked:
             self._save_levels_to_db()
         
-        return count
+        return len(newly_unlocked)
     
     def is_level_unlocked(self, level_id: str) -> bool:
         """Check if a level is unlocked.
@@ -473,7 +488,7 @@ class LevelSystem:
         Returns:
             Total number of levels for the theme
         """
-        return len(self._levels.get(theme, []))
+        return THEME_LEVEL_COUNTS.get(theme, 0)
     
     def reset_level_progress(self, level_id: str) -> bool:
         """Reset progress for a specific level.
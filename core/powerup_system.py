@@ -7,9 +7,11 @@ power-ups, activating them, tracking inventory, and managing duration timers.
 Requirements: 13.1, 13.2, 13.3, 13.4, 13.5, 13.6
 """
 
+import math
 import uuid
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from data.data_manager import DataManager
 from data.models import (
@@ -177,6 +179,42 @@ POWERUP_METADATA: Dict[PowerUpType, Dict] = {
     },
 }
 
+# Generic metadata for power-up types without a hand-written entry, filled in
+# once here so grants never have to build it
+for _powerup_type in PowerUpType:
+    POWERUP_METADATA.setdefault(_powerup_type, {
+        "name": _powerup_type.value.replace("_", " ").title(),
+        "description": f"A {_powerup_type.value} power-up.",
+        "icon": f"{_powerup_type.value}.png",
+        "duration_seconds": 0,
+    })
+del _powerup_type
+
+
+# SQL used by PowerUpSystem. Keeping each statement's text in one place means
+# every call site hits the same entry in the connection's statement cache.
+_SQL_LOAD_ACTIVE = """
+    SELECT ap.id, ap.powerup_id, ap.activated_at, ap.duration_seconds, ap.remaining_seconds,
+           p.type, p.theme, p.name, p.description, p.icon, p.quantity, 
+           p.duration_seconds as powerup_duration, p.acquired_at
+    FROM active_powerups ap
+    JOIN powerups p ON ap.powerup_id = p.id
+"""
+_SQL_UPSERT_POWERUP = """
+    INSERT OR REPLACE INTO powerups
+    (id, type, theme, name, description, icon, quantity, duration_seconds, acquired_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_DELETE_POWERUP = "DELETE FROM powerups WHERE id = ?"
+_SQL_UPSERT_ACTIVE = """
+    INSERT OR REPLACE INTO active_powerups
+    (id, powerup_id, activated_at, duration_seconds, remaining_seconds)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_DELETE_ACTIVE = "DELETE FROM active_powerups WHERE id = ?"
+_SQL_CLEAR_ACTIVE = "DELETE FROM active_powerups"
+_SQL_CLEAR_POWERUPS = "DELETE FROM powerups"
+
 
 class PowerUpSystem:
     """Manages power-ups and their effects.
@@ -191,6 +229,7 @@ class PowerUpSystem:
         data_manager: DataManager instance for persistence
         _inventory: In-memory cache of power-ups in inventory
         _active_powerups: Currently active power-ups with timers
+        _active_counts: Number of active power-ups per type
     """
     
     def __init__(self, data_manager: DataManager):
@@ -202,6 +241,7 @@ class PowerUpSystem:
         self.data_manager = data_manager
         self._inventory: Dict[str, PowerUp] = {}
         self._active_powerups: Dict[str, ActivePowerUp] = {}
+        self._active_counts: Counter = Counter()
         self._load_inventory()
         self._load_active_powerups()
     
@@ -217,13 +257,7 @@ class PowerUpSystem:
         cursor = conn.cursor()
         
         # Query active_powerups joined with powerups to get full powerup data
-        cursor.execute("""
-            SELECT ap.id, ap.powerup_id, ap.activated_at, ap.duration_seconds, ap.remaining_seconds,
-                   p.type, p.theme, p.name, p.description, p.icon, p.quantity, 
-                   p.duration_seconds as powerup_duration, p.acquired_at
-            FROM active_powerups ap
-            JOIN powerups p ON ap.powerup_id = p.id
-        """)
+        cursor.execute(_SQL_LOAD_ACTIVE)
         
         for row in cursor.fetchall():
             powerup_id = row["powerup_id"]
@@ -249,17 +283,12 @@ class PowerUpSystem:
                 duration_seconds=row["duration_seconds"],
                 remaining_seconds=row["remaining_seconds"],
             )
+            self._active_counts[powerup.type] += 1
     
-    def _save_powerup(self, powerup: PowerUp) -> None:
-        """Save a power-up to the database."""
-        conn = self.data_manager._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO powerups
-            (id, type, theme, name, description, icon, quantity, duration_seconds, acquired_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    @staticmethod
+    def _powerup_row(powerup: PowerUp) -> tuple:
+        """Build the powerups table row for a power-up."""
+        return (
             powerup.id,
             powerup.type.value,
             powerup.theme.value if powerup.theme else None,
@@ -269,41 +298,41 @@ class PowerUpSystem:
             powerup.quantity,
             powerup.duration_seconds,
             powerup.acquired_at,
-        ))
-        conn.commit()
+        )
     
-    def _save_active_powerup(self, active_id: str, active: ActivePowerUp) -> None:
-        """Save an active power-up to the database."""
-        conn = self.data_manager._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO active_powerups
-            (id, powerup_id, activated_at, duration_seconds, remaining_seconds)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            active_id,
-            active.powerup_id,
-            active.activated_at,
-            active.duration_seconds,
-            active.remaining_seconds,
-        ))
-        conn.commit()
+    def _write_powerups(self, cursor, powerups: Iterable[PowerUp]) -> None:
+        """Write power-ups to the database without committing."""
+        cursor.executemany(
+            _SQL_UPSERT_POWERUP, [self._powerup_row(powerup) for powerup in powerups]
+        )
     
-    def _remove_active_powerup(self, active_id: str) -> None:
-        """Remove an active power-up from the database."""
+    def _save_powerups(self, powerups: Iterable[PowerUp]) -> None:
+        """Save power-ups to the database in a single transaction."""
         conn = self.data_manager._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM active_powerups WHERE id = ?", (active_id,))
+        self._write_powerups(conn.cursor(), powerups)
         conn.commit()
     
-    def _remove_powerup_from_db(self, powerup_id: str) -> None:
-        """Remove a power-up from the database."""
+    def _save_powerup(self, powerup: PowerUp) -> None:
+        """Save a power-up to the database."""
+        self._save_powerups((powerup,))
+    
+    def _write_active_powerups(self, cursor, actives: Iterable[Tuple[str, ActivePowerUp]]) -> None:
+        """Write (active_id, ActivePowerUp) pairs to the database without committing."""
+        cursor.executemany(_SQL_UPSERT_ACTIVE, [
+            (
+                active_id,
+                active.powerup_id,
+                active.activated_at,
+                active.duration_seconds,
+                active.remaining_seconds,
+            )
+            for active_id, active in actives
+        ])
+    
+    def _remove_active_powerups(self, active_ids: Iterable[str]) -> None:
+        """Remove active power-ups from the database in a single transaction."""
         conn = self.data_manager._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM powerups WHERE id = ?", (powerup_id,))
+        conn.cursor().executemany(_SQL_DELETE_ACTIVE, [(active_id,) for active_id in active_ids])
         conn.commit()
     
     def grant_powerup(self, powerup_type: PowerUpType, theme: Theme) -> PowerUp:
@@ -321,23 +350,46 @@ class PowerUpSystem:
             
         Requirements: 13.1, 13.2, 13.3
         """
-        # Get metadata for this power-up type
-        metadata = POWERUP_METADATA.get(powerup_type, {
-            "name": powerup_type.value.replace("_", " ").title(),
-            "description": f"A {powerup_type.value} power-up.",
-            "icon": f"{powerup_type.value}.png",
-            "duration_seconds": 0,
-        })
+        powerup = self._add_to_inventory(powerup_type, theme)
+        self._save_powerup(powerup)
+        return powerup
+    
+    def grant_powerups_bulk(self, specs: Iterable[Tuple[PowerUpType, Theme]]) -> List[PowerUp]:
+        """Grant several power-ups with a single database write.
+        
+        Behaves like calling grant_powerup once per spec, but every
+        inventory change is persisted in one transaction.
         
+        Args:
+            specs: (powerup_type, theme) pairs to grant; repeated pairs
+                increment the quantity of the same inventory entry
+            
+        Returns:
+            The granted PowerUp instances, one per distinct spec, in the
+            order they were first granted
+        """
+        granted: Dict[str, PowerUp] = {}
+        for powerup_type, theme in specs:
+            powerup = self._add_to_inventory(powerup_type, theme)
+            granted[powerup.id] = powerup
+        
+        if granted:
+            self._save_powerups(granted.values())
+        return list(granted.values())
+    
+    def _add_to_inventory(self, powerup_type: PowerUpType, theme: Theme) -> PowerUp:
+        """Grant a power-up in memory without persisting it."""
         # Check if we already have this type of power-up in inventory
         existing = self._find_powerup_by_type(powerup_type, theme)
         
         if existing:
             # Increment quantity of existing power-up
             existing.quantity += 1
-            self._save_powerup(existing)
             return existing
         
+        # Get metadata for this power-up type; only new entries need it
+        metadata = POWERUP_METADATA[powerup_type]
+        
         # Create new power-up
         powerup = PowerUp(
             id=str(uuid.uuid4()),
@@ -351,10 +403,8 @@ class PowerUpSystem:
             acquired_at=datetime.now(),
         )
         
-        # Add to inventory and persist
+        # Add to inventory
         self._inventory[powerup.id] = powerup
-        self._save_powerup(powerup)
-        
         return powerup
     
     def _find_powerup_by_type(self, powerup_type: PowerUpType, theme: Optional[Theme]) -> Optional[PowerUp]:
@@ -379,31 +429,54 @@ class PowerUpSystem:
             
         Requirements: 13.4
         """
-        # Check if power-up exists in inventory
-        if powerup_id not in self._inventory:
-            return False
+        return self.activate_many(powerup_id, 1) == 1
+    
+    def activate_many(self, powerup_id: str, count: int) -> int:
+        """Activate several copies of a power-up from inventory at once.
         
-        powerup = self._inventory[powerup_id]
+        Equivalent to calling activate_powerup ``count`` times, but every
+        database change is written in a single transaction. Activates as
+        many copies as the inventory holds, up to ``count``.
         
-        # Check if we have any quantity available
-        if powerup.quantity <= 0:
-            return False
+        Args:
+            powerup_id: ID of the power-up to activate
+            count: Number of copies to activate
+            
+        Returns:
+            Number of copies actually activated (0 if none could be)
+        """
+        # Check if power-up exists in inventory
+        powerup = self._inventory.get(powerup_id)
+        if powerup is None:
+            return 0
+        
+        # Check how much quantity is available
+        activated = min(count, powerup.quantity)
+        if activated <= 0:
+            return 0
         
         # Decrement quantity
-        powerup.quantity -= 1
+        powerup.quantity -= activated
         
-        # If this is a timed power-up, add to active list
+        conn = self.data_manager._get_connection()
+        cursor = conn.cursor()
+        
+        # If this is a timed power-up, add each copy to the active list
         if powerup.duration_seconds > 0:
-            active_id = str(uuid.uuid4())
-            active = ActivePowerUp(
-                powerup_id=powerup_id,
-                powerup=powerup,
-                activated_at=datetime.now(),
-                duration_seconds=powerup.duration_seconds,
-                remaining_seconds=float(powerup.duration_seconds),
-            )
-            self._active_powerups[active_id] = active
-            self._save_active_powerup(active_id, active)
+            now = datetime.now()
+            new_actives = {
+                str(uuid.uuid4()): ActivePowerUp(
+                    powerup_id=powerup_id,
+                    powerup=powerup,
+                    activated_at=now,
+                    duration_seconds=powerup.duration_seconds,
+                    remaining_seconds=float(powerup.duration_seconds),
+                )
+                for _ in range(activated)
+            }
+            self._active_powerups.update(new_actives)
+            self._active_counts[powerup.type] += activated
+            self._write_active_powerups(cursor, new_actives.items())
         
         # Update or remove from inventory
         if powerup.quantity <= 0:
@@ -412,14 +485,15 @@ class PowerUpSystem:
             # Keep the record for active powerup reference
             if powerup.duration_seconds > 0:
                 # Keep in DB with quantity 0 for active powerup reference
-                self._save_powerup(powerup)
+                self._write_powerups(cursor, (powerup,))
             else:
                 # Instant powerup, safe to remove
-                self._remove_powerup_from_db(powerup_id)
+                cursor.execute(_SQL_DELETE_POWERUP, (powerup_id,))
         else:
-            self._save_powerup(powerup)
+            self._write_powerups(cursor, (powerup,))
         
-        return True
+        conn.commit()
+        return activated
     
     def get_active_powerups(self) -> List[ActivePowerUp]:
         """Get currently active power-ups with remaining duration.
@@ -461,8 +535,12 @@ class PowerUpSystem:
             
         Requirements: 13.6
         """
+        if not self._active_powerups:
+            return []
+        
         expired: List[PowerUp] = []
         expired_ids: List[str] = []
+        remaining: List[Tuple[str, ActivePowerUp]] = []
         
         for active_id, active in self._active_powerups.items():
             # Decrement remaining time
@@ -473,16 +551,39 @@ class PowerUpSystem:
                 expired.append(active.powerup)
                 expired_ids.append(active_id)
             else:
-                # Update in database
-                self._save_active_powerup(active_id, active)
+                remaining.append((active_id, active))
         
         # Remove expired power-ups
         for active_id in expired_ids:
-            del self._active_powerups[active_id]
-            self._remove_active_powerup(active_id)
+            powerup_type = self._active_powerups.pop(active_id).powerup.type
+            self._active_counts[powerup_type] -= 1
+            if not self._active_counts[powerup_type]:
+                del self._active_counts[powerup_type]
+        
+        # Persist updated timers and removals together
+        conn = self.data_manager._get_connection()
+        cursor = conn.cursor()
+        self._write_active_powerups(cursor, remaining)
+        cursor.executemany(_SQL_DELETE_ACTIVE, [(active_id,) for active_id in expired_ids])
+        conn.commit()
         
         return expired
     
+    def tick_batch(self, deltas: Iterable[float]) -> List[PowerUp]:
+        """Apply several elapsed-time steps as a single tick.
+        
+        Sums the deltas exactly (math.fsum) and ticks once, so callers that
+        accumulate many small frame times pay for one database update
+        instead of one per frame.
+        
+        Args:
+            deltas: Elapsed times in seconds
+            
+        Returns:
+            List of power-ups that expired during the combined tick
+        """
+        return self.tick(math.fsum(deltas))
+    
     def get_theme_powerup_types(self, theme: Theme) -> List[PowerUpType]:
         """Get the list of power-up types available for a theme.
         
@@ -503,10 +604,7 @@ class PowerUpSystem:
         Returns:
             True if an active power-up of this type exists
         """
-        for active in self._active_powerups.values():
-            if active.powerup.type == powerup_type:
-                return True
-        return False
+        return self._active_counts[powerup_type] > 0
     
     def get_powerup_count(self, powerup_type: PowerUpType, theme: Optional[Theme] = None) -> int:
         """Get the total count of a specific power-up type in inventory.
@@ -527,6 +625,22 @@ class PowerUpSystem:
     
     def clear_all_active(self) -> None:
         """Clear all active power-ups (for testing or session reset)."""
-        for active_id in list(self._active_powerups.keys()):
-            self._remove_active_powerup(active_id)
+        self._remove_active_powerups(self._active_powerups.keys())
+        self._active_powerups.clear()
+        self._active_counts.clear()
+    
+    def reset(self) -> None:
+        """Remove every power-up from inventory and the active list.
+        
+        Both tables are cleared in a single transaction, leaving the
+        system as if it had been created on a fresh database.
+        """
+        conn = self.data_manager._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(_SQL_CLEAR_ACTIVE)
+        cursor.execute(_SQL_CLEAR_POWERUPS)
+        conn.commit()
         self._active_powerups.clear()
+        self._active_counts.clear()
+        self._inventory.clear()
@@ -8,7 +8,7 @@ Requirements: 2.1, 2.2, 2.3, 2.4, 2.5, 3.5
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional
 import uuid
 
 from data.data_manager import DataManager
@@ -75,8 +75,16 @@ class ProgressionSystem:
         self.data_manager = data_manager
         self.scoring_engine = scoring_engine
         self.config = config or GameConfig()
+        self.reload()
+    
+    def reload(self) -> None:
+        """Reload progression from the database.
         
-        # Load initial state from database
+        Replaces the in-memory state with what is persisted and starts a
+        new session, discarding session accuracy counters and resetting the
+        level/power-up grant thresholds to match the loaded state.
+        """
+        # Load state from database
         game_state = self.data_manager.load_state()
         self._state = game_state.progression
         self._current_theme = game_state.theme
@@ -114,6 +122,40 @@ class ProgressionSystem:
             
         Requirements: 2.1, 2.2, 2.3
         """
+        self._apply_review(result)
+        
+        # Persist the updated state
+        self.data_manager.save_progression(self._state)
+        
+        return self._state
+    
+    def process_reviews_batch(self, results: Iterable[ReviewResult]) -> List[PowerUp]:
+        """Process several card reviews in order, persisting once at the end.
+        
+        Each review updates progression exactly as process_review would.
+        Afterwards, every power-up earned is collected, one per threshold
+        crossed. Those grants are consumed and will not be returned by a
+        later check_powerup_grant call.
+        
+        Args:
+            results: ReviewResults to process, oldest first
+            
+        Returns:
+            Power-ups granted while processing the batch
+        """
+        for result in results:
+            self._apply_review(result)
+        self.data_manager.save_progression(self._state)
+        
+        granted: List[PowerUp] = []
+        powerup = self.check_powerup_grant()
+        while powerup is not None:
+            granted.append(powerup)
+            powerup = self.check_powerup_grant()
+        return granted
+    
+    def _apply_review(self, result: ReviewResult) -> None:
+        """Apply a single review to the in-memory progression state."""
         # Update total cards reviewed
         self._state.total_cards_reviewed += 1
         self._session_total += 1
@@ -162,11 +204,6 @@ class ProgressionSystem:
         self._state.levels_unlocked = (
             self._state.correct_answers // self.config.cards_per_level
         )
-        
-        # Persist the updated state
-        self.data_manager.save_progression(self._state)
-        
-        return self._state
     
     def get_state(self) -> ProgressionState:
         """Get current progression state.
@@ -206,7 +243,9 @@ class ProgressionSystem:
         
         A power-up is granted every cards_per_powerup (default 100) correct answers.
         This method checks if the current correct_answers count has crossed
-        a new threshold since the last check.
+        a new threshold since the last check. If several thresholds were
+        crossed, each call grants the power-up for the next one in turn, so
+        polling until None collects every power-up earned.
         
         Returns:
             PowerUp if granted, None otherwise
@@ -218,11 +257,12 @@ class ProgressionSystem:
         ) * self.config.cards_per_powerup
         
         if current_threshold > self._last_powerup_grant_threshold:
-            # A new power-up should be granted
-            self._last_powerup_grant_threshold = current_threshold
+            # A new power-up should be granted for the next threshold
+            self._last_powerup_grant_threshold += self.config.cards_per_powerup
+            grant_number = self._last_powerup_grant_threshold // self.config.cards_per_powerup
             
             # Create a theme-appropriate power-up
-            powerup = self._create_powerup_for_theme(self._current_theme)
+            powerup = self._create_powerup_for_theme(self._current_theme, grant_number)
             return powerup
         
         return None
@@ -253,7 +293,7 @@ class ProgressionSystem:
         """
         self._current_theme = theme
     
-    def _create_powerup_for_theme(self, theme: Theme) -> PowerUp:
+    def _create_powerup_for_theme(self, theme: Theme, grant_number: int) -> PowerUp:
         """Create a power-up appropriate for the given theme.
         
         Cycles through available power-ups for the theme based on
@@ -261,6 +301,7 @@ class ProgressionSystem:
         
         Args:
             theme: The theme to create a power-up for
+            grant_number: 1-based number of this grant
             
         Returns:
             A new PowerUp instance
@@ -268,8 +309,7 @@ class ProgressionSystem:
         theme_powerups = self.THEME_POWERUPS.get(theme, self.THEME_POWERUPS[Theme.MARIO])
         
         # Cycle through power-ups based on grant count
-        powerup_count = self._state.correct_answers // self.config.cards_per_powerup
-        powerup_index = (powerup_count - 1) % len(theme_powerups)
+        powerup_index = (grant_number - 1) % len(theme_powerups)
         
         powerup_type, name, description = theme_powerups[powerup_index]
         
@@ -12,7 +12,7 @@ import shutil
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from data.models import (
     Achievement,
@@ -53,7 +53,8 @@ class DataManager:
     - Database integrity checking and backup creation
     
     Attributes:
-        db_path: Path to the SQLite database file
+        db_path: Path to the SQLite database file, or a ``file:`` URI
+            (e.g. ``file::memory:?cache=shared``)
     """
     
     # SQL schema for all tables
@@ -173,13 +174,35 @@ class DataManager:
     );
     """
     
-    def __init__(self, db_path: Path):
+    # Stored in PRAGMA user_version once the schema and default rows are in
+    # place; bump it whenever SCHEMA or the default rows change
+    SCHEMA_VERSION = 1
+    
+    # PRAGMAs that trade durability for speed; only safe for throwaway
+    # databases such as the ones used by the test suite
+    FAST_UNSAFE_PRAGMAS = (
+        "PRAGMA journal_mode=MEMORY",
+        "PRAGMA synchronous=OFF",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA locking_mode=EXCLUSIVE",
+    )
+    
+    # Columns update_theme_state may write; the JSON ones are stored encoded
+    THEME_STATE_COLUMNS = ("coins", "bananas", "hearts", "map_progress", "extra_data")
+    THEME_STATE_JSON_COLUMNS = ("map_progress", "extra_data")
+    
+    def __init__(self, db_path: Path, fast_unsafe: bool = False):
         """Initialize the DataManager.
         
         Args:
-            db_path: Path to the SQLite database file
+            db_path: Path to the SQLite database file, or a ``file:`` URI
+            fast_unsafe: If True, keep the journal in memory and skip fsyncs.
+                A crash can corrupt the database, so never use this for
+                real user data.
         """
         self.db_path = Path(db_path)
+        self.fast_unsafe = fast_unsafe
+        self._is_uri = str(db_path).startswith("file:")
         self._connection: Optional[sqlite3.Connection] = None
     
     def _get_connection(self) -> sqlite3.Connection:
@@ -191,9 +214,16 @@ class DataManager:
         if self._connection is None:
             self._connection = sqlite3.connect(
                 str(self.db_path),
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                uri=self._is_uri,
+                cached_statements=256
             )
             self._connection.row_factory = sqlite3.Row
+            # Negative cache_size is in KiB: keep up to ~20 MB of pages cached
+            self._connection.execute("PRAGMA cache_size=-20000")
+            if self.fast_unsafe:
+                for pragma in self.FAST_UNSAFE_PRAGMAS:
+                    self._connection.execute(pragma)
         return self._connection
     
     def _close_connection(self) -> None:
@@ -206,16 +236,21 @@ class DataManager:
         """Create database tables if they don't exist.
         
         This method creates all required tables for storing game state.
-        If the database file doesn't exist, it will be created.
+        If the database file doesn't exist, it will be created. Databases
+        already stamped with the current SCHEMA_VERSION are left untouched.
         
         Requirements: 8.1
         """
-        # Ensure parent directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists (URIs name no directory of their own)
+        if not self._is_uri:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         conn = self._get_connection()
         cursor = conn.cursor()
         
+        if cursor.execute("PRAGMA user_version").fetchone()[0] == self.SCHEMA_VERSION:
+            return
+        
         # Execute schema creation
         cursor.executescript(self.SCHEMA)
         
@@ -234,6 +269,8 @@ class DataManager:
                 VALUES (?, 0, 0, 3)
             """, (theme.value,))
         
+        # PRAGMA takes no bound parameters; SCHEMA_VERSION is a class int
+        cursor.execute(f"PRAGMA user_version = {int(self.SCHEMA_VERSION)}")
         conn.commit()
     
     def save_state(self, state: GameState) -> None:
@@ -315,24 +352,7 @@ class DataManager:
                 ))
             
             # Save levels
-            for level in state.levels:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO levels
-                    (id, theme, level_number, name, description, unlocked, completed,
-                     best_accuracy, completion_date, rewards_claimed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    level.id,
-                    level.theme.value,
-                    level.level_number,
-                    level.name,
-                    level.description,
-                    1 if level.unlocked else 0,
-                    1 if level.completed else 0,
-                    level.best_accuracy,
-                    level.completion_date,
-                    1 if level.rewards_claimed else 0
-                ))
+            self._write_levels(cursor, state.levels)
             
             # Save cosmetics/collectibles
             for cosmetic in state.cosmetics:
@@ -444,21 +464,7 @@ class DataManager:
             ))
         
         # Load levels
-        cursor.execute("SELECT * FROM levels")
-        levels = []
-        for row in cursor.fetchall():
-            levels.append(Level(
-                id=row["id"],
-                theme=Theme(row["theme"]),
-                level_number=row["level_number"],
-                name=row["name"],
-                description=row["description"],
-                unlocked=bool(row["unlocked"]),
-                completed=bool(row["completed"]),
-                best_accuracy=row["best_accuracy"],
-                completion_date=row["completion_date"],
-                rewards_claimed=bool(row["rewards_claimed"])
-            ))
+        levels = self._read_levels(cursor)
         
         # Load cosmetics/collectibles
         cursor.execute("SELECT * FROM collectibles")
@@ -505,6 +511,81 @@ class DataManager:
             theme_specific=theme_specific
         )
     
+    def load_levels(self) -> List[Level]:
+        """Load persisted level state without the rest of the game state.
+        
+        Returns:
+            List of all Level rows stored in the database
+            
+        Requirements: 15.6
+        """
+        conn = self._get_connection()
+        return self._read_levels(conn.cursor())
+    
+    def _read_levels(self, cursor: sqlite3.Cursor) -> List[Level]:
+        """Read all level rows into Level objects."""
+        cursor.execute("SELECT * FROM levels")
+        return [
+            Level(
+                id=row["id"],
+                theme=Theme(row["theme"]),
+                level_number=row["level_number"],
+                name=row["name"],
+                description=row["description"],
+                unlocked=bool(row["unlocked"]),
+                completed=bool(row["completed"]),
+                best_accuracy=row["best_accuracy"],
+                completion_date=row["completion_date"],
+                rewards_claimed=bool(row["rewards_claimed"])
+            )
+            for row in cursor.fetchall()
+        ]
+    
+    def save_levels(self, levels: List[Level]) -> None:
+        """Save level state without touching the rest of the game state.
+        
+        All rows are written with a single batched statement inside one
+        transaction, so callers that only change levels avoid a full
+        load_state/save_state round trip.
+        
+        Args:
+            levels: Levels to insert or replace
+            
+        Requirements: 15.6
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            self._write_levels(cursor, levels)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+    
+    def _write_levels(self, cursor: sqlite3.Cursor, levels: List[Level]) -> None:
+        """Insert or replace level rows in one executemany call."""
+        cursor.executemany("""
+            INSERT OR REPLACE INTO levels
+            (id, theme, level_number, name, description, unlocked, completed,
+             best_accuracy, completion_date, rewards_claimed)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                level.id,
+                level.theme.value,
+                level.level_number,
+                level.name,
+                level.description,
+                1 if level.unlocked else 0,
+                1 if level.completed else 0,
+                level.best_accuracy,
+                level.completion_date,
+                1 if level.rewards_claimed else 0
+            )
+            for level in levels
+        ])
+    
     def save_progression(self, progression: ProgressionState) -> None:
         """Save progression state (called after each review).
         
@@ -544,6 +625,43 @@ class DataManager:
         
         conn.commit()
     
+    def update_theme_state(self, theme: Theme, **fields: Any) -> None:
+        """Update selected theme_state columns without loading game state.
+        
+        Only the given columns are written; map_progress and extra_data are
+        JSON-encoded the same way save_state stores them.
+        
+        Args:
+            theme: Theme whose row to update
+            **fields: Column values keyed by ThemeState attribute name
+            
+        Raises:
+            ValueError: If a field is not a theme_state column
+        """
+        unknown = set(fields) - set(self.THEME_STATE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown theme state fields: {sorted(unknown)}")
+        if not fields:
+            return
+        
+        values = []
+        for name, value in fields.items():
+            if name in self.THEME_STATE_JSON_COLUMNS:
+                value = json.dumps(value) if value else None
+            values.append(value)
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                f"UPDATE theme_state SET {assignments} WHERE theme = ?",
+                (*values, theme.value)
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+    
     def check_integrity(self) -> bool:
         """Check database integrity.
         
@@ -8,12 +8,19 @@ progression, scoring, achievements, and configuration.
 Requirements: 2.1, 3.1, 8.3
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
 
+# Keyword arguments for @dataclass on small, frequently built models.
+# slots=True needs Python 3.10+; on older interpreters these models keep
+# a regular __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class Theme(str, Enum):
     """Available game themes.
     
@@ -331,7 +338,7 @@ class AchievementProgress:
 
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PowerUp:
     """Represents a power-up in the user's inventory.
     
@@ -360,7 +367,7 @@ class PowerUp:
     acquired_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ActivePowerUp:
     """Represents an active power-up with remaining duration.
     
@@ -378,7 +385,7 @@ class ActivePowerUp:
     remaining_seconds: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Level:
     """Represents a playable level.
     
@@ -409,7 +416,7 @@ class Level:
     rewards_claimed: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LevelReward:
     """Rewards earned from completing a level.
     
@@ -425,7 +432,7 @@ class LevelReward:
     achievement_unlocked: Optional[Achievement] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LevelProgress:
     """Overall level progress statistics.
     
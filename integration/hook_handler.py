@@ -12,13 +12,15 @@ Requirements: 7.1, 7.2, 7.3
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from typing import Any, Callable, Dict, List, Optional, Protocol, TYPE_CHECKING
 import logging
 
-from core.progression_system import ProgressionSystem
-from core.scoring_engine import ScoringEngine
 from data.models import ReviewResult
 
+if TYPE_CHECKING:
+    from core.progression_system import ProgressionSystem
+    from core.scoring_engine import ScoringEngine
+
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -204,8 +206,8 @@ class HookHandler:
     
     def __init__(
         self,
-        progression_system: ProgressionSystem,
-        scoring_engine: ScoringEngine,
+        progression_system: 'ProgressionSystem',
+        scoring_engine: 'ScoringEngine',
         hook_provider: Optional[AnkiHookProvider] = None
     ):
         """Initialize the HookHandler.
@@ -10,7 +10,7 @@ Anki running by using dependency injection for the menu/toolbar system.
 Requirements: 7.6, 7.7
 """
 
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
 import logging
 
 
@@ -18,6 +18,10 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# (item_text, callback, shortcut) for one entry passed to add_menu_items
+MenuItemSpec = Tuple[str, Callable[[], None], Optional[str]]
+
+
 class AnkiMenuProvider(Protocol):
     """Protocol for Anki menu integration.
     
@@ -46,6 +50,18 @@ class AnkiMenuProvider(Protocol):
         """
         ...
     
+    def add_menu_items(self, menu_name: str, items: List[MenuItemSpec]) -> List[Any]:
+        """Add several menu items to one menu in a single call.
+        
+        Args:
+            menu_name: Name of the menu to add to (e.g., "Tools")
+            items: (item_text, callback, shortcut) for each item, in order
+            
+        Returns:
+            The created actions in the same order (None where one was not added)
+        """
+        ...
+    
     def remove_menu_item(self, menu_name: str, action: Any) -> None:
         """Remove a menu item from a menu.
         
@@ -136,12 +152,38 @@ class RealAnkiMenuProvider:
         Returns:
             The created QAction
         """
+        return self.add_menu_items(menu_name, [(item_text, callback, shortcut)])[0]
+    
+    def add_menu_items(self, menu_name: str, items: List[MenuItemSpec]) -> List[Any]:
+        """Add several menu items to an Anki menu, looking the menu up once.
+        
+        Args:
+            menu_name: Name of the menu (e.g., "Tools")
+            items: (item_text, callback, shortcut) for each item, in order
+            
+        Returns:
+            The created QActions in order, or Nones if the menu was not found
+        """
         # Find the menu
         menu = self._find_menu(menu_name)
         if menu is None:
             logger.warning(f"Menu not found: {menu_name}")
-            return None
+            return [None] * len(items)
         
+        return [
+            self._add_action_to_menu(menu, menu_name, item_text, callback, shortcut)
+            for item_text, callback, shortcut in items
+        ]
+    
+    def _add_action_to_menu(
+        self,
+        menu: Any,
+        menu_name: str,
+        item_text: str,
+        callback: Callable[[], None],
+        shortcut: Optional[str]
+    ) -> Any:
+        """Create a QAction, add it to an already resolved menu and track it."""
         # Create the action
         action = self._QAction(item_text, self._mw)
         action.triggered.connect(callback)
@@ -284,12 +326,16 @@ class MockAnkiMenuProvider:
     
     This class provides a mock implementation of the Anki menu/toolbar system
     that can be used for testing without Anki running.
+    
+    Entries are indexed by container name and then by text, so lookups by
+    text are O(1) and iteration keeps insertion order. Adding an entry whose
+    text already exists in the same container replaces it.
     """
     
     def __init__(self):
         """Initialize the mock menu provider."""
-        self._menu_items: Dict[str, List[Dict[str, Any]]] = {}
-        self._toolbar_buttons: Dict[str, List[Dict[str, Any]]] = {}
+        self._menu_items: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._toolbar_buttons: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self._action_counter = 0
     
     def add_menu_item(
@@ -310,26 +356,37 @@ class MockAnkiMenuProvider:
         Returns:
             A mock action object
         """
-        self._action_counter += 1
-        action = MockAction(
-            id=self._action_counter,
-            text=item_text,
-            callback=callback,
-            shortcut=shortcut
-        )
-        
-        if menu_name not in self._menu_items:
-            self._menu_items[menu_name] = []
-        
-        self._menu_items[menu_name].append({
-            'action': action,
-            'text': item_text,
-            'callback': callback,
-            'shortcut': shortcut
-        })
+        return self.add_menu_items(menu_name, [(item_text, callback, shortcut)])[0]
+    
+    def add_menu_items(self, menu_name: str, items: List[MenuItemSpec]) -> List[Any]:
+        """Add several mock menu items to one menu in a single pass.
         
-        logger.debug(f"Mock: Added menu item '{item_text}' to {menu_name}")
-        return action
+        Args:
+            menu_name: Name of the menu
+            items: (item_text, callback, shortcut) for each item, in order
+            
+        Returns:
+            The mock actions in the same order
+        """
+        entries = self._menu_items.setdefault(menu_name, {})
+        actions = []
+        for item_text, callback, shortcut in items:
+            self._action_counter += 1
+            action = MockAction(
+                id=self._action_counter,
+                text=item_text,
+                callback=callback,
+                shortcut=shortcut
+            )
+            entries[item_text] = {
+                'action': action,
+                'text': item_text,
+                'callback': callback,
+                'shortcut': shortcut
+            }
+            actions.append(action)
+            logger.debug(f"Mock: Added menu item '{item_text}' to {menu_name}")
+        return actions
     
     def remove_menu_item(self, menu_name: str, action: Any) -> None:
         """Remove a mock menu item.
@@ -339,10 +396,7 @@ class MockAnkiMenuProvider:
             action: The mock action to remove
         """
         if menu_name in self._menu_items:
-            self._menu_items[menu_name] = [
-                item for item in self._menu_items[menu_name]
-                if item['action'] != action
-            ]
+            self._discard_entry(self._menu_items[menu_name], action)
             logger.debug(f"Mock: Removed menu item from {menu_name}")
     
     def add_toolbar_button(
@@ -374,16 +428,13 @@ class MockAnkiMenuProvider:
             tooltip=tooltip
         )
         
-        if toolbar_name not in self._toolbar_buttons:
-            self._toolbar_buttons[toolbar_name] = []
-        
-        self._toolbar_buttons[toolbar_name].append({
+        self._toolbar_buttons.setdefault(toolbar_name, {})[button_text] = {
             'action': action,
             'text': button_text,
             'callback': callback,
             'icon_path': icon_path,
             'tooltip': tooltip
-        })
+        }
         
         logger.debug(f"Mock: Added toolbar button '{button_text}'")
         return action
@@ -396,12 +447,21 @@ class MockAnkiMenuProvider:
             action: The mock action to remove
         """
         if toolbar_name in self._toolbar_buttons:
-            self._toolbar_buttons[toolbar_name] = [
-                item for item in self._toolbar_buttons[toolbar_name]
-                if item['action'] != action
-            ]
+            self._discard_entry(self._toolbar_buttons[toolbar_name], action)
             logger.debug(f"Mock: Removed toolbar button from {toolbar_name}")
     
+    @staticmethod
+    def _discard_entry(entries: Dict[str, Dict[str, Any]], action: Any) -> None:
+        """Remove the entry holding action from a text-keyed index, if present.
+        
+        Args:
+            entries: Entries of one menu or toolbar
+            action: The mock action to remove
+        """
+        entry = entries.get(action.text)
+        if entry is not None and entry['action'] == action:
+            del entries[action.text]
+    
     # Test helper methods
     
     def get_menu_items(self, menu_name: str) -> List[Dict[str, Any]]:
@@ -413,7 +473,7 @@ class MockAnkiMenuProvider:
         Returns:
             List of menu item dictionaries
         """
-        return self._menu_items.get(menu_name, [])
+        return list(self._menu_items.get(menu_name, {}).values())
     
     def get_toolbar_buttons(self, toolbar_name: str) -> List[Dict[str, Any]]:
         """Get all toolbar buttons for a toolbar.
@@ -424,7 +484,7 @@ class MockAnkiMenuProvider:
         Returns:
             List of toolbar button dictionaries
         """
-        return self._toolbar_buttons.get(toolbar_name, [])
+        return list(self._toolbar_buttons.get(toolbar_name, {}).values())
     
     def has_menu_item(self, menu_name: str, item_text: str) -> bool:
         """Check if a menu item exists.
@@ -436,8 +496,7 @@ class MockAnkiMenuProvider:
         Returns:
             True if the menu item exists
         """
-        items = self._menu_items.get(menu_name, [])
-        return any(item['text'] == item_text for item in items)
+        return item_text in self._menu_items.get(menu_name, {})
     
     def has_toolbar_button(self, toolbar_name: str, button_text: str) -> bool:
         """Check if a toolbar button exists.
@@ -449,8 +508,7 @@ class MockAnkiMenuProvider:
         Returns:
             True if the toolbar button exists
         """
-        buttons = self._toolbar_buttons.get(toolbar_name, [])
-        return any(button['text'] == button_text for button in buttons)
+        return button_text in self._toolbar_buttons.get(toolbar_name, {})
     
     def trigger_menu_item(self, menu_name: str, item_text: str) -> bool:
         """Trigger a menu item's callback.
@@ -462,12 +520,11 @@ class MockAnkiMenuProvider:
         Returns:
             True if the item was found and triggered
         """
-        items = self._menu_items.get(menu_name, [])
-        for item in items:
-            if item['text'] == item_text:
-                item['callback']()
-                return True
-        return False
+        item = self._menu_items.get(menu_name, {}).get(item_text)
+        if item is None:
+            return False
+        item['callback']()
+        return True
     
     def trigger_toolbar_button(self, toolbar_name: str, button_text: str) -> bool:
         """Trigger a toolbar button's callback.
@@ -479,17 +536,25 @@ class MockAnkiMenuProvider:
         Returns:
             True if the button was found and triggered
         """
-        buttons = self._toolbar_buttons.get(toolbar_name, [])
-        for button in buttons:
-            if button['text'] == button_text:
-                button['callback']()
-                return True
-        return False
+        button = self._toolbar_buttons.get(toolbar_name, {}).get(button_text)
+        if button is None:
+            return False
+        button['callback']()
+        return True
     
     def clear_all(self) -> None:
         """Clear all menu items and toolbar buttons."""
         self._menu_items.clear()
         self._toolbar_buttons.clear()
+    
+    def reset(self) -> None:
+        """Return the provider to its freshly constructed state.
+        
+        Clears all entries in place and restarts action ids, so a single
+        provider can be reused across tests.
+        """
+        self.clear_all()
+        self._action_counter = 0
 
 
 class MockAction:
@@ -498,6 +563,11 @@ class MockAction:
     This class simulates a Qt QAction for testing purposes.
     """
     
+    __slots__ = (
+        "id", "text", "callback", "shortcut", "icon_path", "tooltip",
+        "_enabled", "_visible",
+    )
+    
     def __init__(
         self,
         id: int,
@@ -549,6 +619,8 @@ class MockAction:
     
     def __eq__(self, other: Any) -> bool:
         """Check equality based on id."""
+        if other is self:
+            return True
         if isinstance(other, MockAction):
             return self.id == other.id
         return False
@@ -664,45 +736,25 @@ class MenuIntegration:
             
         Requirements: 7.6
         """
-        if self._setup_complete:
+        if self._setup_complete or self._menu_actions:
             logger.warning("Menu already set up, skipping")
             return
         
-        # Add Dashboard menu item
+        # Collect an item for each provided component, then add them together
+        items: List[MenuItemSpec] = []
         if self.dashboard is not None:
-            action = self.menu_provider.add_menu_item(
-                menu_name=self.TOOLS_MENU,
-                item_text=self.MENU_DASHBOARD,
-                callback=self._open_dashboard,
-                shortcut="Ctrl+Shift+D"
-            )
-            if action is not None:
-                self._menu_actions.append(action)
-                logger.info(f"Added menu item: {self.MENU_DASHBOARD}")
-        
-        # Add Game Window menu item
+            items.append((self.MENU_DASHBOARD, self._open_dashboard, "Ctrl+Shift+D"))
         if self.game_window is not None:
-            action = self.menu_provider.add_menu_item(
-                menu_name=self.TOOLS_MENU,
-                item_text=self.MENU_GAME_WINDOW,
-                callback=self._open_game_window,
-                shortcut="Ctrl+Shift+G"
-            )
-            if action is not None:
-                self._menu_actions.append(action)
-                logger.info(f"Added menu item: {self.MENU_GAME_WINDOW}")
-        
-        # Add Settings menu item
+            items.append((self.MENU_GAME_WINDOW, self._open_game_window, "Ctrl+Shift+G"))
         if self.settings_panel is not None:
-            action = self.menu_provider.add_menu_item(
-                menu_name=self.TOOLS_MENU,
-                item_text=self.MENU_SETTINGS,
-                callback=self._open_settings,
-                shortcut="Ctrl+Shift+S"
-            )
-            if action is not None:
-                self._menu_actions.append(action)
-                logger.info(f"Added menu item: {self.MENU_SETTINGS}")
+            items.append((self.MENU_SETTINGS, self._open_settings, "Ctrl+Shift+S"))
+        
+        if items:
+            actions = self.menu_provider.add_menu_items(self.TOOLS_MENU, items)
+            for (item_text, _, _), action in zip(items, actions):
+                if action is not None:
+                    self._menu_actions.append(action)
+                    logger.info(f"Added menu item: {item_text}")
         
         logger.info("Menu setup complete")
     
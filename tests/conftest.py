@@ -2,12 +2,85 @@
 Shared pytest fixtures for NintendAnki tests.
 
 This module provides common fixtures used across test modules,
-including Qt application setup for UI tests.
+including Qt application setup for UI tests and a pre-initialized
+database template.
 """
 
+import hashlib
+import os
 import pytest
+import sqlite3
 import sys
 
+from data.data_manager import DataManager
+from data.models import Theme
+
+
+def pytest_addoption(parser):
+    """Register NintendAnki-specific command line options."""
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="Reuse an initialized database image stored under .pytest_cache "
+             "instead of running the schema DDL each session.",
+    )
+
+
+def _build_db_template() -> sqlite3.Connection:
+    """Initialize an in-memory database and return a copy of it."""
+    dm = DataManager(":memory:")
+    dm.initialize_database()
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    dm._get_connection().backup(template)
+    dm.close()
+    return template
+
+
+@pytest.fixture(scope="session")
+def db_template(request):
+    """Connection holding a freshly initialized database.
+    
+    Tests copy it into their own connection with
+    ``db_template.backup(dm._get_connection())`` instead of running
+    ``initialize_database()``. With ``--cached`` the database is kept on
+    disk, keyed by the schema and its version, so later runs skip the DDL
+    entirely.
+    """
+    if not request.config.getoption("--cached"):
+        template = _build_db_template()
+        yield template
+        template.close()
+        return
+    
+    key = hashlib.sha1(
+        (
+            DataManager.SCHEMA
+            + str(DataManager.SCHEMA_VERSION)
+            + ",".join(t.value for t in Theme)
+        ).encode()
+    ).hexdigest()[:16]
+    cache_dir = request.config.rootpath / ".pytest_cache" / "nintendanki"
+    cache_file = cache_dir / f"db-template-{key}.sqlite"
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    if cache_file.exists():
+        cached = sqlite3.connect(cache_file)
+        cached.backup(template)
+        cached.close()
+    else:
+        built = _build_db_template()
+        built.backup(template)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename so parallel workers never read a partial file
+        tmp_file = cache_dir / f"{cache_file.name}.{os.getpid()}.tmp"
+        disk = sqlite3.connect(tmp_file)
+        built.backup(disk)
+        disk.close()
+        built.close()
+        os.replace(tmp_file, cache_file)
+    yield template
+    template.close()
+
 
 # Qt application fixture for UI tests
 @pytest.fixture(scope="session")
@@ -119,6 +119,29 @@ class TestDatabaseInitialization:
         assert state.progression.total_points == 0
         dm.close()
     
+    def test_initialize_stamps_schema_version(self, temp_db_path):
+        """Test that initialization records the schema version."""
+        dm = DataManager(temp_db_path)
+        dm.initialize_database()
+        
+        conn = dm._get_connection()
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == DataManager.SCHEMA_VERSION
+        dm.close()
+    
+    def test_initialize_skips_current_schema(self, temp_db_path):
+        """Test that an already-stamped database is not re-initialized."""
+        dm = DataManager(temp_db_path)
+        dm.initialize_database()
+        conn = dm._get_connection()
+        conn.execute("DELETE FROM theme_state WHERE theme = 'dkc'")
+        conn.commit()
+        
+        dm.initialize_database()
+        
+        themes = {row[0] for row in conn.execute("SELECT theme FROM theme_state")}
+        assert themes == {"mario", "zelda"}
+        dm.close()
+    
     def test_initialize_creates_parent_directories(self):
         """Test that parent directories are created if they don't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -129,6 +152,30 @@ class TestDatabaseInitialization:
             
             assert nested_path.exists()
             dm.close()
+    
+    def test_initialize_shared_memory_uri(self):
+        """Test that a shared-cache memory URI is visible to other connections."""
+        uri = "file:test_shared_memory?mode=memory&cache=shared"
+        dm = DataManager(uri)
+        dm.initialize_database()
+        
+        other = DataManager(uri)
+        state = other.load_state()
+        
+        assert state.progression.total_points == 0
+        other.close()
+        dm.close()
+    
+    def test_initialize_fast_unsafe_pragmas(self, temp_db_path):
+        """Test that fast_unsafe relaxes journaling and syncing."""
+        dm = DataManager(temp_db_path, fast_unsafe=True)
+        dm.initialize_database()
+        conn = dm._get_connection()
+        
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        assert dm.load_state().progression.total_points == 0
+        dm.close()
 
 
 class TestSaveAndLoadState:
@@ -295,6 +342,30 @@ class TestSaveAndLoadState:
         assert level_2.unlocked is True
         assert level_2.completed is False
     
+    def test_save_levels_preserves_other_data(self, data_manager):
+        """Test that save_levels only writes level rows."""
+        state = GameState(progression=ProgressionState(total_points=250), currency=40)
+        data_manager.save_state(state)
+        
+        data_manager.save_levels([
+            Level(id="zelda_1", theme=Theme.ZELDA, level_number=1, name="Kokiri Forest", unlocked=True),
+            Level(id="zelda_2", theme=Theme.ZELDA, level_number=2, name="Deku Tree"),
+        ])
+        loaded = data_manager.load_state()
+        
+        assert {lvl.id for lvl in loaded.levels} == {"zelda_1", "zelda_2"}
+        assert loaded.progression.total_points == 250
+        assert loaded.currency == 40
+    
+    def test_load_levels(self, data_manager):
+        """Test that load_levels returns only the persisted levels."""
+        assert data_manager.load_levels() == []
+        
+        level = Level(id="dkc_1", theme=Theme.DKC, level_number=1, name="Jungle Hijinxs", unlocked=True)
+        data_manager.save_levels([level])
+        
+        assert data_manager.load_levels() == [level]
+    
     def test_save_and_load_cosmetics(self, data_manager):
         """Test saving and loading cosmetics/collectibles."""
         now = datetime.now()
@@ -426,6 +497,28 @@ class TestSaveProgression:
         assert loaded.progression.total_cards_reviewed == 10
 
 
+class TestUpdateThemeState:
+    """Tests for partial theme state updates."""
+    
+    def test_update_theme_state_writes_only_given_fields(self, data_manager):
+        """Test that update_theme_state changes one theme's columns in place."""
+        data_manager.update_theme_state(
+            Theme.MARIO, coins=42, map_progress={"world": 2}
+        )
+        
+        loaded = data_manager.load_state()
+        mario = loaded.theme_specific[Theme.MARIO]
+        assert mario.coins == 42
+        assert mario.map_progress == {"world": 2}
+        assert mario.hearts == 3
+        assert loaded.theme_specific[Theme.DKC].coins == 0
+    
+    def test_update_theme_state_rejects_unknown_fields(self, data_manager):
+        """Test that only theme_state columns can be updated."""
+        with pytest.raises(ValueError):
+            data_manager.update_theme_state(Theme.MARIO, stars=3)
+
+
 class TestCheckIntegrity:
     """Tests for database integrity checking."""
     
@@ -9,9 +9,6 @@ Requirements: 15.1, 15.2, 15.3, 15.4, 15.5, 15.6, 15.7
 
 import pytest
 from datetime import datetime
-from pathlib import Path
-import tempfile
-import os
 
 from core.level_system import (
     LevelSystem,
@@ -20,6 +17,7 @@ from core.level_system import (
     DKC_LEVELS,
     BASE_LEVEL_REWARD,
     THEME_LEVELS,
+    TOTAL_LEVELS,
 )
 from data.data_manager import DataManager
 from data.models import (
@@ -31,28 +29,45 @@ from data.models import (
 )
 
 
-@pytest.fixture
-def temp_db_path():
-    """Create a temporary database path for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir) / "test_game.db"
+MEMORY_DB_URI = "file:test_level_system?mode=memory&cache=shared"
+FROZEN_NOW = datetime(2024, 1, 15, 12, 0, 0)
 
 
-@pytest.fixture
-def data_manager(temp_db_path):
-    """Create a DataManager with a temporary database."""
-    dm = DataManager(temp_db_path)
-    dm.initialize_database()
+class _FrozenDateTime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+@pytest.fixture(scope="module")
+def data_manager(db_template):
+    """Create one DataManager for the module, seeded from the template."""
+    dm = DataManager(MEMORY_DB_URI, fast_unsafe=True)
+    db_template.backup(dm._get_connection())
     yield dm
-    dm.close()  # Close connection before cleanup
+    dm.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def level_system(data_manager):
-    """Create a LevelSystem instance for testing."""
+    """Create one LevelSystem instance for the module."""
     return LevelSystem(data_manager)
 
 
+@pytest.fixture(autouse=True)
+def _restore_db(db_template, data_manager, level_system):
+    """Roll the shared database and LevelSystem back to the template state.
+    
+    DataManager commits after every write, so a SAVEPOINT would be released
+    by the first save; restoring the template is the equivalent
+    rollback.
+    """
+    db_template.backup(data_manager._get_connection())
+    level_system.reload()
+
+
 class TestLevelSystemInitialization:
     """Tests for LevelSystem initialization."""
     
@@ -63,20 +78,32 @@ class TestLevelSystemInitialization:
             levels = level_system.get_all_levels(theme)
             assert len(levels) > 0, f"No levels created for {theme}"
     
-    def test_mario_levels_count(self, level_system):
-        """Test that Mario theme has correct number of levels."""
-        levels = level_system.get_all_levels(Theme.MARIO)
-        assert len(levels) == len(MARIO_LEVELS)
-    
-    def test_zelda_levels_count(self, level_system):
-        """Test that Zelda theme has correct number of levels."""
-        levels = level_system.get_all_levels(Theme.ZELDA)
-        assert len(levels) == len(ZELDA_LEVELS)
-    
-    def test_dkc_levels_count(self, level_system):
-        """Test that DKC theme has correct number of levels."""
-        levels = level_system.get_all_levels(Theme.DKC)
-        assert len(levels) == len(DKC_LEVELS)
+    @pytest.mark.parametrize("theme,expected", [
+        (Theme.MARIO, MARIO_LEVELS),
+        (Theme.ZELDA, ZELDA_LEVELS),
+        (Theme.DKC, DKC_LEVELS),
+    ])
+    def test_levels_count(self, level_system, theme, expected):
+        """Test that each theme has the correct number of levels."""
+        levels = level_system.get_all_levels(theme)
+        assert len(levels) == len(expected)
+    
+    def test_levels_loaded_lazily(self, data_manager, monkeypatch):
+        """Test that level state is read from the database on first use only."""
+        calls = []
+        load_levels = data_manager.load_levels
+        monkeypatch.setattr(data_manager, "load_levels", lambda: calls.append(1) or load_levels())
+        
+        system = LevelSystem(data_manager)
+        assert calls == []
+        
+        system.get_all_levels(Theme.MARIO)
+        system.get_level_progress()
+        assert calls == [1]
+    
+    def test_total_levels_constant(self):
+        """Test that TOTAL_LEVELS matches the level definitions."""
+        assert TOTAL_LEVELS == len(MARIO_LEVELS) + len(ZELDA_LEVELS) + len(DKC_LEVELS)
     
     def test_first_level_unlocked_by_default(self, level_system):
         """Test that the first level of each theme is unlocked by default."""
@@ -178,18 +205,16 @@ class TestCompleteLevel:
         level = level_system.get_level(level_id)
         assert level.completed
     
-    def test_complete_level_sets_completion_date(self, level_system):
+    def test_complete_level_sets_completion_date(self, level_system, monkeypatch):
         """Test that completing a level sets the completion date."""
         levels = level_system.get_all_levels(Theme.MARIO)
         level_id = levels[0].id
+        monkeypatch.setattr("core.level_system.datetime", _FrozenDateTime)
         
-        before = datetime.now()
         level_system.complete_level(level_id, 0.90)
-        after = datetime.now()
         
         level = level_system.get_level(level_id)
-        assert level.completion_date is not None
-        assert before <= level.completion_date <= after
+        assert level.completion_date == FROZEN_NOW
     
     def test_complete_level_updates_best_accuracy(self, level_system):
         """Test that completing a level updates best accuracy."""
@@ -321,15 +346,20 @@ class TestLevelRewards:
         assert second_reward.currency_earned < first_reward.currency_earned
         assert second_reward.currency_earned == first_reward.currency_earned // 2
     
-    def test_mario_powerup_at_95_percent(self, level_system):
-        """Test Mario theme awards mushroom at 95% accuracy."""
-        levels = level_system.get_all_levels(Theme.MARIO)
+    @pytest.mark.parametrize("theme,powerup_type", [
+        (Theme.MARIO, PowerUpType.MUSHROOM),
+        (Theme.ZELDA, PowerUpType.HEART_CONTAINER),
+        (Theme.DKC, PowerUpType.GOLDEN_BANANA),
+    ])
+    def test_powerup_at_95_percent(self, level_system, theme, powerup_type):
+        """Test each theme's power-up award at 95% accuracy."""
+        levels = level_system.get_all_levels(theme)
         level_id = levels[0].id
         
         reward = level_system.complete_level(level_id, 0.95)
         
         assert reward.powerup_earned is not None
-        assert reward.powerup_earned.type == PowerUpType.MUSHROOM
+        assert reward.powerup_earned.type == powerup_type
     
     def test_mario_powerup_at_98_percent(self, level_system):
         """Test Mario theme awards fire flower at 98% accuracy."""
@@ -358,26 +388,6 @@ class TestLevelRewards:
         assert reward.powerup_earned is not None
         assert reward.powerup_earned.type == PowerUpType.STAR
     
-    def test_zelda_powerup_at_95_percent(self, level_system):
-        """Test Zelda theme awards heart container at 95% accuracy."""
-        levels = level_system.get_all_levels(Theme.ZELDA)
-        level_id = levels[0].id
-        
-        reward = level_system.complete_level(level_id, 0.95)
-        
-        assert reward.powerup_earned is not None
-        assert reward.powerup_earned.type == PowerUpType.HEART_CONTAINER
-    
-    def test_dkc_powerup_at_95_percent(self, level_system):
-        """Test DKC theme awards golden banana at 95% accuracy."""
-        levels = level_system.get_all_levels(Theme.DKC)
-        level_id = levels[0].id
-        
-        reward = level_system.complete_level(level_id, 0.95)
-        
-        assert reward.powerup_earned is not None
-        assert reward.powerup_earned.type == PowerUpType.GOLDEN_BANANA
-    
     def test_no_powerup_on_replay(self, level_system):
         """Test that replaying a level doesn't award power-ups."""
         levels = level_system.get_all_levels(Theme.MARIO)
@@ -445,8 +455,7 @@ class TestGetLevelProgress:
         progress = level_system.get_level_progress()
         
         # Total levels should be sum of all theme levels
-        expected_total = len(MARIO_LEVELS) + len(ZELDA_LEVELS) + len(DKC_LEVELS)
-        assert progress.total_levels == expected_total
+        assert progress.total_levels == TOTAL_LEVELS
         
         # Initially 3 levels unlocked (one per theme)
         assert progress.levels_unlocked == 3
@@ -537,6 +546,14 @@ class TestHelperMethods:
         assert level is not None
         assert level.id == level_id
     
+    def test_get_all_levels_without_theme(self, level_system):
+        """Test that get_all_levels() returns every theme's levels in order."""
+        levels = level_system.get_all_levels()
+        
+        expected = [level for theme in Theme for level in level_system.get_all_levels(theme)]
+        assert levels == expected
+        assert len(levels) == TOTAL_LEVELS
+    
     def test_get_nonexistent_level(self, level_system):
         """Test getting a nonexistent level returns None."""
         level = level_system.get_level("nonexistent_id")
@@ -627,13 +644,22 @@ class TestHelperMethods:
         zelda_levels = level_system.get_all_levels(Theme.ZELDA)
         assert not zelda_levels[1].unlocked
     
+    def test_unlock_all_levels_single_write(self, level_system, data_manager, monkeypatch):
+        """Test that unlock_all_levels persists with one write, not one per level."""
+        calls = []
+        monkeypatch.setattr(data_manager, "save_levels", calls.append)
+        
+        level_system.unlock_all_levels()
+        
+        assert len(calls) == 1
+        assert len(calls[0]) == TOTAL_LEVELS
+    
     def test_unlock_all_levels_all_themes(self, level_system):
         """Test unlock_all_levels for all themes."""
         count = level_system.unlock_all_levels()
         
         # Should unlock all except the 3 initially unlocked
-        total_levels = len(MARIO_LEVELS) + len(ZELDA_LEVELS) + len(DKC_LEVELS)
-        assert count == total_levels - 3
+        assert count == TOTAL_LEVELS - 3
         
         # All levels should be unlocked
         for theme in Theme:
@@ -694,3 +720,14 @@ class TestPersistence:
         # Verify progress matches
         assert new_progress.levels_unlocked == original_progress.levels_unlocked
         assert new_progress.levels_completed == original_progress.levels_completed
+    
+    def test_reload_restores_persisted_state(self, level_system):
+        """Test that reload() discards changes that were never saved."""
+        level_system.unlock_level(Theme.MARIO)
+        level_system.get_all_levels(Theme.MARIO)[2].unlocked = True
+        
+        level_system.reload()
+        
+        levels = level_system.get_all_levels(Theme.MARIO)
+        assert levels[1].unlocked
+        assert not levels[2].unlocked
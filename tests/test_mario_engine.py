@@ -22,27 +22,54 @@ from data.models import (
     AnimationType,
     Collectible,
     CollectibleType,
+    GameState,
     Level,
     LevelView,
     PowerUp,
     PowerUpType,
+    ProgressionState,
     Theme,
     ThemeStats,
 )
 
 
+# Level fixtures shared by the level selection tests; MarioEngine reads its
+# own copies back from the database, so these are never mutated.
+_PARTLY_UNLOCKED_LEVELS = (
+    Level(id="mario_1", theme=Theme.MARIO, level_number=1, name="Level 1-1", unlocked=True, completed=True),
+    Level(id="mario_2", theme=Theme.MARIO, level_number=2, name="Level 1-2", unlocked=True, completed=False),
+    Level(id="mario_3", theme=Theme.MARIO, level_number=3, name="Level 1-3", unlocked=False, completed=False),
+)
+
+_MIXED_THEME_LEVELS = (
+    Level(id="mario_1", theme=Theme.MARIO, level_number=1, name="Mario Level", unlocked=True),
+    Level(id="zelda_1", theme=Theme.ZELDA, level_number=1, name="Zelda Level", unlocked=True),
+    Level(id="dkc_1", theme=Theme.DKC, level_number=1, name="DKC Level", unlocked=True),
+)
+
+_UNSORTED_LEVELS = (
+    Level(id="mario_3", theme=Theme.MARIO, level_number=3, name="Level 3", unlocked=True),
+    Level(id="mario_1", theme=Theme.MARIO, level_number=1, name="Level 1", unlocked=True),
+    Level(id="mario_2", theme=Theme.MARIO, level_number=2, name="Level 2", unlocked=True),
+)
+
+
 @pytest.fixture
-def temp_db_path(tmp_path):
-    """Create a temporary database path for testing."""
-    return tmp_path / "test_nintendanki.db"
+def data_manager(db_template):
+    """Create a DataManager backed by an in-memory database."""
+    dm = DataManager(":memory:")
+    db_template.backup(dm._get_connection())
+    yield dm
+    dm.close()
 
 
 @pytest.fixture
-def data_manager(temp_db_path):
-    """Create a DataManager with a temporary database."""
-    dm = DataManager(temp_db_path)
+def file_data_manager(tmp_path):
+    """Create a DataManager with a file database for persistence tests."""
+    dm = DataManager(tmp_path / "test_nintendanki.db")
     dm.initialize_database()
-    return dm
+    yield dm
+    dm.close()
 
 
 @pytest.fixture
@@ -51,24 +78,67 @@ def mario_engine(data_manager):
     return MarioEngine(data_manager)
 
 
+@pytest.fixture
+def make_engine(data_manager, mario_engine):
+    """Factory that persists the given levels and returns the test's engine.
+    
+    MarioEngine reads levels from the database on every view request, so
+    the engine built by the mario_engine fixture sees them without being
+    constructed a second time.
+    """
+    def _make(levels):
+        # A fresh database has default state, so there is nothing to load
+        data_manager.save_state(
+            GameState(progression=ProgressionState(), levels=levels)
+        )
+        return mario_engine
+    return _make
+
+
+@pytest.fixture(scope="module")
+def shared_engine(db_template):
+    """Create one MarioEngine per module for tests that never mutate state."""
+    dm = DataManager(":memory:")
+    db_template.backup(dm._get_connection())
+    yield MarioEngine(dm)
+    dm.close()
+
+
+@pytest.fixture(scope="module")
+def correct_animation(shared_engine):
+    """Animation for a correct answer, built once per module."""
+    return shared_engine.get_animation_for_correct()
+
+
+@pytest.fixture(scope="module")
+def wrong_animation(shared_engine):
+    """Animation for a wrong answer, built once per module."""
+    return shared_engine.get_animation_for_wrong()
+
+
+@pytest.fixture(scope="module")
+def correct_collectible(shared_engine):
+    """Collectible for a correct answer, built once per module."""
+    return shared_engine.get_collectible_for_correct()
+
+
 class TestMarioEngineInitialization:
     """Tests for MarioEngine initialization."""
     
-    def test_mario_engine_is_theme_engine(self, mario_engine):
+    def test_mario_engine_is_theme_engine(self, shared_engine):
         """Test that MarioEngine is a ThemeEngine subclass."""
-        assert isinstance(mario_engine, ThemeEngine)
+        assert isinstance(shared_engine, ThemeEngine)
     
     def test_mario_engine_initializes_with_data_manager(self, data_manager):
         """Test that MarioEngine initializes with a DataManager."""
         engine = MarioEngine(data_manager)
         assert engine.data_manager is data_manager
     
+    @pytest.mark.slow
     def test_mario_engine_loads_coin_count(self, data_manager):
         """Test that MarioEngine loads coin count from database."""
         # Set up coins in database
-        state = data_manager.load_state()
-        state.theme_specific[Theme.MARIO].coins = 100
-        data_manager.save_state(state)
+        data_manager.update_theme_state(Theme.MARIO, coins=100)
         
         # Create engine - should load coins
         engine = MarioEngine(data_manager)
@@ -81,36 +151,15 @@ class TestGetAnimationForCorrect:
     Requirements: 4.2, 4.7
     """
     
-    def test_returns_animation(self, mario_engine):
-        """Test that get_animation_for_correct returns an Animation."""
-        animation = mario_engine.get_animation_for_correct()
+    def test_animation_for_correct(self, correct_animation):
+        """Test the coin collection animation played for a correct answer."""
+        animation = correct_animation
+        
         assert isinstance(animation, Animation)
-    
-    def test_animation_type_is_collect(self, mario_engine):
-        """Test that animation type is COLLECT for coin collection."""
-        animation = mario_engine.get_animation_for_correct()
         assert animation.type == AnimationType.COLLECT
-    
-    def test_animation_theme_is_mario(self, mario_engine):
-        """Test that animation theme is MARIO."""
-        animation = mario_engine.get_animation_for_correct()
-        assert animation.theme == Theme.MARIO
-    
-    def test_animation_has_sprite_sheet(self, mario_engine):
-        """Test that animation has a sprite sheet path."""
-        animation = mario_engine.get_animation_for_correct()
         assert animation.sprite_sheet is not None
-        assert "mario" in animation.sprite_sheet.lower()
-    
-    def test_animation_has_frames(self, mario_engine):
-        """Test that animation has frame data."""
-        animation = mario_engine.get_animation_for_correct()
         assert len(animation.frames) > 0
-    
-    def test_animation_fps_is_valid(self, mario_engine):
-        """Test that animation FPS is at least 30 (Requirement 9.2)."""
-        animation = mario_engine.get_animation_for_correct()
-        assert animation.fps >= 30
+        assert animation.fps >= 30  # Requirement 9.2
 
 
 class TestGetAnimationForWrong:
@@ -119,30 +168,13 @@ class TestGetAnimationForWrong:
     Requirements: 4.3, 4.7
     """
     
-    def test_returns_animation(self, mario_engine):
-        """Test that get_animation_for_wrong returns an Animation."""
-        animation = mario_engine.get_animation_for_wrong()
+    def test_animation_for_wrong(self, wrong_animation):
+        """Test the damage animation played for a wrong answer."""
+        animation = wrong_animation
+        
         assert isinstance(animation, Animation)
-    
-    def test_animation_type_is_damage(self, mario_engine):
-        """Test that animation type is DAMAGE."""
-        animation = mario_engine.get_animation_for_wrong()
         assert animation.type == AnimationType.DAMAGE
-    
-    def test_animation_theme_is_mario(self, mario_engine):
-        """Test that animation theme is MARIO."""
-        animation = mario_engine.get_animation_for_wrong()
-        assert animation.theme == Theme.MARIO
-    
-    def test_animation_has_sprite_sheet(self, mario_engine):
-        """Test that animation has a sprite sheet path."""
-        animation = mario_engine.get_animation_for_wrong()
         assert animation.sprite_sheet is not None
-        assert "mario" in animation.sprite_sheet.lower()
-    
-    def test_animation_has_frames(self, mario_engine):
-        """Test that animation has frame data."""
-        animation = mario_engine.get_animation_for_wrong()
         assert len(animation.frames) > 0
 
 
@@ -152,24 +184,12 @@ class TestGetCollectibleForCorrect:
     Requirements: 4.2
     """
     
-    def test_returns_collectible(self, mario_engine):
-        """Test that get_collectible_for_correct returns a Collectible."""
-        collectible = mario_engine.get_collectible_for_correct()
+    def test_collectible_for_correct(self, correct_collectible):
+        """Test the owned Mario coin returned for a correct answer."""
+        collectible = correct_collectible
+        
         assert isinstance(collectible, Collectible)
-    
-    def test_collectible_is_coin(self, mario_engine):
-        """Test that collectible is a coin."""
-        collectible = mario_engine.get_collectible_for_correct()
         assert collectible.type == CollectibleType.COIN
-    
-    def test_collectible_theme_is_mario(self, mario_engine):
-        """Test that collectible theme is MARIO."""
-        collectible = mario_engine.get_collectible_for_correct()
-        assert collectible.theme == Theme.MARIO
-    
-    def test_collectible_is_owned(self, mario_engine):
-        """Test that collectible is marked as owned."""
-        collectible = mario_engine.get_collectible_for_correct()
         assert collectible.owned is True
 
 
@@ -179,90 +199,45 @@ class TestGetPowerupForAccuracy:
     Requirements: 4.4, 4.5, 4.6
     """
     
-    def test_no_powerup_below_95_percent(self, mario_engine):
-        """Test that no power-up is awarded below 95% accuracy."""
-        assert mario_engine.get_powerup_for_accuracy(0.0) is None
-        assert mario_engine.get_powerup_for_accuracy(0.5) is None
-        assert mario_engine.get_powerup_for_accuracy(0.94) is None
-        assert mario_engine.get_powerup_for_accuracy(0.949) is None
-    
-    def test_mushroom_at_95_percent(self, mario_engine):
-        """Test that mushroom is awarded at exactly 95% accuracy.
+    @pytest.mark.parametrize("accuracy,expected_type,expected_threshold", [
+        # No power-up below 95% or for out-of-range accuracy
+        (-0.1, None, None),
+        (0.0, None, None),
+        (0.5, None, None),
+        (0.94, None, None),
+        (0.949, None, None),
+        (1.1, None, None),
+        (2.0, None, None),
+        # Mushroom at 95%+ (Requirement 4.4)
+        (0.95, PowerUpType.MUSHROOM, 0.95),
+        (0.96, PowerUpType.MUSHROOM, 0.95),
+        (0.97, PowerUpType.MUSHROOM, 0.95),
+        (0.979, PowerUpType.MUSHROOM, 0.95),
+        # Fire flower at 98%+ (Requirement 4.5)
+        (0.98, PowerUpType.FIRE_FLOWER, 0.98),
+        (0.99, PowerUpType.FIRE_FLOWER, 0.98),
+        (0.999, PowerUpType.FIRE_FLOWER, 0.98),
+        # Star at 100% (Requirement 4.6)
+        (1.0, PowerUpType.STAR, 1.0),
+    ])
+    def test_powerup_for_accuracy(self, shared_engine, accuracy, expected_type, expected_threshold):
+        """Test the accuracy to power-up mapping.
         
-        Requirements: 4.4
+        Requirements: 4.4, 4.5, 4.6
         """
-        result = mario_engine.get_powerup_for_accuracy(0.95)
-        
-        assert result is not None
-        assert isinstance(result, MarioPowerUp)
-        assert result.powerup.type == PowerUpType.MUSHROOM
-        assert result.accuracy_threshold == 0.95
-    
-    def test_mushroom_between_95_and_98_percent(self, mario_engine):
-        """Test that mushroom is awarded between 95% and 98% accuracy.
-        
-        Requirements: 4.4
-        """
-        result = mario_engine.get_powerup_for_accuracy(0.96)
-        assert result.powerup.type == PowerUpType.MUSHROOM
-        
-        result = mario_engine.get_powerup_for_accuracy(0.97)
-        assert result.powerup.type == PowerUpType.MUSHROOM
+        result = shared_engine.get_powerup_for_accuracy(accuracy)
         
-        result = mario_engine.get_powerup_for_accuracy(0.979)
-        assert result.powerup.type == PowerUpType.MUSHROOM
-    
-    def test_fire_flower_at_98_percent(self, mario_engine):
-        """Test that fire flower is awarded at exactly 98% accuracy.
-        
-        Requirements: 4.5
-        """
-        result = mario_engine.get_powerup_for_accuracy(0.98)
-        
-        assert result is not None
-        assert isinstance(result, MarioPowerUp)
-        assert result.powerup.type == PowerUpType.FIRE_FLOWER
-        assert result.accuracy_threshold == 0.98
-    
-    def test_fire_flower_between_98_and_100_percent(self, mario_engine):
-        """Test that fire flower is awarded between 98% and 100% accuracy.
-        
-        Requirements: 4.5
-        """
-        result = mario_engine.get_powerup_for_accuracy(0.99)
-        assert result.powerup.type == PowerUpType.FIRE_FLOWER
-        
-        result = mario_engine.get_powerup_for_accuracy(0.999)
-        assert result.powerup.type == PowerUpType.FIRE_FLOWER
-    
-    def test_star_at_100_percent(self, mario_engine):
-        """Test that star is awarded at exactly 100% accuracy.
-        
-        Requirements: 4.6
-        """
-        result = mario_engine.get_powerup_for_accuracy(1.0)
-        
-        assert result is not None
-        assert isinstance(result, MarioPowerUp)
-        assert result.powerup.type == PowerUpType.STAR
-        assert result.accuracy_threshold == 1.0
-    
-    def test_invalid_accuracy_returns_none(self, mario_engine):
-        """Test that invalid accuracy values return None."""
-        assert mario_engine.get_powerup_for_accuracy(-0.1) is None
-        assert mario_engine.get_powerup_for_accuracy(1.1) is None
-        assert mario_engine.get_powerup_for_accuracy(2.0) is None
-    
-    def test_powerup_has_correct_theme(self, mario_engine):
-        """Test that all power-ups have Mario theme."""
-        for accuracy in [0.95, 0.98, 1.0]:
-            result = mario_engine.get_powerup_for_accuracy(accuracy)
-            assert result.powerup.theme == Theme.MARIO
-    
-    def test_powerup_has_description(self, mario_engine):
+        if expected_type is None:
+            assert result is None
+        else:
+            assert isinstance(result, MarioPowerUp)
+            assert result.powerup.type == expected_type
+            assert result.accuracy_threshold == expected_threshold
+    
+    def test_powerup_has_description(self, shared_engine):
         """Test that all power-ups have descriptions."""
         for accuracy in [0.95, 0.98, 1.0]:
-            result = mario_engine.get_powerup_for_accuracy(accuracy)
+            result = shared_engine.get_powerup_for_accuracy(accuracy)
             assert result.powerup.description is not None
             assert len(result.powerup.description) > 0
             assert result.effect_description is not None
@@ -275,92 +250,43 @@ class TestGetLevelSelectionView:
     Requirements: 4.8
     """
     
-    def test_returns_level_selection_view(self, mario_engine):
-        """Test that get_level_selection_view returns a LevelSelectionView."""
-        view = mario_engine.get_level_selection_view()
+    def test_view_has_levels_and_world_name(self, shared_engine):
+        """Test that the view has a levels list and a world name."""
+        view = shared_engine.get_level_selection_view()
         assert isinstance(view, LevelSelectionView)
-    
-    def test_view_has_levels_list(self, mario_engine):
-        """Test that view has a levels list."""
-        view = mario_engine.get_level_selection_view()
         assert isinstance(view.levels, list)
-    
-    def test_view_has_world_name(self, mario_engine):
-        """Test that view has a world name."""
-        view = mario_engine.get_level_selection_view()
         assert view.world_name is not None
         assert "World" in view.world_name
     
-    def test_view_has_background(self, mario_engine):
-        """Test that view has a background image path."""
-        view = mario_engine.get_level_selection_view()
-        assert view.background is not None
-        assert "mario" in view.background.lower()
-    
-    def test_view_with_unlocked_levels(self, data_manager):
+    @pytest.mark.slow
+    def test_view_with_unlocked_levels(self, make_engine):
         """Test view shows unlocked levels correctly."""
-        # Add some Mario levels
-        state = data_manager.load_state()
-        state.levels = [
-            Level(id="mario_1", theme=Theme.MARIO, level_number=1, name="Level 1-1", unlocked=True, completed=True),
-            Level(id="mario_2", theme=Theme.MARIO, level_number=2, name="Level 1-2", unlocked=True, completed=False),
-            Level(id="mario_3", theme=Theme.MARIO, level_number=3, name="Level 1-3", unlocked=False, completed=False),
-        ]
-        data_manager.save_state(state)
-        
-        engine = MarioEngine(data_manager)
-        view = engine.get_level_selection_view()
+        view = make_engine(list(_PARTLY_UNLOCKED_LEVELS)).get_level_selection_view()
         
         assert len(view.levels) == 3
         # Current level should be the first unlocked but not completed
         assert view.current_level is not None
         assert view.current_level.id == "mario_2"
     
-    def test_view_only_shows_mario_levels(self, data_manager):
+    @pytest.mark.slow
+    def test_view_only_shows_mario_levels(self, make_engine):
         """Test that view only shows Mario theme levels."""
-        # Add levels from different themes
-        state = data_manager.load_state()
-        state.levels = [
-            Level(id="mario_1", theme=Theme.MARIO, level_number=1, name="Mario Level", unlocked=True),
-            Level(id="zelda_1", theme=Theme.ZELDA, level_number=1, name="Zelda Level", unlocked=True),
-            Level(id="dkc_1", theme=Theme.DKC, level_number=1, name="DKC Level", unlocked=True),
-        ]
-        data_manager.save_state(state)
-        
-        engine = MarioEngine(data_manager)
-        view = engine.get_level_selection_view()
+        view = make_engine(list(_MIXED_THEME_LEVELS)).get_level_selection_view()
         
         assert len(view.levels) == 1
         assert all(l.theme == Theme.MARIO for l in view.levels)
     
-    def test_view_levels_sorted_by_number(self, data_manager):
+    @pytest.mark.slow
+    def test_view_levels_sorted_by_number(self, make_engine):
         """Test that levels are sorted by level number."""
-        state = data_manager.load_state()
-        state.levels = [
-            Level(id="mario_3", theme=Theme.MARIO, level_number=3, name="Level 3", unlocked=True),
-            Level(id="mario_1", theme=Theme.MARIO, level_number=1, name="Level 1", unlocked=True),
-            Level(id="mario_2", theme=Theme.MARIO, level_number=2, name="Level 2", unlocked=True),
-        ]
-        data_manager.save_state(state)
-        
-        engine = MarioEngine(data_manager)
-        view = engine.get_level_selection_view()
+        view = make_engine(list(_UNSORTED_LEVELS)).get_level_selection_view()
         
-        assert view.levels[0].level_number == 1
-        assert view.levels[1].level_number == 2
-        assert view.levels[2].level_number == 3
+        assert [l.level_number for l in view.levels] == [1, 2, 3]
     
-    def test_view_has_level_positions(self, data_manager):
+    @pytest.mark.slow
+    def test_view_has_level_positions(self, make_engine):
         """Test that view has positions for each level."""
-        state = data_manager.load_state()
-        state.levels = [
-            Level(id="mario_1", theme=Theme.MARIO, level_number=1, name="Level 1", unlocked=True),
-            Level(id="mario_2", theme=Theme.MARIO, level_number=2, name="Level 2", unlocked=True),
-        ]
-        data_manager.save_state(state)
-        
-        engine = MarioEngine(data_manager)
-        view = engine.get_level_selection_view()
+        view = make_engine(list(_UNSORTED_LEVELS[1:])).get_level_selection_view()
         
         assert len(view.level_positions) == 2
         assert "mario_1" in view.level_positions
@@ -373,40 +299,28 @@ class TestGetLevelView:
     Requirements: 4.1
     """
     
-    def test_returns_level_view(self, mario_engine):
-        """Test that get_level_view returns a LevelView."""
-        level = Level(id="test_level", theme=Theme.MARIO, level_number=1, name="Test Level")
-        view = mario_engine.get_level_view(level)
-        assert isinstance(view, LevelView)
-    
-    def test_level_view_has_background(self, mario_engine):
-        """Test that level view has a background image."""
-        level = Level(id="test_level", theme=Theme.MARIO, level_number=1, name="Test Level")
-        view = mario_engine.get_level_view(level)
-        assert view.background is not None
-        assert "mario" in view.background.lower()
-    
-    def test_level_view_has_character_position(self, mario_engine):
+    def test_level_view_has_character_position(self, shared_engine):
         """Test that level view has a character starting position."""
         level = Level(id="test_level", theme=Theme.MARIO, level_number=1, name="Test Level")
-        view = mario_engine.get_level_view(level)
+        view = shared_engine.get_level_view(level)
+        assert isinstance(view, LevelView)
         assert view.character_position is not None
         assert len(view.character_position) == 2
     
-    def test_level_view_has_collectibles(self, mario_engine):
+    def test_level_view_has_collectibles(self, shared_engine):
         """Test that level view has collectibles."""
         level = Level(id="test_level", theme=Theme.MARIO, level_number=1, name="Test Level")
-        view = mario_engine.get_level_view(level)
+        view = shared_engine.get_level_view(level)
         assert isinstance(view.collectibles_visible, list)
         assert len(view.collectibles_visible) > 0
     
-    def test_higher_levels_have_more_collectibles(self, mario_engine):
+    def test_higher_levels_have_more_collectibles(self, shared_engine):
         """Test that higher level numbers have more collectibles."""
         level1 = Level(id="level_1", theme=Theme.MARIO, level_number=1, name="Level 1")
         level5 = Level(id="level_5", theme=Theme.MARIO, level_number=5, name="Level 5")
         
-        view1 = mario_engine.get_level_view(level1)
-        view5 = mario_engine.get_level_view(level5)
+        view1 = shared_engine.get_level_view(level1)
+        view5 = shared_engine.get_level_view(level5)
         
         assert len(view5.collectibles_visible) > len(view1.collectibles_visible)
 
@@ -414,38 +328,24 @@ class TestGetLevelView:
 class TestGetDashboardStats:
     """Tests for get_dashboard_stats method."""
     
-    def test_returns_theme_stats(self, mario_engine):
-        """Test that get_dashboard_stats returns ThemeStats."""
-        stats = mario_engine.get_dashboard_stats()
+    def test_stats_names_coins_and_stars(self, shared_engine):
+        """Test that stats use coins as primary collectible and stars as secondary stat."""
+        stats = shared_engine.get_dashboard_stats()
         assert isinstance(stats, ThemeStats)
-    
-    def test_stats_theme_is_mario(self, mario_engine):
-        """Test that stats theme is MARIO."""
-        stats = mario_engine.get_dashboard_stats()
-        assert stats.theme == Theme.MARIO
-    
-    def test_stats_primary_collectible_is_coins(self, mario_engine):
-        """Test that primary collectible is coins."""
-        stats = mario_engine.get_dashboard_stats()
         assert stats.primary_collectible_name == "Coins"
-    
-    def test_stats_secondary_stat_is_stars(self, mario_engine):
-        """Test that secondary stat is stars."""
-        stats = mario_engine.get_dashboard_stats()
         assert stats.secondary_stat_name == "Stars"
     
-    def test_stats_reflects_coin_count(self, data_manager):
+    @pytest.mark.slow
+    def test_stats_reflects_coin_count(self, data_manager, mario_engine):
         """Test that stats reflects actual coin count."""
-        state = data_manager.load_state()
-        state.theme_specific[Theme.MARIO].coins = 42
-        data_manager.save_state(state)
+        data_manager.update_theme_state(Theme.MARIO, coins=42)
         
-        engine = MarioEngine(data_manager)
-        stats = engine.get_dashboard_stats()
+        stats = mario_engine.get_dashboard_stats()
         
         assert stats.primary_collectible_count == 42
     
-    def test_stats_reflects_star_count(self, data_manager):
+    @pytest.mark.slow
+    def test_stats_reflects_star_count(self, data_manager, mario_engine):
         """Test that stats reflects star power-ups earned."""
         state = data_manager.load_state()
         state.powerups = [
@@ -461,8 +361,7 @@ class TestGetDashboardStats:
         ]
         data_manager.save_state(state)
         
-        engine = MarioEngine(data_manager)
-        stats = engine.get_dashboard_stats()
+        stats = mario_engine.get_dashboard_stats()
         
         assert stats.secondary_stat_value == 3
 
@@ -473,32 +372,51 @@ class TestSpriteAnimations:
     Requirements: 4.7
     """
     
-    def test_get_run_animation(self, mario_engine):
-        """Test get_run_animation returns valid animation."""
-        animation = mario_engine.get_run_animation()
+    @pytest.mark.parametrize("method,animation_type,loop", [
+        ("get_run_animation", AnimationType.RUN, True),     # Running loops
+        ("get_jump_animation", AnimationType.JUMP, False),  # Jump plays once
+        ("get_idle_animation", AnimationType.IDLE, True),   # Idle loops
+    ])
+    def test_sprite_animation(self, shared_engine, method, animation_type, loop):
+        """Test each sprite animation method returns a valid animation."""
+        animation = getattr(shared_engine, method)()
         
         assert isinstance(animation, Animation)
-        assert animation.type == AnimationType.RUN
-        assert animation.theme == Theme.MARIO
-        assert animation.loop is True  # Running should loop
+        assert animation.type == animation_type
+        assert animation.loop is loop
+
+
+class TestMarioTheming:
+    """Checks that every engine output is Mario themed.
     
-    def test_get_jump_animation(self, mario_engine):
-        """Test get_jump_animation returns valid animation."""
-        animation = mario_engine.get_jump_animation()
-        
-        assert isinstance(animation, Animation)
-        assert animation.type == AnimationType.JUMP
-        assert animation.theme == Theme.MARIO
-        assert animation.loop is False  # Jump should not loop
+    Requirements: 4.1, 4.2, 4.3, 4.7
+    """
     
-    def test_get_idle_animation(self, mario_engine):
-        """Test get_idle_animation returns valid animation."""
-        animation = mario_engine.get_idle_animation()
+    def test_all_outputs_are_mario_themed(self, shared_engine, correct_animation,
+                                          wrong_animation, correct_collectible):
+        """Test that animations, collectibles, power-ups and views use Mario assets."""
+        animations = [correct_animation, wrong_animation] + [
+            getattr(shared_engine, method)()
+            for method in ("get_run_animation", "get_jump_animation", "get_idle_animation")
+        ]
+        for animation in animations:
+            assert animation.theme == Theme.MARIO
+        for animation in (correct_animation, wrong_animation):
+            assert "mario" in animation.sprite_sheet.lower()
         
-        assert isinstance(animation, Animation)
-        assert animation.type == AnimationType.IDLE
-        assert animation.theme == Theme.MARIO
-        assert animation.loop is True  # Idle should loop
+        assert correct_collectible.theme == Theme.MARIO
+        
+        for accuracy in [0.95, 0.98, 1.0]:
+            result = shared_engine.get_powerup_for_accuracy(accuracy)
+            assert result.powerup.theme == Theme.MARIO
+        
+        assert shared_engine.get_dashboard_stats().theme == Theme.MARIO
+        
+        level = Level(id="test_level", theme=Theme.MARIO, level_number=1, name="Test Level")
+        for view in (shared_engine.get_level_selection_view(),
+                     shared_engine.get_level_view(level)):
+            assert view.background is not None
+            assert "mario" in view.background.lower()
 
 
 class TestCoinManagement:
@@ -510,15 +428,20 @@ class TestCoinManagement:
         mario_engine.add_coin()
         assert mario_engine.get_coin_count() == initial + 1
     
-    def test_add_coin_persists_to_database(self, data_manager):
+    @pytest.mark.slow
+    def test_add_coin_persists_to_database(self, file_data_manager):
         """Test that add_coin persists to database."""
-        engine = MarioEngine(data_manager)
+        engine = MarioEngine(file_data_manager)
         engine.add_coin()
         engine.add_coin()
+        file_data_manager.close()
         
-        # Create new engine to verify persistence
-        engine2 = MarioEngine(data_manager)
-        assert engine2.get_coin_count() == 2
+        # Reopen the database file to verify persistence
+        reopened = DataManager(file_data_manager.db_path)
+        try:
+            assert MarioEngine(reopened).get_coin_count() == 2
+        finally:
+            reopened.close()
     
     def test_add_coin_returns_new_count(self, mario_engine):
         """Test that add_coin returns the new count."""
@@ -530,19 +453,15 @@ class TestCoinManagement:
 class TestMarioPowerUpDataclass:
     """Tests for MarioPowerUp dataclass."""
     
-    def test_mario_powerup_has_powerup(self, mario_engine):
-        """Test that MarioPowerUp contains a PowerUp."""
-        result = mario_engine.get_powerup_for_accuracy(0.95)
+    def test_mario_powerup_has_powerup_and_threshold(self, shared_engine):
+        """Test that MarioPowerUp contains a PowerUp and its accuracy threshold."""
+        result = shared_engine.get_powerup_for_accuracy(0.95)
         assert isinstance(result.powerup, PowerUp)
-    
-    def test_mario_powerup_has_threshold(self, mario_engine):
-        """Test that MarioPowerUp has accuracy threshold."""
-        result = mario_engine.get_powerup_for_accuracy(0.95)
         assert result.accuracy_threshold == 0.95
     
-    def test_mario_powerup_has_effect_description(self, mario_engine):
+    def test_mario_powerup_has_effect_description(self, shared_engine):
         """Test that MarioPowerUp has effect description."""
-        result = mario_engine.get_powerup_for_accuracy(0.95)
+        result = shared_engine.get_powerup_for_accuracy(0.95)
         assert result.effect_description is not None
         assert "95%" in result.effect_description
 
@@ -11,7 +11,6 @@ Requirements tested: 7.6, 7.7
 """
 
 import pytest
-from unittest.mock import MagicMock
 
 from integration.menu_integration import (
     MenuIntegration,
@@ -20,38 +19,87 @@ from integration.menu_integration import (
 )
 
 
+# Entry texts registered by MenuIntegration, bound once for the whole module
+MENU_DASHBOARD = MenuIntegration.MENU_DASHBOARD
+MENU_GAME_WINDOW = MenuIntegration.MENU_GAME_WINDOW
+MENU_SETTINGS = MenuIntegration.MENU_SETTINGS
+TOOLBAR_GAME_WINDOW = MenuIntegration.TOOLBAR_GAME_WINDOW
+TOOLBAR_GAME_WINDOW_TOOLTIP = MenuIntegration.TOOLBAR_GAME_WINDOW_TOOLTIP
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
-def mock_menu_provider():
-    """Create a MockAnkiMenuProvider for testing."""
+@pytest.fixture(scope="session")
+def _shared_menu_provider():
+    """Create the single MockAnkiMenuProvider reused by every test."""
     return MockAnkiMenuProvider()
 
 
+@pytest.fixture
+def mock_menu_provider(_shared_menu_provider):
+    """Provide an empty MockAnkiMenuProvider for testing."""
+    _shared_menu_provider.reset()
+    return _shared_menu_provider
+
+
+def _NOOP() -> None:
+    """Shared callback for tests that never check whether it was called."""
+
+
+class _CallCounter:
+    """Callable that only counts how often it was called."""
+    
+    def __init__(self):
+        self.call_count = 0
+    
+    def __call__(self) -> None:
+        self.call_count += 1
+
+
+class _ShowStub:
+    """Lightweight stand-in for a UI component that only needs show()."""
+    
+    def __init__(self):
+        self.show_count = 0
+    
+    def show(self) -> None:
+        self.show_count += 1
+
+
+class _RaisingShowStub:
+    """UI component stand-in whose show() raises, for error-handling tests.
+    
+    The exception is only built when show() is called; show_count records
+    that the failing path was actually reached.
+    """
+    
+    def __init__(self, message: str):
+        self.message = message
+        self.show_count = 0
+    
+    def show(self) -> None:
+        self.show_count += 1
+        raise Exception(self.message)
+
+
 @pytest.fixture
 def mock_dashboard():
-    """Create a mock dashboard with show() method."""
-    dashboard = MagicMock()
-    dashboard.show = MagicMock()
-    return dashboard
+    """Create a stub dashboard with show() method."""
+    return _ShowStub()
 
 
 @pytest.fixture
 def mock_game_window():
-    """Create a mock game window with show() method."""
-    game_window = MagicMock()
-    game_window.show = MagicMock()
-    return game_window
+    """Create a stub game window with show() method."""
+    return _ShowStub()
 
 
 @pytest.fixture
 def mock_settings_panel():
-    """Create a mock settings panel with show() method."""
-    settings_panel = MagicMock()
-    settings_panel.show = MagicMock()
-    return settings_panel
+    """Create a stub settings panel with show() method."""
+    return _ShowStub()
 
 
 @pytest.fixture
@@ -70,6 +118,36 @@ def menu_integration(
     )
 
 
+@pytest.fixture
+def setup_integration(menu_integration):
+    """Yield the function-scoped MenuIntegration after setup().
+    
+    Tears it down afterwards unless the test already did.
+    """
+    menu_integration.setup()
+    yield menu_integration
+    if menu_integration.is_setup:
+        menu_integration.teardown()
+
+
+@pytest.fixture(scope="module")
+def setup_menu_integration():
+    """Create one fully set-up MenuIntegration per module.
+    
+    Only for tests that inspect the result of setup() without triggering
+    or tearing anything down. Returns (integration, provider).
+    """
+    provider = MockAnkiMenuProvider()
+    integration = MenuIntegration(
+        dashboard=_ShowStub(),
+        game_window=_ShowStub(),
+        settings_panel=_ShowStub(),
+        menu_provider=provider
+    )
+    integration.setup()
+    return integration, provider
+
+
 @pytest.fixture
 def menu_integration_no_deps(mock_menu_provider):
     """Create a MenuIntegration with no UI dependencies."""
@@ -85,100 +163,98 @@ def menu_integration_no_deps(mock_menu_provider):
 # MockAnkiMenuProvider Tests
 # ============================================================================
 
+# Per-kind (container name, add, has, get, remove) method names on the provider
+_PROVIDER_KINDS = {
+    "menu": ("Tools", "add_menu_item", "has_menu_item",
+             "get_menu_items", "remove_menu_item"),
+    "toolbar": ("main", "add_toolbar_button", "has_toolbar_button",
+                "get_toolbar_buttons", "remove_toolbar_button"),
+}
+
+
+def _add(provider, kind, text, callback, **kwargs):
+    """Add a menu item or toolbar button to the provider's default container."""
+    name, add, _, _, _ = _PROVIDER_KINDS[kind]
+    return getattr(provider, add)(name, text, callback, **kwargs)
+
+
+def _has(provider, kind, text):
+    """Check whether the provider's default container holds an entry."""
+    name, _, has, _, _ = _PROVIDER_KINDS[kind]
+    return getattr(provider, has)(name, text)
+
+
+def _get(provider, kind):
+    """Return all entries in the provider's default container."""
+    name, _, _, get, _ = _PROVIDER_KINDS[kind]
+    return getattr(provider, get)(name)
+
+
+def _remove(provider, kind, action):
+    """Remove an entry from the provider's default container."""
+    name, _, _, _, remove = _PROVIDER_KINDS[kind]
+    getattr(provider, remove)(name, action)
+
+
 class TestMockAnkiMenuProvider:
     """Tests for the MockAnkiMenuProvider class."""
     
-    def test_add_menu_item_creates_action(self, mock_menu_provider):
-        """Test that add_menu_item creates and returns an action."""
-        callback = MagicMock()
-        action = mock_menu_provider.add_menu_item(
-            menu_name="Tools",
-            item_text="Test Item",
-            callback=callback,
-            shortcut="Ctrl+T"
-        )
+    @pytest.mark.parametrize("kind,option,value", [
+        ("menu", "shortcut", "Ctrl+T"),
+        ("toolbar", "tooltip", "Test tooltip"),
+    ])
+    def test_add_creates_action(self, mock_menu_provider, kind, option, value):
+        """Test that adding a menu item or toolbar button returns an action."""
+        action = _add(mock_menu_provider, kind, "Test Entry", _NOOP,
+                      **{option: value})
         
         assert action is not None
         assert isinstance(action, MockAction)
-        assert action.text == "Test Item"
-        assert action.shortcut == "Ctrl+T"
-    
-    def test_add_menu_item_tracks_items(self, mock_menu_provider):
-        """Test that menu items are tracked in the provider."""
-        callback = MagicMock()
-        mock_menu_provider.add_menu_item(
-            menu_name="Tools",
-            item_text="Test Item",
-            callback=callback
-        )
-        
-        assert mock_menu_provider.has_menu_item("Tools", "Test Item")
-        items = mock_menu_provider.get_menu_items("Tools")
-        assert len(items) == 1
-        assert items[0]['text'] == "Test Item"
+        assert action.text == "Test Entry"
+        assert getattr(action, option) == value
     
-    def test_remove_menu_item(self, mock_menu_provider):
-        """Test that menu items can be removed."""
-        callback = MagicMock()
-        action = mock_menu_provider.add_menu_item(
-            menu_name="Tools",
-            item_text="Test Item",
-            callback=callback
-        )
+    @pytest.mark.parametrize("kind", ["menu", "toolbar"])
+    def test_add_tracks_and_remove_untracks(self, mock_menu_provider, kind):
+        """Test that added entries are tracked and can be removed."""
+        action = _add(mock_menu_provider, kind, "Test Entry", _NOOP)
         
-        assert mock_menu_provider.has_menu_item("Tools", "Test Item")
-        
-        mock_menu_provider.remove_menu_item("Tools", action)
+        assert _has(mock_menu_provider, kind, "Test Entry")
+        entries = _get(mock_menu_provider, kind)
+        assert len(entries) == 1
+        assert entries[0]['text'] == "Test Entry"
         
-        assert not mock_menu_provider.has_menu_item("Tools", "Test Item")
-    
-    def test_add_toolbar_button_creates_action(self, mock_menu_provider):
-        """Test that add_toolbar_button creates and returns an action."""
-        callback = MagicMock()
-        action = mock_menu_provider.add_toolbar_button(
-            toolbar_name="main",
-            button_text="Test Button",
-            callback=callback,
-            tooltip="Test tooltip"
-        )
+        _remove(mock_menu_provider, kind, action)
         
-        assert action is not None
-        assert isinstance(action, MockAction)
-        assert action.text == "Test Button"
-        assert action.tooltip == "Test tooltip"
+        assert not _has(mock_menu_provider, kind, "Test Entry")
     
-    def test_add_toolbar_button_tracks_buttons(self, mock_menu_provider):
-        """Test that toolbar buttons are tracked in the provider."""
-        callback = MagicMock()
-        mock_menu_provider.add_toolbar_button(
-            toolbar_name="main",
-            button_text="Test Button",
-            callback=callback
-        )
+    def test_add_menu_items_adds_in_order(self, mock_menu_provider):
+        """Test that add_menu_items adds every item and returns their actions."""
+        actions = mock_menu_provider.add_menu_items("Tools", [
+            ("Item 1", _NOOP, "Ctrl+1"),
+            ("Item 2", _NOOP, None),
+        ])
         
-        assert mock_menu_provider.has_toolbar_button("main", "Test Button")
-        buttons = mock_menu_provider.get_toolbar_buttons("main")
-        assert len(buttons) == 1
-        assert buttons[0]['text'] == "Test Button"
+        assert [action.text for action in actions] == ["Item 1", "Item 2"]
+        assert actions[0].shortcut == "Ctrl+1"
+        items = mock_menu_provider.get_menu_items("Tools")
+        assert [item['text'] for item in items] == ["Item 1", "Item 2"]
     
-    def test_remove_toolbar_button(self, mock_menu_provider):
-        """Test that toolbar buttons can be removed."""
-        callback = MagicMock()
-        action = mock_menu_provider.add_toolbar_button(
-            toolbar_name="main",
-            button_text="Test Button",
-            callback=callback
-        )
+    def test_re_adding_same_text_replaces_entry(self, mock_menu_provider):
+        """Test that adding an item with an existing text replaces it."""
+        first = mock_menu_provider.add_menu_item("Tools", "Test Item", _NOOP)
+        second = mock_menu_provider.add_menu_item("Tools", "Test Item", _NOOP)
         
-        assert mock_menu_provider.has_toolbar_button("main", "Test Button")
-        
-        mock_menu_provider.remove_toolbar_button("main", action)
+        items = mock_menu_provider.get_menu_items("Tools")
+        assert len(items) == 1
+        assert items[0]['action'] == second
         
-        assert not mock_menu_provider.has_toolbar_button("main", "Test Button")
+        # Removing the stale action leaves the current entry in place
+        mock_menu_provider.remove_menu_item("Tools", first)
+        assert mock_menu_provider.has_menu_item("Tools", "Test Item")
     
     def test_trigger_menu_item_calls_callback(self, mock_menu_provider):
         """Test that triggering a menu item calls its callback."""
-        callback = MagicMock()
+        callback = _CallCounter()
         mock_menu_provider.add_menu_item(
             menu_name="Tools",
             item_text="Test Item",
@@ -188,11 +264,11 @@ class TestMockAnkiMenuProvider:
         result = mock_menu_provider.trigger_menu_item("Tools", "Test Item")
         
         assert result is True
-        callback.assert_called_once()
+        assert callback.call_count == 1
     
     def test_trigger_toolbar_button_calls_callback(self, mock_menu_provider):
         """Test that triggering a toolbar button calls its callback."""
-        callback = MagicMock()
+        callback = _CallCounter()
         mock_menu_provider.add_toolbar_button(
             toolbar_name="main",
             button_text="Test Button",
@@ -202,19 +278,53 @@ class TestMockAnkiMenuProvider:
         result = mock_menu_provider.trigger_toolbar_button("main", "Test Button")
         
         assert result is True
-        callback.assert_called_once()
+        assert callback.call_count == 1
+    
+    @pytest.mark.parametrize("trigger_method,container", [
+        ("trigger_menu_item", "Tools"),
+        ("trigger_toolbar_button", "main"),
+    ])
+    def test_trigger_unknown_entry_returns_false(
+        self,
+        mock_menu_provider,
+        trigger_method,
+        container
+    ):
+        """Test that triggering a missing entry reports False."""
+        assert getattr(mock_menu_provider, trigger_method)(container, "Missing") is False
     
     def test_clear_all_removes_everything(self, mock_menu_provider):
         """Test that clear_all removes all items and buttons."""
-        callback = MagicMock()
-        mock_menu_provider.add_menu_item("Tools", "Item 1", callback)
-        mock_menu_provider.add_menu_item("Tools", "Item 2", callback)
-        mock_menu_provider.add_toolbar_button("main", "Button 1", callback)
+        mock_menu_provider.add_menu_item("Tools", "Item 1", _NOOP)
+        mock_menu_provider.add_menu_item("Tools", "Item 2", _NOOP)
+        mock_menu_provider.add_toolbar_button("main", "Button 1", _NOOP)
         
         mock_menu_provider.clear_all()
         
         assert len(mock_menu_provider.get_menu_items("Tools")) == 0
         assert len(mock_menu_provider.get_toolbar_buttons("main")) == 0
+    
+    def test_reset_restores_fresh_state(self, mock_menu_provider):
+        """Test that reset clears entries and restarts action ids."""
+        mock_menu_provider.add_menu_item("Tools", "Item 1", _NOOP)
+        mock_menu_provider.add_toolbar_button("main", "Button 1", _NOOP)
+        
+        mock_menu_provider.reset()
+        
+        assert len(mock_menu_provider.get_menu_items("Tools")) == 0
+        assert len(mock_menu_provider.get_toolbar_buttons("main")) == 0
+        action = mock_menu_provider.add_menu_item("Tools", "Item 1", _NOOP)
+        assert action.id == 1
+    
+    def test_providers_do_not_share_state(self, mock_menu_provider):
+        """Test that entries and action ids are per instance, not per class."""
+        mock_menu_provider.add_menu_item("Tools", "Item 1", _NOOP)
+        
+        other = MockAnkiMenuProvider()
+        
+        assert not other.has_menu_item("Tools", "Item 1")
+        assert other.add_toolbar_button("main", "Button 1", _NOOP).id == 1
+        assert not mock_menu_provider.has_toolbar_button("main", "Button 1")
 
 
 # ============================================================================
@@ -226,7 +336,7 @@ class TestMockAction:
     
     def test_action_trigger_calls_callback(self):
         """Test that triggering an action calls its callback."""
-        callback = MagicMock()
+        callback = _CallCounter()
         action = MockAction(
             id=1,
             text="Test",
@@ -235,11 +345,11 @@ class TestMockAction:
         
         action.trigger()
         
-        callback.assert_called_once()
+        assert callback.call_count == 1
     
     def test_disabled_action_does_not_trigger(self):
         """Test that a disabled action does not call its callback."""
-        callback = MagicMock()
+        callback = _CallCounter()
         action = MockAction(
             id=1,
             text="Test",
@@ -249,41 +359,58 @@ class TestMockAction:
         action.setEnabled(False)
         action.trigger()
         
-        callback.assert_not_called()
-    
-    def test_action_enabled_state(self):
-        """Test action enabled/disabled state."""
-        action = MockAction(id=1, text="Test", callback=lambda: None)
-        
-        assert action.isEnabled() is True
-        
-        action.setEnabled(False)
-        assert action.isEnabled() is False
-        
-        action.setEnabled(True)
-        assert action.isEnabled() is True
+        assert callback.call_count == 0
     
-    def test_action_visible_state(self):
-        """Test action visible/hidden state."""
-        action = MockAction(id=1, text="Test", callback=lambda: None)
+    @pytest.mark.parametrize("setter,getter", [
+        ("setEnabled", "isEnabled"),
+        ("setVisible", "isVisible"),
+    ], ids=["enabled", "visible"])
+    def test_action_bool_state(self, setter, getter):
+        """Test action enabled/disabled and visible/hidden state."""
+        action = MockAction(id=1, text="Test", callback=_NOOP)
         
-        assert action.isVisible() is True
+        assert getattr(action, getter)() is True
         
-        action.setVisible(False)
-        assert action.isVisible() is False
+        getattr(action, setter)(False)
+        assert getattr(action, getter)() is False
         
-        action.setVisible(True)
-        assert action.isVisible() is True
+        getattr(action, setter)(True)
+        assert getattr(action, getter)() is True
     
     def test_action_equality(self):
         """Test action equality based on id."""
-        callback = lambda: None
-        action1 = MockAction(id=1, text="Test", callback=callback)
-        action2 = MockAction(id=1, text="Different", callback=callback)
-        action3 = MockAction(id=2, text="Test", callback=callback)
+        action1 = MockAction(id=1, text="Test", callback=_NOOP)
+        action2 = MockAction(id=1, text="Different", callback=_NOOP)
+        action3 = MockAction(id=2, text="Test", callback=_NOOP)
         
         assert action1 == action2  # Same id
         assert action1 != action3  # Different id
+    
+    def test_actions_hash_by_id(self):
+        """Test that actions with the same id collapse in a set."""
+        actions = {
+            MockAction(id=1, text="Test", callback=_NOOP),
+            MockAction(id=1, text="Different", callback=_NOOP),
+            MockAction(id=2, text="Test", callback=_NOOP),
+        }
+        assert len(actions) == 2
+    
+    def test_action_uses_slots(self):
+        """Test that MockAction instances carry no per-instance __dict__."""
+        action = MockAction(id=1, text="Test", callback=_NOOP)
+        assert not hasattr(action, "__dict__")
+
+
+# (UI slot, setup method, provider trigger, container, entry text) for each
+# component MenuIntegration can open
+_COMPONENT_TRIGGERS = [
+    ("dashboard", "setup_menu", "trigger_menu_item",
+     "Tools", MENU_DASHBOARD),
+    ("game_window", "setup_toolbar", "trigger_toolbar_button",
+     "main", TOOLBAR_GAME_WINDOW),
+    ("settings_panel", "setup_menu", "trigger_menu_item",
+     "Tools", MENU_SETTINGS),
+]
 
 
 # ============================================================================
@@ -293,55 +420,30 @@ class TestMockAction:
 class TestMenuIntegrationSetupMenu:
     """Tests for MenuIntegration.setup_menu() - Requirement 7.6."""
     
-    def test_setup_menu_adds_dashboard_item(
+    @pytest.mark.parametrize("item_text", [
+        MENU_DASHBOARD,
+        MENU_GAME_WINDOW,
+        MENU_SETTINGS,
+    ])
+    def test_setup_menu_adds_item(
         self,
-        menu_integration,
-        mock_menu_provider
+        setup_menu_integration,
+        item_text
     ):
-        """Test that setup_menu adds Dashboard menu item to Tools menu.
+        """Test that setup_menu adds each NintendAnki item to the Tools menu.
         
         Validates: Requirement 7.6 - Add menu item to Tools menu for Dashboard
         """
-        menu_integration.setup_menu()
-        
-        assert mock_menu_provider.has_menu_item(
-            "Tools",
-            MenuIntegration.MENU_DASHBOARD
-        )
-    
-    def test_setup_menu_adds_game_window_item(
-        self,
-        menu_integration,
-        mock_menu_provider
-    ):
-        """Test that setup_menu adds Game Window menu item to Tools menu."""
-        menu_integration.setup_menu()
-        
-        assert mock_menu_provider.has_menu_item(
-            "Tools",
-            MenuIntegration.MENU_GAME_WINDOW
-        )
-    
-    def test_setup_menu_adds_settings_item(
-        self,
-        menu_integration,
-        mock_menu_provider
-    ):
-        """Test that setup_menu adds Settings menu item to Tools menu."""
-        menu_integration.setup_menu()
+        _, mock_menu_provider = setup_menu_integration
         
-        assert mock_menu_provider.has_menu_item(
-            "Tools",
-            MenuIntegration.MENU_SETTINGS
-        )
+        assert mock_menu_provider.has_menu_item("Tools", item_text)
     
     def test_setup_menu_creates_three_actions(
         self,
-        menu_integration,
-        mock_menu_provider
+        setup_menu_integration
     ):
         """Test that setup_menu creates three menu actions."""
-        menu_integration.setup_menu()
+        _, mock_menu_provider = setup_menu_integration
         
         items = mock_menu_provider.get_menu_items("Tools")
         assert len(items) == 3
@@ -364,16 +466,16 @@ class TestMenuIntegrationSetupMenu:
         
         assert not mock_menu_provider.has_menu_item(
             "Tools",
-            MenuIntegration.MENU_DASHBOARD
+            MENU_DASHBOARD
         )
         # But should still have game window and settings
         assert mock_menu_provider.has_menu_item(
             "Tools",
-            MenuIntegration.MENU_GAME_WINDOW
+            MENU_GAME_WINDOW
         )
         assert mock_menu_provider.has_menu_item(
             "Tools",
-            MenuIntegration.MENU_SETTINGS
+            MENU_SETTINGS
         )
     
     def test_setup_menu_no_deps_adds_nothing(
@@ -402,10 +504,10 @@ class TestMenuIntegrationSetupMenu:
         # Trigger the menu item
         mock_menu_provider.trigger_menu_item(
             "Tools",
-            MenuIntegration.MENU_DASHBOARD
+            MENU_DASHBOARD
         )
         
-        mock_dashboard.show.assert_called_once()
+        assert mock_dashboard.show_count == 1
     
     def test_game_window_menu_item_opens_game_window(
         self,
@@ -418,10 +520,10 @@ class TestMenuIntegrationSetupMenu:
         
         mock_menu_provider.trigger_menu_item(
             "Tools",
-            MenuIntegration.MENU_GAME_WINDOW
+            MENU_GAME_WINDOW
         )
         
-        mock_game_window.show.assert_called_once()
+        assert mock_game_window.show_count == 1
     
     def test_settings_menu_item_opens_settings(
         self,
@@ -434,10 +536,10 @@ class TestMenuIntegrationSetupMenu:
         
         mock_menu_provider.trigger_menu_item(
             "Tools",
-            MenuIntegration.MENU_SETTINGS
+            MENU_SETTINGS
         )
         
-        mock_settings_panel.show.assert_called_once()
+        assert mock_settings_panel.show_count == 1
 
 
 # ============================================================================
@@ -449,27 +551,25 @@ class TestMenuIntegrationSetupToolbar:
     
     def test_setup_toolbar_adds_game_window_button(
         self,
-        menu_integration,
-        mock_menu_provider
+        setup_menu_integration
     ):
         """Test that setup_toolbar adds Game Window button to toolbar.
         
         Validates: Requirement 7.7 - Add toolbar button for Game Window
         """
-        menu_integration.setup_toolbar()
+        _, mock_menu_provider = setup_menu_integration
         
         assert mock_menu_provider.has_toolbar_button(
             "main",
-            MenuIntegration.TOOLBAR_GAME_WINDOW
+            TOOLBAR_GAME_WINDOW
         )
     
     def test_setup_toolbar_creates_one_action(
         self,
-        menu_integration,
-        mock_menu_provider
+        setup_menu_integration
     ):
         """Test that setup_toolbar creates one toolbar action."""
-        menu_integration.setup_toolbar()
+        _, mock_menu_provider = setup_menu_integration
         
         buttons = mock_menu_provider.get_toolbar_buttons("main")
         assert len(buttons) == 1
@@ -507,22 +607,21 @@ class TestMenuIntegrationSetupToolbar:
         
         mock_menu_provider.trigger_toolbar_button(
             "main",
-            MenuIntegration.TOOLBAR_GAME_WINDOW
+            TOOLBAR_GAME_WINDOW
         )
         
-        mock_game_window.show.assert_called_once()
+        assert mock_game_window.show_count == 1
     
     def test_toolbar_button_has_tooltip(
         self,
-        menu_integration,
-        mock_menu_provider
+        setup_menu_integration
     ):
         """Test that toolbar button has a tooltip."""
-        menu_integration.setup_toolbar()
+        _, mock_menu_provider = setup_menu_integration
         
         buttons = mock_menu_provider.get_toolbar_buttons("main")
         assert len(buttons) == 1
-        assert buttons[0]['tooltip'] == MenuIntegration.TOOLBAR_GAME_WINDOW_TOOLTIP
+        assert buttons[0]['tooltip'] == TOOLBAR_GAME_WINDOW_TOOLTIP
 
 
 # ============================================================================
@@ -534,11 +633,10 @@ class TestMenuIntegrationSetupTeardown:
     
     def test_setup_calls_both_setup_methods(
         self,
-        menu_integration,
-        mock_menu_provider
+        setup_menu_integration
     ):
         """Test that setup() calls both setup_menu() and setup_toolbar()."""
-        menu_integration.setup()
+        _, mock_menu_provider = setup_menu_integration
         
         # Should have menu items
         items = mock_menu_provider.get_menu_items("Tools")
@@ -548,85 +646,66 @@ class TestMenuIntegrationSetupTeardown:
         buttons = mock_menu_provider.get_toolbar_buttons("main")
         assert len(buttons) == 1
     
-    def test_is_setup_property(self, menu_integration):
-        """Test the is_setup property."""
+    def test_setup_teardown_lifecycle(self, menu_integration):
+        """Test is_setup and the action counts through setup and teardown."""
         assert menu_integration.is_setup is False
+        assert menu_integration.menu_action_count == 0
+        assert menu_integration.toolbar_action_count == 0
         
-        menu_integration.setup()
+        menu_integration.setup_menu()
+        assert menu_integration.menu_action_count == 3
         
+        menu_integration.setup_toolbar()
+        assert menu_integration.toolbar_action_count == 1
         assert menu_integration.is_setup is True
+        
+        menu_integration.teardown()
+        assert menu_integration.is_setup is False
+        assert menu_integration.menu_action_count == 0
+        assert menu_integration.toolbar_action_count == 0
     
     def test_teardown_removes_menu_items(
         self,
-        menu_integration,
+        setup_integration,
         mock_menu_provider
     ):
         """Test that teardown removes all menu items."""
-        menu_integration.setup()
-        
-        # Verify items exist
-        assert len(mock_menu_provider.get_menu_items("Tools")) == 3
-        
-        menu_integration.teardown()
+        setup_integration.teardown()
         
-        # Verify items removed
         assert len(mock_menu_provider.get_menu_items("Tools")) == 0
     
     def test_teardown_removes_toolbar_buttons(
         self,
-        menu_integration,
+        setup_integration,
         mock_menu_provider
     ):
         """Test that teardown removes all toolbar buttons."""
-        menu_integration.setup()
-        
-        # Verify button exists
-        assert len(mock_menu_provider.get_toolbar_buttons("main")) == 1
-        
-        menu_integration.teardown()
+        setup_integration.teardown()
         
-        # Verify button removed
         assert len(mock_menu_provider.get_toolbar_buttons("main")) == 0
     
-    def test_teardown_resets_setup_flag(self, menu_integration):
-        """Test that teardown resets the is_setup flag."""
-        menu_integration.setup()
-        assert menu_integration.is_setup is True
-        
-        menu_integration.teardown()
-        assert menu_integration.is_setup is False
-    
-    def test_menu_action_count_property(self, menu_integration):
-        """Test the menu_action_count property."""
-        assert menu_integration.menu_action_count == 0
-        
-        menu_integration.setup_menu()
-        
-        assert menu_integration.menu_action_count == 3
-    
-    def test_toolbar_action_count_property(self, menu_integration):
-        """Test the toolbar_action_count property."""
-        assert menu_integration.toolbar_action_count == 0
-        
-        menu_integration.setup_toolbar()
-        
-        assert menu_integration.toolbar_action_count == 1
-    
     def test_double_setup_menu_is_idempotent(
         self,
-        menu_integration,
+        setup_integration,
         mock_menu_provider
     ):
-        """Test that calling setup_menu twice doesn't duplicate items."""
-        menu_integration.setup_menu()
-        menu_integration.setup_toolbar()  # This sets _setup_complete
-        
+        """Test that calling setup_menu after setup doesn't duplicate items."""
         # Try to setup menu again
-        menu_integration.setup_menu()
+        setup_integration.setup_menu()
         
         # Should still only have 3 items
         items = mock_menu_provider.get_menu_items("Tools")
         assert len(items) == 3
+    
+    def test_repeated_setup_menu_before_toolbar_is_idempotent(
+        self,
+        menu_integration
+    ):
+        """Test that setup_menu skips re-entry even before setup_toolbar runs."""
+        menu_integration.setup_menu()
+        menu_integration.setup_menu()
+        
+        assert menu_integration.menu_action_count == 3
 
 
 # ============================================================================
@@ -636,62 +715,29 @@ class TestMenuIntegrationSetupTeardown:
 class TestMenuIntegrationCallableSupport:
     """Tests for MenuIntegration with callable UI components."""
     
-    def test_callable_dashboard_is_called(self, mock_menu_provider):
-        """Test that a callable dashboard is called when menu item triggered."""
-        dashboard_callback = MagicMock()
-        
-        integration = MenuIntegration(
-            dashboard=dashboard_callback,
-            game_window=None,
-            settings_panel=None,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_menu()
-        mock_menu_provider.trigger_menu_item(
-            "Tools",
-            MenuIntegration.MENU_DASHBOARD
-        )
-        
-        dashboard_callback.assert_called_once()
-    
-    def test_callable_game_window_is_called(self, mock_menu_provider):
-        """Test that a callable game window is called when triggered."""
-        game_window_callback = MagicMock()
-        
-        integration = MenuIntegration(
-            dashboard=None,
-            game_window=game_window_callback,
-            settings_panel=None,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_toolbar()
-        mock_menu_provider.trigger_toolbar_button(
-            "main",
-            MenuIntegration.TOOLBAR_GAME_WINDOW
-        )
-        
-        game_window_callback.assert_called_once()
-    
-    def test_callable_settings_is_called(self, mock_menu_provider):
-        """Test that a callable settings panel is called when triggered."""
-        settings_callback = MagicMock()
-        
+    @pytest.mark.parametrize(
+        "slot,setup_method,trigger_method,container,text", _COMPONENT_TRIGGERS
+    )
+    def test_callable_component_is_called(
+        self,
+        mock_menu_provider,
+        slot,
+        setup_method,
+        trigger_method,
+        container,
+        text
+    ):
+        """Test that a callable UI component is called when triggered."""
+        callback = _CallCounter()
         integration = MenuIntegration(
-            dashboard=None,
-            game_window=None,
-            settings_panel=settings_callback,
-            menu_provider=mock_menu_provider
+            menu_provider=mock_menu_provider,
+            **{slot: callback}
         )
         
-        integration.setup_menu()
-        mock_menu_provider.trigger_menu_item(
-            "Tools",
-            MenuIntegration.MENU_SETTINGS
-        )
+        getattr(integration, setup_method)()
+        getattr(mock_menu_provider, trigger_method)(container, text)
         
-        settings_callback.assert_called_once()
+        assert callback.call_count == 1
 
 
 # ============================================================================
@@ -701,440 +747,30 @@ class TestMenuIntegrationCallableSupport:
 class TestMenuIntegrationErrorHandling:
     """Tests for MenuIntegration error handling."""
     
-    def test_dashboard_error_is_caught(self, mock_menu_provider):
-        """Test that errors in dashboard.show() are caught."""
-        dashboard = MagicMock()
-        dashboard.show.side_effect = Exception("Dashboard error")
-        
-        integration = MenuIntegration(
-            dashboard=dashboard,
-            game_window=None,
-            settings_panel=None,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_menu()
-        
-        # Should not raise
-        mock_menu_provider.trigger_menu_item(
-            "Tools",
-            MenuIntegration.MENU_DASHBOARD
-        )
-    
-    def test_game_window_error_is_caught(self, mock_menu_provider):
-        """Test that errors in game_window.show() are caught."""
-        game_window = MagicMock()
-        game_window.show.side_effect = Exception("Game window error")
-        
-        integration = MenuIntegration(
-            dashboard=None,
-            game_window=game_window,
-            settings_panel=None,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_toolbar()
-        
-        # Should not raise
-        mock_menu_provider.trigger_toolbar_button(
-            "main",
-            MenuIntegration.TOOLBAR_GAME_WINDOW
-        )
-    
-    def test_settings_error_is_caught(self, mock_menu_provider):
-        """Test that errors in settings_panel.show() are caught."""
-        settings = MagicMock()
-        settings.show.side_effect = Exception("Settings error")
-        
+    @pytest.mark.parametrize(
+        "slot,setup_method,trigger_method,container,text", _COMPONENT_TRIGGERS
+    )
+    def test_component_error_is_caught(
+        self,
+        mock_menu_provider,
+        slot,
+        setup_method,
+        trigger_method,
+        container,
+        text
+    ):
+        """Test that errors raised by a component's show() are caught."""
+        component = _RaisingShowStub(f"{slot} error")
         integration = MenuIntegration(
-            dashboard=None,
-            game_window=None,
-            settings_panel=settings,
-            menu_provider=mock_menu_provider
+            menu_provider=mock_menu_provider,
+            **{slot: component}
         )
         
-        integration.setup_menu()
+        getattr(integration, setup_method)()
         
         # Should not raise
-        mock_menu_provider.trigger_menu_item(
-            "Tools",
-            MenuIntegration.MENU_SETTINGS
-        )
-
-
-# ============================================================================
-# Integration Tests
-# ============================================================================
-
-class TestMenuIntegrationIntegration:
-    """Integration tests for MenuIntegration."""
-    
-    def test_full_workflow(
-        self,
-        mock_dashboard,
-        mock_game_window,
-        mock_settings_panel,
-        mock_menu_provider
-    ):
-        """Test the full workflow: setup, use, teardown."""
-        # Create integration
-        integration = MenuIntegration(
-            dashboard=mock_dashboard,
-            game_window=mock_game_window,
-            settings_panel=mock_settings_panel,
-            menu_provider=mock_menu_provider
-        )
-        
-        # Setup
-        integration.setup()
-        assert integration.is_setup is True
-        assert integration.menu_action_count == 3
-        assert integration.toolbar_action_count == 1
-        
-        # Use menu items
-        mock_menu_provider.trigger_menu_item("Tools", MenuIntegration.MENU_DASHBOARD)
-        mock_dashboard.show.assert_called_once()
-        
-        mock_menu_provider.trigger_menu_item("Tools", MenuIntegration.MENU_GAME_WINDOW)
-        mock_game_window.show.assert_called_once()
-        
-        mock_menu_provider.trigger_menu_item("Tools", MenuIntegration.MENU_SETTINGS)
-        mock_settings_panel.show.assert_called_once()
-        
-        # Use toolbar button
-        mock_menu_provider.trigger_toolbar_button("main", MenuIntegration.TOOLBAR_GAME_WINDOW)
-        assert mock_game_window.show.call_count == 2  # Called twice now
-        
-        # Teardown
-        integration.teardown()
-        assert integration.is_setup is False
-        assert integration.menu_action_count == 0
-        assert integration.toolbar_action_count == 0
-        assert len(mock_menu_provider.get_menu_items("Tools")) == 0
-        assert len(mock_menu_provider.get_toolbar_buttons("main")) == 0
-
-
-
-# ============================================================================
-# MenuIntegration Tests - Setup Toolbar (Requirement 7.7)
-# ============================================================================
-
-class TestMenuIntegrationSetupToolbar:
-    """Tests for MenuIntegration.setup_toolbar() - Requirement 7.7."""
-    
-    def test_setup_toolbar_adds_game_window_button(
-        self,
-        menu_integration,
-        mock_menu_provider
-    ):
-        """Test that setup_toolbar adds Game Window button to toolbar.
-        
-        Validates: Requirement 7.7 - Add toolbar button for Game Window
-        """
-        menu_integration.setup_toolbar()
-        
-        assert mock_menu_provider.has_toolbar_button(
-            "main",
-            MenuIntegration.TOOLBAR_GAME_WINDOW
-        )
-    
-    def test_setup_toolbar_creates_one_action(
-        self,
-        menu_integration,
-        mock_menu_provider
-    ):
-        """Test that setup_toolbar creates one toolbar action."""
-        menu_integration.setup_toolbar()
-        
-        buttons = mock_menu_provider.get_toolbar_buttons("main")
-        assert len(buttons) == 1
-    
-    def test_setup_toolbar_without_game_window_adds_nothing(
-        self,
-        mock_dashboard,
-        mock_settings_panel,
-        mock_menu_provider
-    ):
-        """Test that setup_toolbar adds nothing if no game window provided."""
-        integration = MenuIntegration(
-            dashboard=mock_dashboard,
-            game_window=None,
-            settings_panel=mock_settings_panel,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_toolbar()
-        
-        buttons = mock_menu_provider.get_toolbar_buttons("main")
-        assert len(buttons) == 0
-    
-    def test_toolbar_button_opens_game_window(
-        self,
-        menu_integration,
-        mock_menu_provider,
-        mock_game_window
-    ):
-        """Test that clicking toolbar button opens the game window.
-        
-        Validates: Requirement 7.7 - Toolbar button provides quick access to Game Window
-        """
-        menu_integration.setup_toolbar()
-        
-        mock_menu_provider.trigger_toolbar_button(
-            "main",
-            MenuIntegration.TOOLBAR_GAME_WINDOW
-        )
-        
-        mock_game_window.show.assert_called_once()
-    
-    def test_toolbar_button_has_tooltip(
-        self,
-        menu_integration,
-        mock_menu_provider
-    ):
-        """Test that toolbar button has a tooltip."""
-        menu_integration.setup_toolbar()
-        
-        buttons = mock_menu_provider.get_toolbar_buttons("main")
-        assert len(buttons) == 1
-        assert buttons[0]['tooltip'] == MenuIntegration.TOOLBAR_GAME_WINDOW_TOOLTIP
-
-
-# ============================================================================
-# MenuIntegration Tests - Setup and Teardown
-# ============================================================================
-
-class TestMenuIntegrationSetupTeardown:
-    """Tests for MenuIntegration setup and teardown functionality."""
-    
-    def test_setup_calls_both_setup_methods(
-        self,
-        menu_integration,
-        mock_menu_provider
-    ):
-        """Test that setup() calls both setup_menu() and setup_toolbar()."""
-        menu_integration.setup()
-        
-        # Should have menu items
-        items = mock_menu_provider.get_menu_items("Tools")
-        assert len(items) == 3
-        
-        # Should have toolbar button
-        buttons = mock_menu_provider.get_toolbar_buttons("main")
-        assert len(buttons) == 1
-    
-    def test_is_setup_property(self, menu_integration):
-        """Test the is_setup property."""
-        assert menu_integration.is_setup is False
-        
-        menu_integration.setup()
-        
-        assert menu_integration.is_setup is True
-    
-    def test_teardown_removes_menu_items(
-        self,
-        menu_integration,
-        mock_menu_provider
-    ):
-        """Test that teardown removes all menu items."""
-        menu_integration.setup()
-        
-        # Verify items exist
-        assert len(mock_menu_provider.get_menu_items("Tools")) == 3
-        
-        menu_integration.teardown()
-        
-        # Verify items removed
-        assert len(mock_menu_provider.get_menu_items("Tools")) == 0
-    
-    def test_teardown_removes_toolbar_buttons(
-        self,
-        menu_integration,
-        mock_menu_provider
-    ):
-        """Test that teardown removes all toolbar buttons."""
-        menu_integration.setup()
-        
-        # Verify button exists
-        assert len(mock_menu_provider.get_toolbar_buttons("main")) == 1
-        
-        menu_integration.teardown()
-        
-        # Verify button removed
-        assert len(mock_menu_provider.get_toolbar_buttons("main")) == 0
-    
-    def test_teardown_resets_setup_flag(self, menu_integration):
-        """Test that teardown resets the is_setup flag."""
-        menu_integration.setup()
-        assert menu_integration.is_setup is True
-        
-        menu_integration.teardown()
-        assert menu_integration.is_setup is False
-    
-    def test_menu_action_count_property(self, menu_integration):
-        """Test the menu_action_count property."""
-        assert menu_integration.menu_action_count == 0
-        
-        menu_integration.setup_menu()
-        
-        assert menu_integration.menu_action_count == 3
-    
-    def test_toolbar_action_count_property(self, menu_integration):
-        """Test the toolbar_action_count property."""
-        assert menu_integration.toolbar_action_count == 0
-        
-        menu_integration.setup_toolbar()
-        
-        assert menu_integration.toolbar_action_count == 1
-    
-    def test_double_setup_menu_is_idempotent(
-        self,
-        menu_integration,
-        mock_menu_provider
-    ):
-        """Test that calling setup_menu twice doesn't duplicate items."""
-        menu_integration.setup_menu()
-        menu_integration.setup_toolbar()  # This sets _setup_complete
-        
-        # Try to setup menu again
-        menu_integration.setup_menu()
-        
-        # Should still only have 3 items
-        items = mock_menu_provider.get_menu_items("Tools")
-        assert len(items) == 3
-
-
-# ============================================================================
-# MenuIntegration Tests - Callable Support
-# ============================================================================
-
-class TestMenuIntegrationCallableSupport:
-    """Tests for MenuIntegration with callable UI components."""
-    
-    def test_callable_dashboard_is_called(self, mock_menu_provider):
-        """Test that a callable dashboard is called when menu item triggered."""
-        dashboard_callback = MagicMock()
-        
-        integration = MenuIntegration(
-            dashboard=dashboard_callback,
-            game_window=None,
-            settings_panel=None,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_menu()
-        mock_menu_provider.trigger_menu_item(
-            "Tools",
-            MenuIntegration.MENU_DASHBOARD
-        )
-        
-        dashboard_callback.assert_called_once()
-    
-    def test_callable_game_window_is_called(self, mock_menu_provider):
-        """Test that a callable game window is called when triggered."""
-        game_window_callback = MagicMock()
-        
-        integration = MenuIntegration(
-            dashboard=None,
-            game_window=game_window_callback,
-            settings_panel=None,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_toolbar()
-        mock_menu_provider.trigger_toolbar_button(
-            "main",
-            MenuIntegration.TOOLBAR_GAME_WINDOW
-        )
-        
-        game_window_callback.assert_called_once()
-    
-    def test_callable_settings_is_called(self, mock_menu_provider):
-        """Test that a callable settings panel is called when triggered."""
-        settings_callback = MagicMock()
-        
-        integration = MenuIntegration(
-            dashboard=None,
-            game_window=None,
-            settings_panel=settings_callback,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_menu()
-        mock_menu_provider.trigger_menu_item(
-            "Tools",
-            MenuIntegration.MENU_SETTINGS
-        )
-        
-        settings_callback.assert_called_once()
-
-
-# ============================================================================
-# MenuIntegration Tests - Error Handling
-# ============================================================================
-
-class TestMenuIntegrationErrorHandling:
-    """Tests for MenuIntegration error handling."""
-    
-    def test_dashboard_error_is_caught(self, mock_menu_provider):
-        """Test that errors in dashboard.show() are caught."""
-        dashboard = MagicMock()
-        dashboard.show.side_effect = Exception("Dashboard error")
-        
-        integration = MenuIntegration(
-            dashboard=dashboard,
-            game_window=None,
-            settings_panel=None,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_menu()
-        
-        # Should not raise
-        mock_menu_provider.trigger_menu_item(
-            "Tools",
-            MenuIntegration.MENU_DASHBOARD
-        )
-    
-    def test_game_window_error_is_caught(self, mock_menu_provider):
-        """Test that errors in game_window.show() are caught."""
-        game_window = MagicMock()
-        game_window.show.side_effect = Exception("Game window error")
-        
-        integration = MenuIntegration(
-            dashboard=None,
-            game_window=game_window,
-            settings_panel=None,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_toolbar()
-        
-        # Should not raise
-        mock_menu_provider.trigger_toolbar_button(
-            "main",
-            MenuIntegration.TOOLBAR_GAME_WINDOW
-        )
-    
-    def test_settings_error_is_caught(self, mock_menu_provider):
-        """Test that errors in settings_panel.show() are caught."""
-        settings = MagicMock()
-        settings.show.side_effect = Exception("Settings error")
-        
-        integration = MenuIntegration(
-            dashboard=None,
-            game_window=None,
-            settings_panel=settings,
-            menu_provider=mock_menu_provider
-        )
-        
-        integration.setup_menu()
-        
-        # Should not raise
-        mock_menu_provider.trigger_menu_item(
-            "Tools",
-            MenuIntegration.MENU_SETTINGS
-        )
+        getattr(mock_menu_provider, trigger_method)(container, text)
+        assert component.show_count == 1
 
 
 # ============================================================================
@@ -1167,18 +803,18 @@ class TestMenuIntegrationIntegration:
         assert integration.toolbar_action_count == 1
         
         # Use menu items
-        mock_menu_provider.trigger_menu_item("Tools", MenuIntegration.MENU_DASHBOARD)
-        mock_dashboard.show.assert_called_once()
+        mock_menu_provider.trigger_menu_item("Tools", MENU_DASHBOARD)
+        assert mock_dashboard.show_count == 1
         
-        mock_menu_provider.trigger_menu_item("Tools", MenuIntegration.MENU_GAME_WINDOW)
-        mock_game_window.show.assert_called_once()
+        mock_menu_provider.trigger_menu_item("Tools", MENU_GAME_WINDOW)
+        assert mock_game_window.show_count == 1
         
-        mock_menu_provider.trigger_menu_item("Tools", MenuIntegration.MENU_SETTINGS)
-        mock_settings_panel.show.assert_called_once()
+        mock_menu_provider.trigger_menu_item("Tools", MENU_SETTINGS)
+        assert mock_settings_panel.show_count == 1
         
         # Use toolbar button
-        mock_menu_provider.trigger_toolbar_button("main", MenuIntegration.TOOLBAR_GAME_WINDOW)
-        assert mock_game_window.show.call_count == 2  # Called twice now
+        mock_menu_provider.trigger_toolbar_button("main", TOOLBAR_GAME_WINDOW)
+        assert mock_game_window.show_count == 2  # Called twice now
         
         # Teardown
         integration.teardown()
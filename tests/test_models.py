@@ -1,10 +1,14 @@
 """
 Unit tests for data models.
 
-Tests the basic functionality of all data models and enums defined in data/models.py.
+Tests the basic functionality of the dataclasses defined in data/models.py.
+The enums are covered by test_models_enums.py.
 """
 
+import sys
+
 import pytest
+from dataclasses import asdict, replace
 from datetime import datetime
 from data import (
     Theme,
@@ -16,72 +20,121 @@ from data import (
     ScoreResult,
     PenaltyResult,
     Achievement,
-    AchievementProgress,
     PowerUp,
     ActivePowerUp,
     Level,
     LevelReward,
     LevelProgress,
     Collectible,
-    Cosmetic,
-    ShopItem,
     ThemeState,
-    ThemeStats,
     GameConfig,
     GameState,
     Animation,
-    LevelView,
 )
 
 
-class TestThemeEnum:
-    """Tests for the Theme enum."""
-    
-    def test_theme_values(self):
-        """Test that all theme values are correct."""
-        assert Theme.MARIO.value == "mario"
-        assert Theme.ZELDA.value == "zelda"
-        assert Theme.DKC.value == "dkc"
-    
-    def test_theme_count(self):
-        """Test that there are exactly 3 themes."""
-        assert len(Theme) == 3
+pytestmark = pytest.mark.fast
 
 
-class TestPowerUpTypeEnum:
-    """Tests for the PowerUpType enum."""
-    
-    def test_mario_powerups(self):
-        """Test Mario-specific power-up types."""
-        assert PowerUpType.MUSHROOM.value == "mushroom"
-        assert PowerUpType.FIRE_FLOWER.value == "fire_flower"
-        assert PowerUpType.STAR.value == "star"
-    
-    def test_zelda_powerups(self):
-        """Test Zelda-specific power-up types."""
-        assert PowerUpType.HEART_CONTAINER.value == "heart_container"
-        assert PowerUpType.FAIRY.value == "fairy"
-        assert PowerUpType.POTION.value == "potion"
-    
-    def test_dkc_powerups(self):
-        """Test DKC-specific power-up types."""
-        assert PowerUpType.BANANA.value == "banana"
-        assert PowerUpType.BARREL.value == "barrel"
-        assert PowerUpType.ANIMAL_BUDDY.value == "animal_buddy"
-    
-    def test_universal_powerups(self):
-        """Test universal power-up types."""
-        assert PowerUpType.DOUBLE_POINTS.value == "double_points"
-        assert PowerUpType.SHIELD.value == "shield"
-        assert PowerUpType.TIME_FREEZE.value == "time_freeze"
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+ALL_THEMES = tuple(Theme)
+
+EXPECTED_CONFIG_DEFAULTS = {
+    "base_points": 10,
+    "penalty_health_reduction": 0.1,
+    "penalty_currency_loss": 1,
+    "streak_multiplier_5": 1.5,
+    "streak_multiplier_10": 2.0,
+    "streak_multiplier_20": 3.0,
+    "accuracy_bonus_threshold": 0.9,
+    "accuracy_bonus_multiplier": 1.25,
+    "cards_per_level": 50,
+    "cards_per_powerup": 100,
+    "animation_speed": 1.0,
+    "animations_enabled": True,
+    "colorblind_mode": None,
+    "sound_enabled": True,
+    "sound_volume": 0.7,
+}
+
+
+@pytest.fixture(scope="module")
+def now():
+    """A fixed timestamp shared by the tests that need one."""
+    return FIXED_NOW
+
+
+@pytest.fixture(scope="module")
+def empty_game_state():
+    """A default GameState shared read-only; derive variants with replace()."""
+    return GameState(progression=ProgressionState())
+
+
+@pytest.fixture(scope="session")
+def make_achievement():
+    """Factory for Achievement instances; keyword arguments override defaults."""
+    def _make(**overrides):
+        fields = dict(
+            id="first_100",
+            name="Century",
+            description="Review 100 cards",
+            icon="trophy.png",
+            reward_currency=50,
+        )
+        fields.update(overrides)
+        return Achievement(**fields)
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_powerup():
+    """Factory for PowerUp instances; keyword arguments override defaults."""
+    def _make(**overrides):
+        fields = dict(
+            id="mushroom_1",
+            type=PowerUpType.MUSHROOM,
+            theme=Theme.MARIO,
+            name="Super Mushroom",
+            description="Grow bigger!",
+            icon="mushroom.png",
+        )
+        fields.update(overrides)
+        return PowerUp(**fields)
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_level():
+    """Factory for Level instances; keyword arguments override defaults."""
+    def _make(**overrides):
+        fields = dict(
+            id="mario_1_1",
+            theme=Theme.MARIO,
+            level_number=1,
+            name="World 1-1",
+        )
+        fields.update(overrides)
+        return Level(**fields)
+    return _make
+
+
+@pytest.fixture
+def sample_achievement(make_achievement):
+    """A fresh default Achievement."""
+    return make_achievement()
+
+
+@pytest.fixture
+def sample_powerup(make_powerup):
+    """A fresh default PowerUp."""
+    return make_powerup()
 
 
 class TestReviewResult:
     """Tests for the ReviewResult dataclass."""
     
-    def test_create_review_result(self):
+    def test_create_review_result(self, now):
         """Test creating a ReviewResult."""
-        now = datetime.now()
         result = ReviewResult(
             card_id="123",
             deck_id="456",
@@ -94,15 +147,13 @@ class TestReviewResult:
             lapses=0,
             quality=3
         )
-        assert result.card_id == "123"
-        assert result.deck_id == "456"
+        assert (result.card_id, result.deck_id, result.ease, result.timestamp) == (
+            "123", "456", 3, now
+        )
         assert result.is_correct is True
-        assert result.ease == 3
-        assert result.timestamp == now
     
-    def test_review_result_wrong_answer(self):
+    def test_review_result_wrong_answer(self, now):
         """Test ReviewResult for a wrong answer."""
-        now = datetime.now()
         result = ReviewResult(
             card_id="1",
             deck_id="1",
@@ -125,15 +176,17 @@ class TestProgressionState:
     def test_default_values(self):
         """Test default values for ProgressionState."""
         state = ProgressionState()
-        assert state.total_points == 0
-        assert state.total_cards_reviewed == 0
-        assert state.correct_answers == 0
-        assert state.current_streak == 0
-        assert state.best_streak == 0
-        assert state.levels_unlocked == 0
-        assert state.levels_completed == 0
-        assert state.session_accuracy == 0.0
-        assert state.session_health == 0
+        assert (
+            state.total_points,
+            state.total_cards_reviewed,
+            state.correct_answers,
+            state.current_streak,
+            state.best_streak,
+            state.levels_unlocked,
+            state.levels_completed,
+            state.session_accuracy,
+            state.session_health,
+        ) == (0, 0, 0, 0, 0, 0, 0, 0.0, 0)
     
     def test_custom_values(self):
         """Test creating ProgressionState with custom values."""
@@ -148,9 +201,7 @@ class TestProgressionState:
             session_accuracy=0.9,
             session_health=80
         )
-        assert state.total_points == 1000
-        assert state.correct_answers == 90
-        assert state.current_streak == 10
+        assert (state.total_points, state.correct_answers, state.current_streak) == (1000, 90, 10)
 
 
 class TestScoreResult:
@@ -165,10 +216,9 @@ class TestScoreResult:
             total_points=20,
             streak_broken=False
         )
-        assert result.base_points == 10
-        assert result.multiplier == 1.5
-        assert result.bonus_points == 5
-        assert result.total_points == 20
+        assert (
+            result.base_points, result.multiplier, result.bonus_points, result.total_points
+        ) == (10, 1.5, 5, 20)
         assert result.streak_broken is False
 
 
@@ -182,32 +232,22 @@ class TestPenaltyResult:
             currency_lost=1,
             streak_lost=5
         )
-        assert result.health_reduction == 0.1
-        assert result.currency_lost == 1
-        assert result.streak_lost == 5
+        assert (result.health_reduction, result.currency_lost, result.streak_lost) == (0.1, 1, 5)
 
 
 class TestAchievement:
     """Tests for the Achievement dataclass."""
     
-    def test_create_achievement(self):
+    def test_create_achievement(self, make_achievement):
         """Test creating an Achievement."""
-        achievement = Achievement(
-            id="first_100",
-            name="Century",
-            description="Review 100 cards",
-            icon="trophy.png",
-            reward_currency=50
-        )
-        assert achievement.id == "first_100"
-        assert achievement.name == "Century"
+        achievement = make_achievement()
+        assert (achievement.id, achievement.name) == ("first_100", "Century")
         assert achievement.unlocked is False
         assert achievement.unlock_date is None
     
-    def test_unlocked_achievement(self):
+    def test_unlocked_achievement(self, make_achievement, now):
         """Test an unlocked Achievement."""
-        now = datetime.now()
-        achievement = Achievement(
+        achievement = make_achievement(
             id="streak_10",
             name="On Fire",
             description="Get a 10 streak",
@@ -223,24 +263,16 @@ class TestAchievement:
 class TestPowerUp:
     """Tests for the PowerUp dataclass."""
     
-    def test_create_powerup(self):
+    def test_create_powerup(self, make_powerup):
         """Test creating a PowerUp."""
-        powerup = PowerUp(
-            id="mushroom_1",
-            type=PowerUpType.MUSHROOM,
-            theme=Theme.MARIO,
-            name="Super Mushroom",
-            description="Grow bigger!",
-            icon="mushroom.png"
+        powerup = make_powerup()
+        assert (powerup.id, powerup.type, powerup.theme, powerup.quantity) == (
+            "mushroom_1", PowerUpType.MUSHROOM, Theme.MARIO, 1
         )
-        assert powerup.id == "mushroom_1"
-        assert powerup.type == PowerUpType.MUSHROOM
-        assert powerup.theme == Theme.MARIO
-        assert powerup.quantity == 1
     
-    def test_universal_powerup(self):
+    def test_universal_powerup(self, make_powerup):
         """Test creating a universal PowerUp."""
-        powerup = PowerUp(
+        powerup = make_powerup(
             id="double_points_1",
             type=PowerUpType.DOUBLE_POINTS,
             theme=None,
@@ -251,33 +283,27 @@ class TestPowerUp:
         )
         assert powerup.theme is None
         assert powerup.duration_seconds == 60
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    @pytest.mark.parametrize("model", [PowerUp, ActivePowerUp])
+    def test_powerup_models_use_slots(self, model):
+        """Test that the power-up dataclasses are slotted."""
+        assert "__slots__" in vars(model)
 
 
 class TestLevel:
     """Tests for the Level dataclass."""
     
-    def test_create_level(self):
+    def test_create_level(self, make_level):
         """Test creating a Level."""
-        level = Level(
-            id="mario_1_1",
-            theme=Theme.MARIO,
-            level_number=1,
-            name="World 1-1"
-        )
-        assert level.id == "mario_1_1"
-        assert level.theme == Theme.MARIO
-        assert level.level_number == 1
+        level = make_level()
+        assert (level.id, level.theme, level.level_number) == ("mario_1_1", Theme.MARIO, 1)
         assert level.unlocked is False
         assert level.completed is False
     
-    def test_completed_level(self):
+    def test_completed_level(self, make_level, now):
         """Test a completed Level."""
-        now = datetime.now()
-        level = Level(
-            id="mario_1_1",
-            theme=Theme.MARIO,
-            level_number=1,
-            name="World 1-1",
+        level = make_level(
             unlocked=True,
             completed=True,
             best_accuracy=0.95,
@@ -287,6 +313,12 @@ class TestLevel:
         assert level.unlocked is True
         assert level.completed is True
         assert level.best_accuracy == 0.95
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    @pytest.mark.parametrize("model", [Level, LevelReward, LevelProgress])
+    def test_level_models_use_slots(self, model):
+        """Test that the level dataclasses are slotted."""
+        assert "__slots__" in vars(model)
 
 
 class TestCollectible:
@@ -302,8 +334,7 @@ class TestCollectible:
             description="The iconic red cap",
             icon="hat.png"
         )
-        assert collectible.id == "mario_hat"
-        assert collectible.type == CollectibleType.COSMETIC
+        assert (collectible.id, collectible.type) == ("mario_hat", CollectibleType.COSMETIC)
         assert collectible.owned is False
 
 
@@ -312,22 +343,7 @@ class TestGameConfig:
     
     def test_default_values(self):
         """Test default values for GameConfig."""
-        config = GameConfig()
-        assert config.base_points == 10
-        assert config.penalty_health_reduction == 0.1
-        assert config.penalty_currency_loss == 1
-        assert config.streak_multiplier_5 == 1.5
-        assert config.streak_multiplier_10 == 2.0
-        assert config.streak_multiplier_20 == 3.0
-        assert config.accuracy_bonus_threshold == 0.9
-        assert config.accuracy_bonus_multiplier == 1.25
-        assert config.cards_per_level == 50
-        assert config.cards_per_powerup == 100
-        assert config.animation_speed == 1.0
-        assert config.animations_enabled is True
-        assert config.colorblind_mode is None
-        assert config.sound_enabled is True
-        assert config.sound_volume == 0.7
+        assert asdict(GameConfig()) == pytest.approx(EXPECTED_CONFIG_DEFAULTS)
     
     def test_custom_config(self):
         """Test GameConfig with custom values."""
@@ -337,61 +353,50 @@ class TestGameConfig:
             animations_enabled=False,
             colorblind_mode="deuteranopia"
         )
-        assert config.base_points == 20
-        assert config.penalty_health_reduction == 0.2
+        assert (config.base_points, config.penalty_health_reduction, config.colorblind_mode) == (
+            20, 0.2, "deuteranopia"
+        )
         assert config.animations_enabled is False
-        assert config.colorblind_mode == "deuteranopia"
 
 
 class TestGameState:
     """Tests for the GameState dataclass."""
     
-    def test_default_game_state(self):
+    def test_default_game_state(self, empty_game_state):
         """Test creating a GameState with defaults."""
-        state = GameState(progression=ProgressionState())
-        assert state.progression.total_points == 0
-        assert state.currency == 0
-        assert state.theme == Theme.MARIO
-        assert len(state.achievements) == 0
-        assert len(state.powerups) == 0
-        assert len(state.levels) == 0
+        got = asdict(empty_game_state)
+        expected = {
+            "currency": 0,
+            "theme": Theme.MARIO,
+            "achievements": [],
+            "powerups": [],
+            "levels": [],
+        }
+        assert {key: got[key] for key in expected} == expected
+        assert got["progression"]["total_points"] == 0
     
-    def test_theme_specific_initialization(self):
-        """Test that theme-specific state is initialized for all themes."""
-        state = GameState(progression=ProgressionState())
-        assert Theme.MARIO in state.theme_specific
-        assert Theme.ZELDA in state.theme_specific
-        assert Theme.DKC in state.theme_specific
+    @pytest.mark.parametrize("theme", ALL_THEMES)
+    def test_theme_specific_initialization(self, empty_game_state, theme):
+        """Test that theme-specific state is initialized for every theme."""
+        assert theme in empty_game_state.theme_specific
     
-    def test_game_state_with_data(self):
+    def test_game_state_with_data(self, empty_game_state, sample_achievement, sample_powerup):
         """Test GameState with populated data."""
-        achievement = Achievement(
-            id="test",
-            name="Test",
-            description="Test achievement",
-            icon="test.png",
-            reward_currency=10
-        )
-        powerup = PowerUp(
-            id="test_powerup",
-            type=PowerUpType.MUSHROOM,
-            theme=Theme.MARIO,
-            name="Test",
-            description="Test",
-            icon="test.png"
-        )
-        state = GameState(
+        state = replace(
+            empty_game_state,
             progression=ProgressionState(total_points=100),
-            achievements=[achievement],
-            powerups=[powerup],
+            achievements=[sample_achievement],
+            powerups=[sample_powerup],
             currency=50,
             theme=Theme.ZELDA
         )
-        assert state.progression.total_points == 100
-        assert len(state.achievements) == 1
-        assert len(state.powerups) == 1
-        assert state.currency == 50
-        assert state.theme == Theme.ZELDA
+        assert (
+            state.progression.total_points,
+            len(state.achievements),
+            len(state.powerups),
+            state.currency,
+            state.theme,
+        ) == (100, 1, 1, 50, Theme.ZELDA)
 
 
 class TestThemeState:
@@ -400,20 +405,16 @@ class TestThemeState:
     def test_default_theme_state(self):
         """Test default ThemeState values."""
         state = ThemeState(theme=Theme.MARIO)
-        assert state.theme == Theme.MARIO
-        assert state.coins == 0
-        assert state.bananas == 0
-        assert state.hearts == 3
+        assert (state.theme, state.coins, state.bananas, state.hearts) == (Theme.MARIO, 0, 0, 3)
     
-    def test_mario_theme_state(self):
-        """Test ThemeState for Mario theme."""
-        state = ThemeState(theme=Theme.MARIO, coins=100)
-        assert state.coins == 100
-    
-    def test_dkc_theme_state(self):
-        """Test ThemeState for DKC theme."""
-        state = ThemeState(theme=Theme.DKC, bananas=500)
-        assert state.bananas == 500
+    @pytest.mark.parametrize("theme, field, value", [
+        (Theme.MARIO, "coins", 100),
+        (Theme.DKC, "bananas", 500),
+    ])
+    def test_theme_currency(self, theme, field, value):
+        """Test ThemeState carries each theme's currency."""
+        state = ThemeState(theme=theme, **{field: value})
+        assert getattr(state, field) == value
 
 
 class TestAnimation:
@@ -428,8 +429,7 @@ class TestAnimation:
             frames=[0, 1, 2, 3],
             fps=30
         )
-        assert animation.type == AnimationType.COLLECT
-        assert animation.theme == Theme.MARIO
-        assert len(animation.frames) == 4
-        assert animation.fps == 30
+        assert (animation.type, animation.theme, len(animation.frames), animation.fps) == (
+            AnimationType.COLLECT, Theme.MARIO, 4, 30
+        )
         assert animation.loop is False
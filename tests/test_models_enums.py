@@ -0,0 +1,59 @@
+"""
+Unit tests for the enums defined in data/models.py.
+"""
+
+import pytest
+from data import Theme, PowerUpType
+
+
+pytestmark = pytest.mark.fast
+
+
+ALL_THEMES = tuple(Theme)
+
+# Member -> value maps, built once so the value tests are plain dict lookups.
+_THEME_VALUE = {member: member.value for member in ALL_THEMES}
+_POWERUP_VALUE = {member: member.value for member in PowerUpType}
+
+
+class TestThemeEnum:
+    """Tests for the Theme enum."""
+    
+    @pytest.mark.parametrize("member, expected", [
+        (Theme.MARIO, "mario"),
+        (Theme.ZELDA, "zelda"),
+        (Theme.DKC, "dkc"),
+    ])
+    def test_theme_values(self, member, expected):
+        """Test that all theme values are correct."""
+        assert _THEME_VALUE[member] == expected
+    
+    def test_theme_count(self):
+        """Test that there are exactly 3 themes."""
+        assert len(ALL_THEMES) == 3
+
+
+class TestPowerUpTypeEnum:
+    """Tests for the PowerUpType enum."""
+    
+    @pytest.mark.parametrize("member, expected", [
+        # Mario
+        (PowerUpType.MUSHROOM, "mushroom"),
+        (PowerUpType.FIRE_FLOWER, "fire_flower"),
+        (PowerUpType.STAR, "star"),
+        # Zelda
+        (PowerUpType.HEART_CONTAINER, "heart_container"),
+        (PowerUpType.FAIRY, "fairy"),
+        (PowerUpType.POTION, "potion"),
+        # DKC
+        (PowerUpType.BANANA, "banana"),
+        (PowerUpType.BARREL, "barrel"),
+        (PowerUpType.ANIMAL_BUDDY, "animal_buddy"),
+        # Universal
+        (PowerUpType.DOUBLE_POINTS, "double_points"),
+        (PowerUpType.SHIELD, "shield"),
+        (PowerUpType.TIME_FREEZE, "time_freeze"),
+    ])
+    def test_powerup_values(self, member, expected):
+        """Test the value of every themed and universal power-up type."""
+        assert _POWERUP_VALUE[member] == expected
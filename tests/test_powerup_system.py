@@ -7,6 +7,8 @@ and duration tracking functionality.
 Requirements: 13.1, 13.2, 13.3, 13.4, 13.5, 13.6
 """
 
+import uuid
+
 import pytest
 
 from data.data_manager import DataManager
@@ -14,19 +16,62 @@ from data.models import PowerUpType, Theme
 from core.powerup_system import PowerUpSystem, THEME_POWERUPS, POWERUP_METADATA
 
 
-@pytest.fixture
-def temp_db(tmp_path):
-    """Create a temporary database for testing."""
-    db_path = tmp_path / "test_game.db"
-    data_manager = DataManager(db_path)
-    data_manager.initialize_database()
+def _memory_data_manager(db_template):
+    """Create an in-memory DataManager from the initialized template."""
+    data_manager = DataManager(":memory:")
+    db_template.backup(data_manager._get_connection())
     return data_manager
 
 
 @pytest.fixture
-def powerup_system(temp_db):
-    """Create a PowerUpSystem instance with a temporary database."""
-    return PowerUpSystem(temp_db)
+def shared_memory_db():
+    """Open DataManagers on one shared-cache in-memory database.
+    
+    Returns a callable that opens a new connection each time, so a second
+    PowerUpSystem only sees what the first one committed. The first
+    connection stays open for the whole test to keep the database alive.
+    """
+    uri = f"file:powerup_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    opened = []
+    
+    def connect():
+        data_manager = DataManager(uri)
+        opened.append(data_manager)
+        return data_manager
+    
+    connect().initialize_database()
+    yield connect
+    for data_manager in reversed(opened):
+        data_manager.close()
+
+
+@pytest.fixture(scope="module")
+def _powerup_system_pool():
+    """Idle PowerUpSystem instances, reset and ready for reuse."""
+    pool = []
+    yield pool
+    for system in pool:
+        system.data_manager.close()
+
+
+@pytest.fixture
+def powerup_system(_powerup_system_pool, db_template):
+    """Check a clean PowerUpSystem out of the pool, returning it after the test."""
+    if _powerup_system_pool:
+        system = _powerup_system_pool.pop()
+    else:
+        system = PowerUpSystem(_memory_data_manager(db_template))
+    yield system
+    system.reset()
+    _powerup_system_pool.append(system)
+
+
+@pytest.fixture(scope="module")
+def readonly_powerup_system(db_template):
+    """One pristine PowerUpSystem per module for tests that never mutate it."""
+    data_manager = _memory_data_manager(db_template)
+    yield PowerUpSystem(data_manager)
+    data_manager.close()
 
 
 class TestGrantPowerup:
@@ -69,40 +114,70 @@ class TestGrantPowerup:
     
     def test_grant_different_powerups_creates_separate_entries(self, powerup_system):
         """Granting different power-up types should create separate inventory entries."""
-        powerup_system.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
-        powerup_system.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
+        powerup_system.grant_powerups_bulk([
+            (PowerUpType.MUSHROOM, Theme.MARIO),
+            (PowerUpType.FIRE_FLOWER, Theme.MARIO),
+        ])
         
         inventory = powerup_system.get_inventory()
         assert len(inventory) == 2
     
-    def test_grant_theme_appropriate_powerups(self, powerup_system):
-        """Each theme should have appropriate power-ups defined."""
-        # Test Mario theme power-ups
-        assert PowerUpType.MUSHROOM in THEME_POWERUPS[Theme.MARIO]
-        assert PowerUpType.FIRE_FLOWER in THEME_POWERUPS[Theme.MARIO]
-        assert PowerUpType.STAR in THEME_POWERUPS[Theme.MARIO]
-        
-        # Test Zelda theme power-ups
-        assert PowerUpType.HEART_CONTAINER in THEME_POWERUPS[Theme.ZELDA]
-        assert PowerUpType.FAIRY in THEME_POWERUPS[Theme.ZELDA]
-        
-        # Test DKC theme power-ups
-        assert PowerUpType.BANANA in THEME_POWERUPS[Theme.DKC]
-        assert PowerUpType.BARREL in THEME_POWERUPS[Theme.DKC]
-    
-    def test_grant_powerup_persists_to_database(self, temp_db):
+    @pytest.mark.parametrize("theme, expected", [
+        (Theme.MARIO, {PowerUpType.MUSHROOM, PowerUpType.FIRE_FLOWER, PowerUpType.STAR}),
+        (Theme.ZELDA, {PowerUpType.HEART_CONTAINER, PowerUpType.FAIRY}),
+        (Theme.DKC, {PowerUpType.BANANA, PowerUpType.BARREL}),
+    ])
+    def test_grant_theme_appropriate_powerups(self, readonly_powerup_system, theme, expected):
+        """Each theme should have appropriate power-ups defined and reported."""
+        assert expected <= set(THEME_POWERUPS[theme])
+        assert expected <= set(readonly_powerup_system.get_theme_powerup_types(theme))
+    
+    def test_grant_powerup_persists_to_database(self, shared_memory_db):
         """Granted power-ups should be persisted to the database."""
-        system1 = PowerUpSystem(temp_db)
+        system1 = PowerUpSystem(shared_memory_db())
         system1.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
         
         # Create a new system instance to verify persistence
-        system2 = PowerUpSystem(temp_db)
+        system2 = PowerUpSystem(shared_memory_db())
         inventory = system2.get_inventory()
         
         assert len(inventory) == 1
         assert inventory[0].type == PowerUpType.MUSHROOM
 
 
+class TestGrantPowerupsBulk:
+    """Tests for grant_powerups_bulk method."""
+    
+    def test_bulk_grant_merges_repeated_specs(self, powerup_system):
+        """Repeated specs should yield one entry with the summed quantity."""
+        granted = powerup_system.grant_powerups_bulk([
+            (PowerUpType.MUSHROOM, Theme.MARIO),
+            (PowerUpType.STAR, Theme.MARIO),
+            (PowerUpType.MUSHROOM, Theme.MARIO),
+        ])
+        
+        assert [p.type for p in granted] == [PowerUpType.MUSHROOM, PowerUpType.STAR]
+        assert powerup_system.get_powerup_count(PowerUpType.MUSHROOM) == 2
+    
+    def test_bulk_grant_persists_to_database(self, shared_memory_db):
+        """Bulk-granted power-ups should be persisted to the database."""
+        system1 = PowerUpSystem(shared_memory_db())
+        system1.grant_powerup(PowerUpType.STAR, Theme.MARIO)
+        system1.grant_powerups_bulk([
+            (PowerUpType.STAR, Theme.MARIO),
+            (PowerUpType.FAIRY, Theme.ZELDA),
+        ])
+        
+        system2 = PowerUpSystem(shared_memory_db())
+        quantities = {p.type: p.quantity for p in system2.get_inventory()}
+        assert quantities == {PowerUpType.STAR: 2, PowerUpType.FAIRY: 1}
+    
+    def test_bulk_grant_with_no_specs(self, powerup_system):
+        """An empty spec list should grant nothing."""
+        assert powerup_system.grant_powerups_bulk([]) == []
+        assert powerup_system.get_inventory() == []
+
+
 class TestActivatePowerup:
     """Tests for activate_powerup method - Requirements 13.4"""
     
@@ -170,12 +245,46 @@ class TestActivatePowerup:
         assert result is False
 
 
+class TestActivateMany:
+    """Tests for activate_many method."""
+    
+    def test_activate_many_caps_at_available_quantity(self, powerup_system):
+        """Should activate no more copies than the inventory holds."""
+        [powerup] = powerup_system.grant_powerups_bulk([(PowerUpType.STAR, Theme.MARIO)] * 2)
+        
+        assert powerup_system.activate_many(powerup.id, 5) == 2
+        assert len(powerup_system.get_active_powerups()) == 2
+        assert powerup_system.get_inventory() == []
+    
+    def test_activate_many_partial_keeps_remainder(self, powerup_system):
+        """Remaining copies should stay in inventory."""
+        [powerup] = powerup_system.grant_powerups_bulk([(PowerUpType.MUSHROOM, Theme.MARIO)] * 3)
+        
+        assert powerup_system.activate_many(powerup.id, 2) == 2
+        assert powerup_system.get_powerup_count(PowerUpType.MUSHROOM) == 1
+        assert powerup_system.get_active_powerups() == []
+    
+    def test_activate_many_invalid_id(self, powerup_system):
+        """Unknown IDs should activate nothing."""
+        assert powerup_system.activate_many("invalid-id", 3) == 0
+    
+    def test_activate_many_persists(self, shared_memory_db):
+        """Activated copies and the remaining quantity should persist."""
+        system1 = PowerUpSystem(shared_memory_db())
+        [powerup] = system1.grant_powerups_bulk([(PowerUpType.FIRE_FLOWER, Theme.MARIO)] * 3)
+        system1.activate_many(powerup.id, 2)
+        
+        system2 = PowerUpSystem(shared_memory_db())
+        assert len(system2.get_active_powerups()) == 2
+        assert system2.get_powerup_count(PowerUpType.FIRE_FLOWER) == 1
+
+
 class TestGetActivePowerups:
     """Tests for get_active_powerups method - Requirements 13.5, 13.6"""
     
-    def test_get_active_powerups_returns_empty_list_initially(self, powerup_system):
+    def test_get_active_powerups_returns_empty_list_initially(self, readonly_powerup_system):
         """Should return empty list when no power-ups are active."""
-        active = powerup_system.get_active_powerups()
+        active = readonly_powerup_system.get_active_powerups()
         assert active == []
     
     def test_get_active_powerups_returns_activated_powerups(self, powerup_system):
@@ -202,25 +311,25 @@ class TestGetActivePowerups:
 class TestGetInventory:
     """Tests for get_inventory method - Requirements 13.3, 13.5"""
     
-    def test_get_inventory_returns_empty_list_initially(self, powerup_system):
+    def test_get_inventory_returns_empty_list_initially(self, readonly_powerup_system):
         """Should return empty list when no power-ups have been granted."""
-        inventory = powerup_system.get_inventory()
+        inventory = readonly_powerup_system.get_inventory()
         assert inventory == []
     
     def test_get_inventory_returns_all_powerups(self, powerup_system):
         """Should return all power-ups in inventory."""
-        powerup_system.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
-        powerup_system.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
-        powerup_system.grant_powerup(PowerUpType.HEART_CONTAINER, Theme.ZELDA)
+        powerup_system.grant_powerups_bulk([
+            (PowerUpType.MUSHROOM, Theme.MARIO),
+            (PowerUpType.FIRE_FLOWER, Theme.MARIO),
+            (PowerUpType.HEART_CONTAINER, Theme.ZELDA),
+        ])
         
         inventory = powerup_system.get_inventory()
         assert len(inventory) == 3
     
     def test_get_inventory_returns_correct_quantities(self, powerup_system):
         """Should return correct quantities for each power-up."""
-        powerup_system.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
-        powerup_system.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
-        powerup_system.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
+        powerup_system.grant_powerups_bulk([(PowerUpType.MUSHROOM, Theme.MARIO)] * 3)
         
         inventory = powerup_system.get_inventory()
         assert len(inventory) == 1
@@ -292,20 +401,6 @@ class TestTick:
 class TestHelperMethods:
     """Tests for helper methods."""
     
-    def test_get_theme_powerup_types(self, powerup_system):
-        """Should return correct power-up types for each theme."""
-        mario_types = powerup_system.get_theme_powerup_types(Theme.MARIO)
-        assert PowerUpType.MUSHROOM in mario_types
-        assert PowerUpType.FIRE_FLOWER in mario_types
-        
-        zelda_types = powerup_system.get_theme_powerup_types(Theme.ZELDA)
-        assert PowerUpType.HEART_CONTAINER in zelda_types
-        assert PowerUpType.FAIRY in zelda_types
-        
-        dkc_types = powerup_system.get_theme_powerup_types(Theme.DKC)
-        assert PowerUpType.BANANA in dkc_types
-        assert PowerUpType.BARREL in dkc_types
-    
     def test_has_active_powerup_of_type(self, powerup_system):
         """Should correctly detect active power-ups by type."""
         powerup = powerup_system.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
@@ -317,6 +412,28 @@ class TestHelperMethods:
         assert powerup_system.has_active_powerup_of_type(PowerUpType.FIRE_FLOWER) is True
         assert powerup_system.has_active_powerup_of_type(PowerUpType.STAR) is False
     
+    def test_has_active_powerup_of_type_after_expiry(self, powerup_system):
+        """A type should stop being active once all its instances expire."""
+        [powerup] = powerup_system.grant_powerups_bulk([(PowerUpType.STAR, Theme.MARIO)] * 2)
+        powerup_system.activate_powerup(powerup.id)
+        powerup_system.tick(10.0)
+        powerup_system.activate_powerup(powerup.id)
+        
+        powerup_system.tick(25.0)  # First star expires, second has 5s left
+        assert powerup_system.has_active_powerup_of_type(PowerUpType.STAR) is True
+        
+        powerup_system.tick(5.0)
+        assert powerup_system.has_active_powerup_of_type(PowerUpType.STAR) is False
+    
+    def test_has_active_powerup_of_type_loaded_from_database(self, shared_memory_db):
+        """Active types should be known after reloading from the database."""
+        system1 = PowerUpSystem(shared_memory_db())
+        powerup = system1.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
+        system1.activate_powerup(powerup.id)
+        
+        system2 = PowerUpSystem(shared_memory_db())
+        assert system2.has_active_powerup_of_type(PowerUpType.FIRE_FLOWER) is True
+    
     def test_get_powerup_count(self, powerup_system):
         """Should return correct count of power-ups by type."""
         powerup_system.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
@@ -335,6 +452,21 @@ class TestHelperMethods:
         assert powerup_system.get_powerup_count(PowerUpType.MUSHROOM, Theme.MARIO) == 1
         assert powerup_system.get_powerup_count(PowerUpType.MUSHROOM, Theme.ZELDA) == 0
     
+    def test_reset_clears_inventory_and_active(self, shared_memory_db):
+        """Reset should empty inventory and active power-ups, including in the DB."""
+        system1 = PowerUpSystem(shared_memory_db())
+        powerup = system1.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
+        system1.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
+        system1.activate_powerup(powerup.id)
+        
+        system1.reset()
+        
+        assert system1.get_inventory() == []
+        assert system1.get_active_powerups() == []
+        system2 = PowerUpSystem(shared_memory_db())
+        assert system2.get_inventory() == []
+        assert system2.get_active_powerups() == []
+    
     def test_clear_all_active(self, powerup_system):
         """Should clear all active power-ups."""
         powerup1 = powerup_system.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
@@ -348,18 +480,19 @@ class TestHelperMethods:
         powerup_system.clear_all_active()
         
         assert len(powerup_system.get_active_powerups()) == 0
+        assert powerup_system.has_active_powerup_of_type(PowerUpType.STAR) is False
 
 
 class TestPersistence:
     """Tests for database persistence."""
     
-    def test_inventory_persists_across_instances(self, temp_db):
+    def test_inventory_persists_across_instances(self, shared_memory_db):
         """Inventory should persist across PowerUpSystem instances."""
-        system1 = PowerUpSystem(temp_db)
+        system1 = PowerUpSystem(shared_memory_db())
         system1.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
         system1.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
         
-        system2 = PowerUpSystem(temp_db)
+        system2 = PowerUpSystem(shared_memory_db())
         inventory = system2.get_inventory()
         
         assert len(inventory) == 2
@@ -367,26 +500,26 @@ class TestPersistence:
         assert PowerUpType.MUSHROOM in types
         assert PowerUpType.FIRE_FLOWER in types
     
-    def test_active_powerups_persist_across_instances(self, temp_db):
+    def test_active_powerups_persist_across_instances(self, shared_memory_db):
         """Active power-ups should persist across PowerUpSystem instances."""
-        system1 = PowerUpSystem(temp_db)
+        system1 = PowerUpSystem(shared_memory_db())
         powerup = system1.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
         system1.activate_powerup(powerup.id)
         
-        system2 = PowerUpSystem(temp_db)
+        system2 = PowerUpSystem(shared_memory_db())
         active = system2.get_active_powerups()
         
         assert len(active) == 1
         assert active[0].powerup.type == PowerUpType.FIRE_FLOWER
     
-    def test_quantity_updates_persist(self, temp_db):
+    def test_quantity_updates_persist(self, shared_memory_db):
         """Quantity updates should persist to database."""
-        system1 = PowerUpSystem(temp_db)
+        system1 = PowerUpSystem(shared_memory_db())
         powerup = system1.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
         system1.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)  # quantity = 2
         system1.activate_powerup(powerup.id)  # quantity = 1
         
-        system2 = PowerUpSystem(temp_db)
+        system2 = PowerUpSystem(shared_memory_db())
         inventory = system2.get_inventory()
         
         assert len(inventory) == 1
@@ -419,29 +552,24 @@ class TestEdgeCases:
     def test_grant_powerup_for_all_themes(self, powerup_system):
         """Should be able to grant power-ups for all themes."""
         # Grant one power-up for each theme
-        mario_powerup = powerup_system.grant_powerup(PowerUpType.MUSHROOM, Theme.MARIO)
-        zelda_powerup = powerup_system.grant_powerup(PowerUpType.HEART_CONTAINER, Theme.ZELDA)
-        dkc_powerup = powerup_system.grant_powerup(PowerUpType.BANANA, Theme.DKC)
+        powerup_system.grant_powerups_bulk([
+            (PowerUpType.MUSHROOM, Theme.MARIO),
+            (PowerUpType.HEART_CONTAINER, Theme.ZELDA),
+            (PowerUpType.BANANA, Theme.DKC),
+        ])
         
         inventory = powerup_system.get_inventory()
         assert len(inventory) == 3
         
-        themes = {p.theme for p in inventory}
-        assert Theme.MARIO in themes
-        assert Theme.ZELDA in themes
-        assert Theme.DKC in themes
+        assert {p.theme for p in inventory} == {Theme.MARIO, Theme.ZELDA, Theme.DKC}
     
     def test_multiple_activations_of_same_type(self, powerup_system):
         """Should be able to activate multiple power-ups of the same type."""
         # Grant 3 fire flowers
-        powerup = powerup_system.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
-        powerup_system.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
-        powerup_system.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
+        [powerup] = powerup_system.grant_powerups_bulk([(PowerUpType.FIRE_FLOWER, Theme.MARIO)] * 3)
         
         # Activate all 3
-        powerup_system.activate_powerup(powerup.id)
-        powerup_system.activate_powerup(powerup.id)
-        powerup_system.activate_powerup(powerup.id)
+        assert powerup_system.activate_many(powerup.id, 3) == 3
         
         # Should have 3 active power-ups
         active = powerup_system.get_active_powerups()
@@ -456,32 +584,56 @@ class TestEdgeCases:
         powerup = powerup_system.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
         powerup_system.activate_powerup(powerup.id)
         
-        # Simulate many small ticks
-        for _ in range(100):
-            powerup_system.tick(0.1)
+        powerup_system.tick(0.1)
         
         active = powerup_system.get_active_powerups()
         assert len(active) == 1
+        assert abs(active[0].remaining_seconds - 59.9) < 0.01
+    
+    def test_tick_batch_accumulates_small_deltas(self, powerup_system):
+        """Many small deltas in one batch should add up like separate ticks."""
+        powerup = powerup_system.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
+        powerup_system.activate_powerup(powerup.id)
+        
+        expired = powerup_system.tick_batch([0.1] * 100)
+        
+        assert expired == []
+        active = powerup_system.get_active_powerups()
         # 60 - (100 * 0.1) = 50 seconds remaining
         assert abs(active[0].remaining_seconds - 50.0) < 0.01
     
-    def test_powerup_with_unknown_type_uses_default_metadata(self, powerup_system):
-        """Power-ups with unknown types should use default metadata."""
-        # Use a power-up type that's not in POWERUP_METADATA
+    def test_tick_batch_expires_powerups(self, powerup_system):
+        """A batch whose total exceeds the duration should expire the power-up."""
+        powerup = powerup_system.grant_powerup(PowerUpType.STAR, Theme.MARIO)  # 30 seconds
+        powerup_system.activate_powerup(powerup.id)
+        
+        expired = powerup_system.tick_batch([10.0, 10.0, 10.0])
+        
+        assert [p.type for p in expired] == [PowerUpType.STAR]
+        assert powerup_system.get_active_powerups() == []
+    
+    def test_powerup_without_handwritten_metadata_uses_generic_entry(self, powerup_system):
+        """Power-ups without hand-written metadata should use the generated entry."""
+        # CAPE_FEATHER only has the generic metadata filled in at import
         powerup = powerup_system.grant_powerup(PowerUpType.CAPE_FEATHER, Theme.MARIO)
         
         assert powerup.name == "Cape Feather"
         assert "cape_feather" in powerup.description.lower()
         assert powerup.icon == "cape_feather.png"
     
-    def test_active_powerup_remaining_time_persists(self, temp_db):
+    def test_every_powerup_type_has_metadata(self):
+        """Every power-up type should have metadata, hand-written or generic."""
+        assert set(POWERUP_METADATA) == set(PowerUpType)
+        assert POWERUP_METADATA[PowerUpType.FIRE_FLOWER]["name"] == "Fire Flower"
+    
+    def test_active_powerup_remaining_time_persists(self, shared_memory_db):
         """Remaining time on active power-ups should persist correctly."""
-        system1 = PowerUpSystem(temp_db)
+        system1 = PowerUpSystem(shared_memory_db())
         powerup = system1.grant_powerup(PowerUpType.FIRE_FLOWER, Theme.MARIO)
         system1.activate_powerup(powerup.id)
         system1.tick(25.0)  # 35 seconds remaining
         
-        system2 = PowerUpSystem(temp_db)
+        system2 = PowerUpSystem(shared_memory_db())
         active = system2.get_active_powerups()
         
         assert len(active) == 1
@@ -8,6 +8,7 @@ Requirements: 2.1, 2.2, 2.3, 2.4, 2.5, 3.5
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -27,52 +28,67 @@ from data.models import (
 
 
 @pytest.fixture
-def temp_db_path(tmp_path):
-    """Create a temporary database path."""
-    return tmp_path / "test_progression.db"
+def data_manager(db_template):
+    """Create an in-memory DataManager from the session's initialized template."""
+    dm = DataManager(":memory:")
+    db_template.backup(dm._get_connection())
+    yield dm
+    dm.close()
 
 
-@pytest.fixture
-def data_manager(temp_db_path):
-    """Create a DataManager with initialized database."""
-    dm = DataManager(temp_db_path)
-    dm.initialize_database()
-    return dm
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
-    """Create a default GameConfig."""
+    """Create a default GameConfig, shared read-only by the module."""
     return GameConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scoring_engine(config):
-    """Create a ScoringEngine with default config."""
+    """Create a ScoringEngine with default config; it keeps no state."""
     return ScoringEngine(config)
 
 
+@pytest.fixture(scope="class")
+def mock_data_manager():
+    """Create a DataManager stand-in that loads a fresh state and saves nowhere."""
+    dm = MagicMock(spec=DataManager)
+    dm.load_state.side_effect = lambda: GameState(progression=ProgressionState())
+    return dm
+
+
+@pytest.fixture(scope="class")
+def _class_progression_system(mock_data_manager, scoring_engine, config):
+    """One ProgressionSystem per test class, reset by ``progression_system``."""
+    return ProgressionSystem(mock_data_manager, scoring_engine, config)
+
+
 @pytest.fixture
-def progression_system(data_manager, scoring_engine, config):
-    """Create a ProgressionSystem with dependencies."""
-    return ProgressionSystem(data_manager, scoring_engine, config)
-
-
-def create_review_result(is_correct: bool, card_id: str = "1", deck_id: str = "1") -> ReviewResult:
-    """Helper to create a ReviewResult."""
-    now = datetime.now()
-    return ReviewResult(
-        card_id=card_id,
-        deck_id=deck_id,
-        is_correct=is_correct,
-        ease=3 if is_correct else 1,
-        timestamp=now,
-        interval=1,
-        next_review=now,
-        repetitions=1,
-        lapses=0,
-        quality=3 if is_correct else 1
-    )
+def progression_system(_class_progression_system, mock_data_manager):
+    """Provide a freshly reloaded ProgressionSystem for in-memory state tests.
+    
+    Tests that read state back from the database build their own
+    ProgressionSystem on the real ``data_manager`` fixture.
+    """
+    _class_progression_system.reload()
+    mock_data_manager.reset_mock()
+    return _class_progression_system
+
+
+# Fixed review results shared by every test; ProgressionSystem only reads them
+_REVIEW_TIME = datetime(2024, 1, 1, 12, 0, 0)
+CORRECT_REVIEW = ReviewResult(
+    card_id="1",
+    deck_id="1",
+    is_correct=True,
+    ease=3,
+    timestamp=_REVIEW_TIME,
+    interval=1,
+    next_review=_REVIEW_TIME,
+    repetitions=1,
+    lapses=0,
+    quality=3
+)
+WRONG_REVIEW = replace(CORRECT_REVIEW, is_correct=False, ease=1, quality=1)
 
 
 class TestProgressionSystemInit:
@@ -118,71 +134,57 @@ class TestProcessReview:
     
     def test_process_correct_answer_updates_points(self, progression_system):
         """Test that correct answer adds points. (Req 2.1, 2.2)"""
-        result = create_review_result(is_correct=True)
-        
-        state = progression_system.process_review(result)
+        state = progression_system.process_review(CORRECT_REVIEW)
         
         # Base points is 10 by default
         assert state.total_points >= 10
     
     def test_process_correct_answer_updates_cards_reviewed(self, progression_system):
         """Test that correct answer increments cards reviewed. (Req 2.3)"""
-        result = create_review_result(is_correct=True)
-        
-        state = progression_system.process_review(result)
+        state = progression_system.process_review(CORRECT_REVIEW)
         
         assert state.total_cards_reviewed == 1
     
     def test_process_correct_answer_updates_correct_answers(self, progression_system):
         """Test that correct answer increments correct_answers count."""
-        result = create_review_result(is_correct=True)
-        
-        state = progression_system.process_review(result)
+        state = progression_system.process_review(CORRECT_REVIEW)
         
         assert state.correct_answers == 1
     
     def test_process_correct_answer_increments_streak(self, progression_system):
         """Test that correct answer increments streak."""
-        result = create_review_result(is_correct=True)
-        
-        state = progression_system.process_review(result)
+        state = progression_system.process_review(CORRECT_REVIEW)
         
         assert state.current_streak == 1
         
         # Another correct answer
-        state = progression_system.process_review(result)
+        state = progression_system.process_review(CORRECT_REVIEW)
         assert state.current_streak == 2
     
     def test_process_wrong_answer_resets_streak(self, progression_system):
         """Test that wrong answer resets streak to 0."""
         # Build up a streak
-        correct = create_review_result(is_correct=True)
-        progression_system.process_review(correct)
-        progression_system.process_review(correct)
-        progression_system.process_review(correct)
+        progression_system.process_review(CORRECT_REVIEW)
+        progression_system.process_review(CORRECT_REVIEW)
+        progression_system.process_review(CORRECT_REVIEW)
         
         state = progression_system.get_state()
         assert state.current_streak == 3
         
         # Wrong answer resets streak
-        wrong = create_review_result(is_correct=False)
-        state = progression_system.process_review(wrong)
+        state = progression_system.process_review(WRONG_REVIEW)
         
         assert state.current_streak == 0
     
     def test_process_wrong_answer_updates_cards_reviewed(self, progression_system):
         """Test that wrong answer still increments cards reviewed. (Req 2.3)"""
-        result = create_review_result(is_correct=False)
-        
-        state = progression_system.process_review(result)
+        state = progression_system.process_review(WRONG_REVIEW)
         
         assert state.total_cards_reviewed == 1
     
     def test_process_wrong_answer_does_not_add_points(self, progression_system):
         """Test that wrong answer does not add points."""
-        result = create_review_result(is_correct=False)
-        
-        state = progression_system.process_review(result)
+        state = progression_system.process_review(WRONG_REVIEW)
         
         assert state.total_points == 0
     
@@ -191,43 +193,35 @@ class TestProcessReview:
         # First reset session to get full health
         progression_system.reset_session()
         
-        result = create_review_result(is_correct=False)
-        
-        state = progression_system.process_review(result)
+        state = progression_system.process_review(WRONG_REVIEW)
         
         # Default penalty is 10% (10 points on 0-100 scale)
         assert state.session_health == 90
     
     def test_process_review_updates_session_accuracy(self, progression_system):
         """Test that session accuracy is updated correctly."""
-        correct = create_review_result(is_correct=True)
-        wrong = create_review_result(is_correct=False)
-        
         # 2 correct, 1 wrong = 66.67% accuracy
-        progression_system.process_review(correct)
-        progression_system.process_review(correct)
-        state = progression_system.process_review(wrong)
+        progression_system.process_review(CORRECT_REVIEW)
+        progression_system.process_review(CORRECT_REVIEW)
+        state = progression_system.process_review(WRONG_REVIEW)
         
         assert abs(state.session_accuracy - (2/3)) < 0.01
     
     def test_process_review_updates_best_streak(self, progression_system):
         """Test that best_streak is updated when current streak exceeds it."""
-        correct = create_review_result(is_correct=True)
-        wrong = create_review_result(is_correct=False)
-        
         # Build streak of 3
         for _ in range(3):
-            progression_system.process_review(correct)
+            progression_system.process_review(CORRECT_REVIEW)
         
         state = progression_system.get_state()
         assert state.best_streak == 3
         
         # Break streak
-        progression_system.process_review(wrong)
+        progression_system.process_review(WRONG_REVIEW)
         
         # Build new streak of 2
         for _ in range(2):
-            progression_system.process_review(correct)
+            progression_system.process_review(CORRECT_REVIEW)
         
         state = progression_system.get_state()
         # Best streak should still be 3
@@ -235,7 +229,7 @@ class TestProcessReview:
         
         # Build streak to 4
         for _ in range(3):
-            progression_system.process_review(correct)
+            progression_system.process_review(CORRECT_REVIEW)
         
         state = progression_system.get_state()
         # Best streak should now be 5
@@ -245,8 +239,7 @@ class TestProcessReview:
         """Test that process_review persists state to database."""
         ps = ProgressionSystem(data_manager, scoring_engine, config)
         
-        result = create_review_result(is_correct=True)
-        ps.process_review(result)
+        ps.process_review(CORRECT_REVIEW)
         
         # Create new ProgressionSystem to load from database
         ps2 = ProgressionSystem(data_manager, scoring_engine, config)
@@ -254,55 +247,72 @@ class TestProcessReview:
         
         assert state.total_cards_reviewed == 1
         assert state.correct_answers == 1
+    
+    def test_process_reviews_batch_saves_once(self, progression_system, mock_data_manager):
+        """Test that a batch saves progression once rather than per review."""
+        progression_system.process_reviews_batch([CORRECT_REVIEW] * 5)
+        
+        mock_data_manager.save_progression.assert_called_once_with(progression_system.get_state())
+    
+    def test_process_reviews_batch_persists_state(self, data_manager, scoring_engine, config):
+        """Test that a batch leaves the same persisted state as single reviews."""
+        ps = ProgressionSystem(data_manager, scoring_engine, config)
+        ps.process_reviews_batch([CORRECT_REVIEW, CORRECT_REVIEW, WRONG_REVIEW])
+        
+        state = ProgressionSystem(data_manager, scoring_engine, config).get_state()
+        assert state.total_cards_reviewed == 3
+        assert state.correct_answers == 2
+        assert state.current_streak == 0
 
 
-class TestLevelUnlock:
-    """Tests for level unlock functionality."""
+class TestReload:
+    """Tests for reload method."""
     
-    def test_levels_unlocked_after_50_correct(self, progression_system):
-        """Test that 1 level is unlocked after 50 correct answers. (Req 2.4)"""
-        correct = create_review_result(is_correct=True)
+    def test_reload_discards_unsaved_session(self, data_manager, scoring_engine, config):
+        """Test that reload restores persisted state and starts a new session."""
+        ps = ProgressionSystem(data_manager, scoring_engine, config)
+        saved_points = ps.process_review(CORRECT_REVIEW).total_points
+        ps.get_state().total_points = 999  # in-memory only, never saved
         
-        # Process 50 correct answers
-        for _ in range(50):
-            state = progression_system.process_review(correct)
+        ps.reload()
         
-        assert state.levels_unlocked == 1
+        state = ps.get_state()
+        assert state.correct_answers == 1
+        assert state.total_points == saved_points
+        ps.process_review(WRONG_REVIEW)
+        # New session: 0 correct of 1 reviewed
+        assert ps.get_state().session_accuracy == 0.0
+
+
+class TestLevelUnlock:
+    """Tests for level unlock functionality."""
     
-    def test_levels_unlocked_after_100_correct(self, progression_system):
-        """Test that 2 levels are unlocked after 100 correct answers. (Req 2.4)"""
-        correct = create_review_result(is_correct=True)
+    @pytest.mark.parametrize("correct_count, expected_levels", [(50, 1), (100, 2), (150, 3)])
+    def test_levels_unlocked_after_correct_answers(self, progression_system, correct_count, expected_levels):
+        """Test that one level unlocks per 50 correct answers. (Req 2.4)"""
+        progression_system.process_reviews_batch([CORRECT_REVIEW] * correct_count)
         
-        # Process 100 correct answers
-        for _ in range(100):
-            state = progression_system.process_review(correct)
-        
-        assert state.levels_unlocked == 2
+        assert progression_system.get_state().levels_unlocked == expected_levels
     
     def test_check_level_unlock_returns_level_number(self, progression_system):
         """Test that check_level_unlock returns the level number when unlocked."""
-        correct = create_review_result(is_correct=True)
-        
         # Process 49 correct answers - no unlock yet
-        for _ in range(49):
-            progression_system.process_review(correct)
+        progression_system.process_reviews_batch([CORRECT_REVIEW] * 49)
         
         unlock = progression_system.check_level_unlock()
         assert unlock is None
         
         # 50th correct answer triggers unlock
-        progression_system.process_review(correct)
+        progression_system.process_review(CORRECT_REVIEW)
         unlock = progression_system.check_level_unlock()
         
         assert unlock == 1
     
     def test_check_level_unlock_only_returns_once(self, progression_system):
         """Test that check_level_unlock only returns level once per threshold."""
-        correct = create_review_result(is_correct=True)
-        
         # Process 50 correct answers
         for _ in range(50):
-            progression_system.process_review(correct)
+            progression_system.process_review(CORRECT_REVIEW)
         
         # First check returns level
         unlock = progression_system.check_level_unlock()
@@ -314,13 +324,10 @@ class TestLevelUnlock:
     
     def test_wrong_answers_dont_count_for_levels(self, progression_system):
         """Test that wrong answers don't count toward level unlocks."""
-        correct = create_review_result(is_correct=True)
-        wrong = create_review_result(is_correct=False)
-        
         # Process 25 correct and 25 wrong
         for _ in range(25):
-            progression_system.process_review(correct)
-            progression_system.process_review(wrong)
+            progression_system.process_review(CORRECT_REVIEW)
+            progression_system.process_review(WRONG_REVIEW)
         
         state = progression_system.get_state()
         # Only 25 correct answers, not enough for level unlock
@@ -332,17 +339,15 @@ class TestPowerUpGrant:
     
     def test_powerup_granted_after_100_correct(self, progression_system):
         """Test that a power-up is granted after 100 correct answers. (Req 2.5)"""
-        correct = create_review_result(is_correct=True)
-        
         # Process 99 correct answers - no powerup yet
         for _ in range(99):
-            progression_system.process_review(correct)
+            progression_system.process_review(CORRECT_REVIEW)
         
         powerup = progression_system.check_powerup_grant()
         assert powerup is None
         
         # 100th correct answer triggers powerup
-        progression_system.process_review(correct)
+        progression_system.process_review(CORRECT_REVIEW)
         powerup = progression_system.check_powerup_grant()
         
         assert powerup is not None
@@ -350,14 +355,12 @@ class TestPowerUpGrant:
     
     def test_powerup_is_theme_appropriate(self, progression_system):
         """Test that granted power-up matches current theme."""
-        correct = create_review_result(is_correct=True)
-        
         # Set theme to Zelda
         progression_system.set_current_theme(Theme.ZELDA)
         
         # Process 100 correct answers
         for _ in range(100):
-            progression_system.process_review(correct)
+            progression_system.process_review(CORRECT_REVIEW)
         
         powerup = progression_system.check_powerup_grant()
         
@@ -371,11 +374,9 @@ class TestPowerUpGrant:
     
     def test_check_powerup_grant_only_returns_once(self, progression_system):
         """Test that check_powerup_grant only returns powerup once per threshold."""
-        correct = create_review_result(is_correct=True)
-        
         # Process 100 correct answers
         for _ in range(100):
-            progression_system.process_review(correct)
+            progression_system.process_review(CORRECT_REVIEW)
         
         # First check returns powerup
         powerup = progression_system.check_powerup_grant()
@@ -387,18 +388,22 @@ class TestPowerUpGrant:
     
     def test_multiple_powerups_granted(self, progression_system):
         """Test that multiple power-ups are granted at correct intervals."""
-        correct = create_review_result(is_correct=True)
-        powerups_granted = 0
+        grants = progression_system.process_reviews_batch([CORRECT_REVIEW] * 250)
         
-        # Process 250 correct answers
-        for i in range(250):
-            progression_system.process_review(correct)
-            powerup = progression_system.check_powerup_grant()
-            if powerup is not None:
-                powerups_granted += 1
+        # Should have granted 2 power-ups (at 100 and 200), cycling through the theme's list
+        assert [g.type for g in grants] == [PowerUpType.MUSHROOM, PowerUpType.FIRE_FLOWER]
+        assert progression_system.check_powerup_grant() is None
+    
+    def test_unpolled_thresholds_grant_one_powerup_each(self, progression_system):
+        """Test that crossing thresholds without polling still grants each power-up."""
+        for _ in range(250):
+            progression_system.process_review(CORRECT_REVIEW)
+        
+        total_granted = 0
+        while progression_system.check_powerup_grant() is not None:
+            total_granted += 1
         
-        # Should have granted 2 power-ups (at 100 and 200)
-        assert powerups_granted == 2
+        assert total_granted == 2
 
 
 class TestResetSession:
@@ -409,11 +414,9 @@ class TestResetSession:
         # First reset to get full health
         progression_system.reset_session()
         
-        wrong = create_review_result(is_correct=False)
-        
         # Reduce health with wrong answers
         for _ in range(5):
-            progression_system.process_review(wrong)
+            progression_system.process_review(WRONG_REVIEW)
         
         state = progression_system.get_state()
         assert state.session_health < 100
@@ -426,11 +429,9 @@ class TestResetSession:
     
     def test_reset_session_restores_accuracy(self, progression_system):
         """Test that reset_session restores session accuracy."""
-        wrong = create_review_result(is_correct=False)
-        
         # Reduce accuracy with wrong answers
         for _ in range(5):
-            progression_system.process_review(wrong)
+            progression_system.process_review(WRONG_REVIEW)
         
         state = progression_system.get_state()
         assert state.session_accuracy == 0.0
@@ -443,11 +444,9 @@ class TestResetSession:
     
     def test_reset_session_preserves_total_progress(self, progression_system):
         """Test that reset_session preserves total progress."""
-        correct = create_review_result(is_correct=True)
-        
         # Build up some progress
         for _ in range(10):
-            progression_system.process_review(correct)
+            progression_system.process_review(CORRECT_REVIEW)
         
         state = progression_system.get_state()
         total_points = state.total_points
@@ -467,75 +466,42 @@ class TestResetSession:
 class TestComboMultiplier:
     """Tests for combo multiplier integration."""
     
-    def test_streak_5_applies_multiplier(self, progression_system):
-        """Test that streak of 5+ applies 1.5x multiplier."""
-        correct = create_review_result(is_correct=True)
-        
-        # Build streak to 4 (no multiplier yet)
-        for _ in range(4):
-            progression_system.process_review(correct)
-        
-        state = progression_system.get_state()
-        points_at_4 = state.total_points
-        
-        # 5th correct answer should get 1.5x multiplier
-        progression_system.process_review(correct)
-        
-        state = progression_system.get_state()
-        points_gained = state.total_points - points_at_4
-        
-        # Should be 15 points (10 * 1.5) + accuracy bonus (25% of 15 = 3.75 -> 3)
-        # With 100% accuracy, we get: 15 + 3 = 18 points
-        # Base calculation: 10 * 1.5 = 15, bonus = int(15 * 0.25) = 3, total = 18
-        assert points_gained == 18
-    
-    def test_streak_10_applies_multiplier(self, progression_system):
-        """Test that streak of 10+ applies 2.0x multiplier."""
-        correct = create_review_result(is_correct=True)
-        
-        # Build streak to 9
-        for _ in range(9):
-            progression_system.process_review(correct)
-        
-        state = progression_system.get_state()
-        points_at_9 = state.total_points
-        
-        # 10th correct answer should get 2.0x multiplier
-        progression_system.process_review(correct)
-        
-        state = progression_system.get_state()
-        points_gained = state.total_points - points_at_9
-        
-        # Should be 20 points (10 * 2.0) + accuracy bonus (25% of 20 = 5)
-        # With 100% accuracy, we get: 20 + 5 = 25 points
-        assert points_gained == 25
+    @pytest.mark.parametrize("streak_before, expected_gain", [
+        # 10 * 1.5 = 15, accuracy bonus int(15 * 0.25) = 3
+        (4, 18),
+        # 10 * 2.0 = 20, accuracy bonus int(20 * 0.25) = 5
+        (9, 25),
+    ])
+    def test_streak_applies_multiplier(self, progression_system, streak_before, expected_gain):
+        """Test that streaks of 5+ and 10+ apply 1.5x and 2.0x multipliers."""
+        # Build the streak up to just below the threshold
+        for _ in range(streak_before):
+            progression_system.process_review(CORRECT_REVIEW)
+        
+        points_before = progression_system.get_state().total_points
+        
+        # The next correct answer reaches the threshold
+        progression_system.process_review(CORRECT_REVIEW)
+        
+        points_gained = progression_system.get_state().total_points - points_before
+        assert points_gained == expected_gain
 
 
 class TestHealthReduction:
     """Tests for health reduction on wrong answers."""
     
-    def test_health_reduces_by_10_percent(self, progression_system):
-        """Test that health reduces by 10% per wrong answer."""
-        # First reset session to get full health
-        progression_system.reset_session()
-        
-        wrong = create_review_result(is_correct=False)
-        
-        state = progression_system.process_review(wrong)
-        assert state.session_health == 90
-        
-        state = progression_system.process_review(wrong)
-        assert state.session_health == 80
-    
-    def test_health_does_not_go_below_zero(self, progression_system):
-        """Test that health cannot go below 0."""
+    @pytest.mark.parametrize("wrong_count, expected_health", [
+        (1, 90),
+        (2, 80),
+        # 15 wrong answers would be -50 health without clamping
+        (15, 0),
+    ])
+    def test_health_after_wrong_answers(self, progression_system, wrong_count, expected_health):
+        """Test that health drops 10% per wrong answer and stops at 0."""
         # First reset session to get full health
         progression_system.reset_session()
         
-        wrong = create_review_result(is_correct=False)
-        
-        # 15 wrong answers would be -50 health without clamping
-        for _ in range(15):
-            state = progression_system.process_review(wrong)
+        for _ in range(wrong_count):
+            state = progression_system.process_review(WRONG_REVIEW)
         
-        assert state.session_health >= 0
+        assert state.session_health == expected_health